@@ -8,6 +8,10 @@ app = Celery('vendopage')
 app.config_from_object('django.conf:settings', namespace='CELERY')
 app.autodiscover_tasks()
 
+# Task duration / queue-lag metrics (sellers.metrics)
+from sellers.metrics import connect_celery_signals
+connect_celery_signals()
+
 app.conf.timezone = 'Africa/Lagos'
 app.conf.enable_utc = False
 
@@ -49,6 +53,37 @@ app.conf.beat_schedule = {
         'task': 'sellers.tasks.reset_monthly_volumes',
         'schedule': crontab(minute=0, hour=0, day_of_month='1'),
     },
+
+    # ── Platform KPI snapshot: every 15 minutes ──────────────────────────────
+    # Feeds the admin dashboard/analytics pages and their trend history.
+    'platform-snapshot': {
+        'task': 'sellers.tasks.take_platform_snapshot',
+        'schedule': crontab(minute='*/15'),
+    },
+
+    # ── Sitemaps: rebuild every cached shard hourly ──────────────────────────
+    'rebuild-sitemaps': {
+        'task': 'sellers.tasks.rebuild_sitemaps',
+        'schedule': crontab(minute=20),
+    },
+
+    # ── Seller ledgers: nightly rebuild from orders, 3:30 AM ─────────────────
+    'reconcile-seller-ledgers': {
+        'task': 'sellers.tasks.reconcile_seller_ledgers',
+        'schedule': crontab(hour=3, minute=30),
+    },
+
+    # ── Presence: write queued last_seen timestamps, every minute ────────────
+    'flush-presence': {
+        'task': 'sellers.tasks.flush_presence',
+        'schedule': crontab(),
+    },
+
+    # ── Pending checkouts: drop unpaid ones past their TTL, hourly ───────────
+    'purge-pending-checkouts': {
+        'task': 'sellers.tasks.purge_pending_checkouts',
+        'schedule': crontab(minute=40),
+    },
 }
 
 celery = app
\ No newline at end of file
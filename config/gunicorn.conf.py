@@ -0,0 +1,21 @@
+# config/gunicorn.conf.py
+#
+# Prometheus multiprocess mode: each gunicorn worker writes its samples to
+# PROMETHEUS_MULTIPROC_DIR and /metrics aggregates them. The directory must
+# be empty at startup and a dead worker's live gauges must be dropped.
+import os
+import shutil
+
+_multiproc_dir = os.environ.get('PROMETHEUS_MULTIPROC_DIR')
+
+
+def on_starting(server):
+    if _multiproc_dir:
+        shutil.rmtree(_multiproc_dir, ignore_errors=True)
+        os.makedirs(_multiproc_dir, exist_ok=True)
+
+
+def child_exit(server, worker):
+    if _multiproc_dir:
+        from prometheus_client import multiprocess
+        multiprocess.mark_process_dead(worker.pid)
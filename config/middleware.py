@@ -1,17 +1,83 @@
+from contextlib import asynccontextmanager
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
 from django.http import HttpResponsePermanentRedirect
-from django.utils import timezone
+from whitenoise.middleware import WhiteNoiseMiddleware as BaseWhiteNoiseMiddleware
+
 
 # config/middleware.py
-class RedirectToWWWMiddleware:
+class SyncAndAsyncMiddleware:
     """
-    Redirect vendopage.com to www.vendopage.com
-    Makes www.vendopage.com the primary domain
+    Base for the middleware below: native in both stacks, so under ASGI
+    (uvicorn, see Procfile) requests for async views stay on the event loop
+    instead of being parked on a thread by a sync-only layer. Subclasses
+    implement __call__ for WSGI and __acall__ for ASGI.
     """
-    
+    sync_capable  = True
+    async_capable = True
+
     def __init__(self, get_response):
         self.get_response = get_response
-    
+        self.async_mode   = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+
+@asynccontextmanager
+async def execute_wrapper_async(wrapper):
+    """
+    connection.execute_wrapper for an ASGI request. Connections are per
+    thread, and the request's ORM work runs on its thread-sensitive
+    sync_to_async thread rather than the loop, so install the wrapper there.
+    """
+    from django.db import connection
+
+    def install():
+        connection.execute_wrappers.append(wrapper)
+
+    def remove():
+        connection.execute_wrappers.remove(wrapper)
+
+    await sync_to_async(install)()
+    try:
+        yield
+    finally:
+        await sync_to_async(remove)()
+
+
+class WhiteNoiseMiddleware(BaseWhiteNoiseMiddleware):
+    """WhiteNoise is sync-only; the static-file lookup is a dict hit, so serve it from the loop."""
+    sync_capable  = True
+    async_capable = True
+
+    def __init__(self, get_response=None, *args, **kwargs):
+        super().__init__(get_response, *args, **kwargs)
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
     def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        return super().__call__(request)
+
+    async def __acall__(self, request):
+        if self.autorefresh:
+            static_file = await sync_to_async(self.find_file)(request.path_info)
+        else:
+            static_file = self.files.get(request.path_info)
+        if static_file is not None:
+            return self.serve(static_file, request)
+        return await self.get_response(request)
+
+
+class RedirectToWWWMiddleware(SyncAndAsyncMiddleware):
+    """
+    Redirect vendopage.com to www.vendopage.com
+    Makes www.vendopage.com the primary domain
+    """
+
+    def _redirect(self, request):
         host = request.get_host().lower()
         
         # Only redirect in production
@@ -23,27 +89,153 @@ class RedirectToWWWMiddleware:
                 1
             )
             return HttpResponsePermanentRedirect(new_url)
-        
-        return self.get_response(request)
-    
-class LastSeenMiddleware:
+        return None
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        return self._redirect(request) or self.get_response(request)
+
+    async def __acall__(self, request):
+        return self._redirect(request) or await self.get_response(request)
+
+
+class LastSeenMiddleware(SyncAndAsyncMiddleware):
     """
-    Updates seller.last_seen on every authenticated request.
-    Throttled to once every 5 minutes to avoid a DB write on every click.
+    Records seller activity for last_seen.
+    Throttling and batching live in sellers.presence — with a shared cache
+    this never writes to the sellers table; the flush-presence task does.
     """
-    def __init__(self, get_response):
-        self.get_response = get_response
 
     def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
         response = self.get_response(request)
 
         if request.user.is_authenticated:
-            now = timezone.now()
-            last = getattr(request.user, 'last_seen', None)
+            from sellers import presence
+            presence.touch(request.user.pk)
+
+        return response
+
+    async def __acall__(self, request):
+        response = await self.get_response(request)
+
+        user = await request.auser()
+        if user.is_authenticated:
+            from sellers import presence
+            await sync_to_async(presence.touch)(user.pk)
+
+        return response
+
+
+class MetricsMiddleware(SyncAndAsyncMiddleware):
+    """
+    Prometheus request metrics (sellers.metrics): latency by URL name plus the
+    number of SQL queries and time spent in SQL, counted through
+    connection.execute_wrapper. Goes first in MIDDLEWARE so the latency
+    covers every other middleware.
+    """
+
+    @staticmethod
+    def _counter():
+        import time
+
+        stats = {'queries': 0, 'sql_seconds': 0.0}
+
+        def count_sql(execute, sql, params, many, context):
+            started = time.perf_counter()
+            try:
+                return execute(sql, params, many, context)
+            finally:
+                stats['queries']     += 1
+                stats['sql_seconds'] += time.perf_counter() - started
+        return stats, count_sql
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        import time
+        from django.db import connection
+        from sellers.metrics import observe_request
+
+        stats, count_sql = self._counter()
+        started = time.perf_counter()
+        with connection.execute_wrapper(count_sql):
+            response = self.get_response(request)
+        observe_request(request, response, time.perf_counter() - started, stats['queries'], stats['sql_seconds'])
+        return response
+
+    async def __acall__(self, request):
+        import time
+        from sellers.metrics import observe_request
+
+        stats, count_sql = self._counter()
+        started = time.perf_counter()
+        async with execute_wrapper_async(count_sql):
+            response = await self.get_response(request)
+        observe_request(request, response, time.perf_counter() - started, stats['queries'], stats['sql_seconds'])
+        return response
+
+
+class SqlTraceMiddleware(SyncAndAsyncMiddleware):
+    """
+    Traces a sample of requests (SQL_TRACE_SAMPLE_RATE) with sellers.sqltrace
+    and logs the slow / N+1 ones as JSON lines. Staff can force a trace on any
+    page with ?_sqltrace=1. Sits after AuthenticationMiddleware for that check.
+    """
+
+    @staticmethod
+    def _sampled(forced):
+        import random
+        from django.conf import settings
+
+        rate = settings.SQL_TRACE_SAMPLE_RATE
+        return forced or (rate > 0 and random.random() < rate)
+
+    @staticmethod
+    def _report(request, response, collector, started, forced):
+        import time
+        from sellers import sqltrace
+        from sellers.metrics import view_label
+
+        collector.label = view_label(request)
+        report = collector.report(
+            (time.perf_counter() - started) * 1000,
+            path=request.path, method=request.method, status=response.status_code, forced=forced,
+        )
+        if report is not None:
+            sqltrace.emit(report)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        forced = '_sqltrace' in request.GET and request.user.is_staff
+        if not self._sampled(forced):
+            return self.get_response(request)
+
+        import time
+        from django.db import connection
+        from sellers import sqltrace
+
+        collector = sqltrace.SqlTrace(request.path)
+        started   = time.perf_counter()
+        with connection.execute_wrapper(collector):
+            response = self.get_response(request)
+        self._report(request, response, collector, started, forced)
+        return response
+
+    async def __acall__(self, request):
+        forced = '_sqltrace' in request.GET and (await request.auser()).is_staff
+        if not self._sampled(forced):
+            return await self.get_response(request)
 
-            if last is None or (now - last).total_seconds() > 300:
-                from sellers.models import Seller
-                Seller.objects.filter(pk=request.user.pk).update(last_seen=now)
-                request.user.last_seen = now
+        import time
+        from sellers import sqltrace
 
-        return response
\ No newline at end of file
+        collector = sqltrace.SqlTrace(request.path)
+        started   = time.perf_counter()
+        async with execute_wrapper_async(collector):
+            response = await self.get_response(request)
+        self._report(request, response, collector, started, forced)
+        return response
@@ -6,7 +6,6 @@ from pathlib import Path
 from decouple import config, Csv
 import dj_database_url
 import os
-import cloudinary
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -40,14 +39,16 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'config.middleware.MetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
-    'whitenoise.middleware.WhiteNoiseMiddleware',
+    'config.middleware.WhiteNoiseMiddleware',           # async-capable subclass
     'django.contrib.sessions.middleware.SessionMiddleware',
     'config.middleware.RedirectToWWWMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'config.middleware.LastSeenMiddleware',          # ← ADD THIS LINE
+    'config.middleware.SqlTraceMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -78,7 +79,9 @@ if config('DATABASE_URL', default=None):
     DATABASES = {
         'default': dj_database_url.config(
             default=config('DATABASE_URL'),
-            conn_max_age=600,
+            # 0 under ASGI (see Procfile): connections there are per request
+            # context, so persistent ones would pile up instead of being reused
+            conn_max_age=config('DB_CONN_MAX_AGE', default=600, cast=int),
             conn_health_checks=True,
         )
     }
@@ -90,6 +93,34 @@ else:
         }
     }
 
+# Cache
+# Redis when REDIS_URL is set (shared by every gunicorn worker and Celery);
+# otherwise per-process locmem, which is fine for local dev and tests.
+# Sessions get their own alias so flushing the page cache never logs anyone out.
+REDIS_URL = config('REDIS_URL', default='')
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND':    'django.core.cache.backends.redis.RedisCache',
+            'LOCATION':   REDIS_URL,
+            'KEY_PREFIX': 'vp',
+            'TIMEOUT':    60 * 5,
+        },
+        'sessions': {
+            'BACKEND':    'django.core.cache.backends.redis.RedisCache',
+            'LOCATION':   config('REDIS_SESSIONS_URL', default=REDIS_URL),
+            'KEY_PREFIX': 'vp-session',
+            'TIMEOUT':    60 * 60 * 24 * 14,
+        },
+    }
+    SESSION_ENGINE      = 'django.contrib.sessions.backends.cached_db'
+    SESSION_CACHE_ALIAS = 'sessions'
+else:
+    CACHES = {
+        'default':  {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'vendopage-default'},
+        'sessions': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'vendopage-sessions'},
+    }
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -142,6 +173,8 @@ FLUTTERWAVE_PUBLIC_KEY = config('FLUTTERWAVE_PUBLIC_KEY', default='')
 FLUTTERWAVE_SECRET_KEY = config('FLUTTERWAVE_SECRET_KEY', default='')
 FLW_ENCRYPTION_KEY = config('FLW_ENCRYPTION_KEY', default='')
 FLW_SECRET_HASH = config('FLW_SECRET_HASH', default='')
+# Point at the local stand-in (sellers/loadtest) for load tests — never in production
+FLUTTERWAVE_BASE_URL = config('FLUTTERWAVE_BASE_URL', default='https://api.flutterwave.com/v3')
 
 TEMPLATES[0]['OPTIONS']['context_processors'] += [
     'sellers.context_processors.admin_badge_counts',
@@ -153,12 +186,6 @@ CLOUDINARY_STORAGE = {
     'API_SECRET': config('CLOUDINARY_API_SECRET'),
 }
 
-cloudinary.config(
-    cloud_name = config('CLOUDINARY_CLOUD_NAME'),
-    api_key    = config('CLOUDINARY_API_KEY'),
-    api_secret = config('CLOUDINARY_API_SECRET'),
-    secure     = True
-)
 DEFAULT_FILE_STORAGE = 'cloudinary_storage.storage.MediaCloudinaryStorage'
 CLOUDINARY_UPLOAD_PRESET = 'vendopage_unsigned'
 
@@ -173,6 +200,39 @@ EMAIL_HOST_USER = config('EMAIL_HOST_USER', default='')
 EMAIL_HOST_PASSWORD = config('EMAIL_HOST_PASSWORD', default='')
 DEFAULT_FROM_EMAIL = config('DEFAULT_FROM_EMAIL', default='noreply@vendopage.com')
 BREVO_API_KEY = config('BREVO_API_KEY', default='')
+BREVO_API_HOST = config('BREVO_API_HOST', default='')    # blank = the SDK's default host
+
+# Unpaid checkouts (sellers.PendingCheckout) older than this are purged —
+# long enough for Flutterwave's delayed webhooks and retries
+PENDING_CHECKOUT_TTL_HOURS = config('PENDING_CHECKOUT_TTL_HOURS', default=72, cast=int)
+
+# HTTP caching of the public pages (sellers/http_cache.py). RELEASE_VERSION
+# is hashed into every ETag, so set it per deploy (e.g. the git sha) to move
+# them when templates change; it must be the same in every process. Blank =
+# a constant, and a template-only deploy shows once the validator TTL expires
+RELEASE_VERSION           = config('RELEASE_VERSION', default='')
+HTTP_CACHE_MAX_AGE        = config('HTTP_CACHE_MAX_AGE', default=60, cast=int)         # browsers
+HTTP_CACHE_S_MAXAGE       = config('HTTP_CACHE_S_MAXAGE', default=300, cast=int)       # shared / CDN caches
+HTTP_CACHE_VALIDATOR_TTL  = config('HTTP_CACHE_VALIDATOR_TTL', default=60 * 15, cast=int)
+# Surrogate-Key purge endpoint (e.g. https://api.fastly.com/service/<id>/purge); blank = no purges
+CDN_PURGE_URL             = config('CDN_PURGE_URL', default='')
+CDN_PURGE_TOKEN           = config('CDN_PURGE_TOKEN', default='')
+CDN_PURGE_AUTH_HEADER     = config('CDN_PURGE_AUTH_HEADER', default='Fastly-Key')
+
+# Prometheus scrape token for /metrics (sent as "Authorization: Bearer <token>")
+METRICS_TOKEN = config('METRICS_TOKEN', default='')
+# Port the Celery worker serves its own task metrics on (sellers/metrics.py); 0 = off
+CELERY_METRICS_PORT = config('CELERY_METRICS_PORT', default=0, cast=int)
+
+# Sampled SQL traces (sellers/sqltrace.py) — JSON lines on the sql_trace logger
+SQL_TRACE_SAMPLE_RATE      = config('SQL_TRACE_SAMPLE_RATE', default=0.0, cast=float)
+SQL_TRACE_SLOW_MS          = config('SQL_TRACE_SLOW_MS', default=1000, cast=int)
+SQL_TRACE_SLOW_QUERY_MS    = config('SQL_TRACE_SLOW_QUERY_MS', default=100, cast=int)
+SQL_TRACE_REPEAT_THRESHOLD = config('SQL_TRACE_REPEAT_THRESHOLD', default=10, cast=int)
+SQL_TRACE_LOG_FILE         = config('SQL_TRACE_LOG_FILE', default='')
+
+# Canonical public origin — used where URLs are built outside a request (sitemaps)
+SITE_URL = config('SITE_URL', default='https://www.vendopage.com')
 
 # Authentication URLs
 LOGIN_URL = 'login'
@@ -187,12 +247,21 @@ LOGGING = {
             'format': '[{levelname}] {asctime} {module} — {message}',
             'style': '{',
         },
+        'json_line': {
+            'format': '{message}',
+            'style': '{',
+        },
     },
     'handlers': {
         'console': {
             'class':     'logging.StreamHandler',
             'formatter': 'verbose',
         },
+        'sql_trace': {
+            'class':     'logging.FileHandler' if SQL_TRACE_LOG_FILE else 'logging.StreamHandler',
+            'formatter': 'json_line',
+            **({'filename': SQL_TRACE_LOG_FILE} if SQL_TRACE_LOG_FILE else {}),
+        },
     },
     'root': {
         'handlers': ['console'],
@@ -204,5 +273,10 @@ LOGGING = {
             'level':    'DEBUG',
             'propagate': False,
         },
+        'sql_trace': {
+            'handlers': ['sql_trace'],
+            'level':    'INFO',
+            'propagate': False,
+        },
     },
 }
@@ -13,17 +13,15 @@ admin.site.login_template = 'admin/custom_login.html'
 admin.site.site_header = 'VendoPage Admin'
 admin.site.site_title = 'VendoPage'
 admin.site.index_title = 'Welcome to VendoPage Dashboard'
-from django.contrib.sitemaps.views import sitemap
-from sellers.sitemaps import SellerSitemap, StaticSitemap, SellerSitemap
-
-sitemaps = {
-    "static": StaticSitemap,
-    "sellers": SellerSitemap,
-}
+from sellers.views import public as public_views
+from sellers.metrics import metrics_view
+from sellers.http_cache import public_page
 
 urlpatterns = [
-    path("robots.txt",TemplateView.as_view(template_name="robots.txt",content_type="text/plain"),),
-    path("sitemap.xml",sitemap,{"sitemaps": sitemaps},name="django.contrib.sitemaps.views.sitemap",),
+    path("robots.txt",public_page(['pages'])(TemplateView.as_view(template_name="robots.txt",content_type="text/plain")),),
+    path("metrics", metrics_view, name="metrics"),
+    path("sitemap.xml", public_views.sitemap_index, name="sitemap_index"),
+    path("sitemap-<slug:section>-<int:page>.xml", public_views.sitemap_section, name="sitemap_section"),
     # This must come BEFORE path('admin/', ...) to intercept /admin/
     path('admin/', staff_member_required(
         RedirectView.as_view(pattern_name='admin_dashboard', permanent=False)
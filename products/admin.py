@@ -107,6 +107,8 @@
 
 from django.contrib import admin
 from django.utils.html import format_html
+from django.db.models import Count
+from sellers import http_cache
 from .models import Product, ProductImage
 
 
@@ -171,10 +173,17 @@ class ProductAdmin(admin.ModelAdmin):
 
     readonly_fields = ['created_at', 'views', 'whatsapp_clicks']
 
+    def get_queryset(self, request):
+        # Images are prefetched for the thumbnail and counted for the sortable column
+        return super().get_queryset(request).annotate(
+            _image_count=Count('images'),
+        ).prefetch_related('images')
+
     # ── Display columns ───────────────────────────────────────
 
     def thumbnail(self, obj):
-        img = obj.images.order_by('order').first()
+        images = obj.images.all()          # prefetched, in Meta ordering ('order', 'created_at')
+        img    = images[0] if images else None
         if img and img.image_url:
             return format_html(
                 '<img src="{}" style="height:48px;width:48px;object-fit:cover;'
@@ -197,6 +206,7 @@ class ProductAdmin(admin.ModelAdmin):
             return format_html('<a href="{}">{}</a>', url, obj.seller.business_name)
         return '— guest —'
     seller_link.short_description = 'Seller'
+    seller_link.admin_order_field = 'seller__business_name'
 
     def price_display(self, obj):
         if obj.price:
@@ -223,31 +233,40 @@ class ProductAdmin(admin.ModelAdmin):
     status_badge.short_description = 'Status'
 
     def image_count(self, obj):
-        count = obj.images.count()
+        count = obj._image_count
         return f'📷 {count} photo{"s" if count != 1 else ""}'
     image_count.short_description = 'Images'
+    image_count.admin_order_field = '_image_count'
 
     # ── Bulk actions ──────────────────────────────────────────
 
     actions = ['mark_sold_out', 'mark_available', 'archive_products', 'unarchive_products']
 
     def mark_sold_out(self, request, queryset):
+        seller_ids = set(queryset.values_list('seller_id', flat=True))
         count = queryset.update(is_sold_out=True)
+        http_cache.touch_sellers(seller_ids)
         self.message_user(request, f"🔴 {count} product(s) marked as sold out")
     mark_sold_out.short_description = "Mark as Sold Out"
 
     def mark_available(self, request, queryset):
+        seller_ids = set(queryset.values_list('seller_id', flat=True))
         count = queryset.update(is_sold_out=False)
+        http_cache.touch_sellers(seller_ids)
         self.message_user(request, f"🟢 {count} product(s) marked as available")
     mark_available.short_description = "Mark as Available"
 
     def archive_products(self, request, queryset):
+        seller_ids = set(queryset.values_list('seller_id', flat=True))
         count = queryset.update(is_archived=True)
+        http_cache.touch_sellers(seller_ids)
         self.message_user(request, f"📦 {count} product(s) archived")
     archive_products.short_description = "Archive selected products"
 
     def unarchive_products(self, request, queryset):
+        seller_ids = set(queryset.values_list('seller_id', flat=True))
         count = queryset.update(is_archived=False, is_sold_out=False)
+        http_cache.touch_sellers(seller_ids)
         self.message_user(request, f"✅ {count} product(s) restored")
     unarchive_products.short_description = "Restore (unarchive) products"
 
@@ -262,6 +281,7 @@ class ProductImageAdmin(admin.ModelAdmin):
     search_fields = ['product__seller__business_name', 'product__description']
     readonly_fields = ['created_at', 'image_preview']
     ordering      = ['product', 'order']
+    list_select_related = ['product__seller']
 
     def image_preview(self, obj):
         # Uses image_url (URLField) — correct field name from models.py
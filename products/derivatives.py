@@ -0,0 +1,65 @@
+# products/derivatives.py
+"""
+Server-side image derivatives for the public store page.
+
+Product images live on Cloudinary, so a resized / watermarked variant is
+just a transformation URL: Cloudinary renders it on first request and its
+CDN caches it from then on. derivative_urls() builds the card thumbnail and
+the lightbox display URL once per ProductImage (stored on the row), with the
+seller's business name burnt in as a text overlay when watermarking is on.
+The browser no longer downloads originals or draws onto a <canvas>.
+
+The stored URLs depend on the seller's name and watermark setting, so
+refresh_for_seller() rebuilds them when either changes. Non-Cloudinary URLs
+are passed through unchanged.
+"""
+from urllib.parse import quote
+
+THUMB_WIDTH   = 600
+DISPLAY_WIDTH = 900
+
+WATERMARK_FONT    = 'Arial_60_bold'
+WATERMARK_OPACITY = 18             # percent — matches the old canvas globalAlpha .18
+WATERMARK_ANGLE   = -25
+WATERMARK_ROWS    = (-0.38, 0, 0.38)   # vertical offsets relative to image height
+
+
+def _overlay_text(text):
+    # Cloudinary wants commas and slashes double-escaped inside l_text
+    return quote(text, safe='').replace('%2C', '%252C').replace('%2F', '%252F')
+
+
+def cloudinary_variant(url, width, watermark_text=None):
+    """`url` resized to `width` (auto format/quality), optionally with the text watermark."""
+    if not url or '/upload/' not in url:
+        return url
+    steps = [f'f_auto,q_auto,w_{width},c_limit']
+    if watermark_text:
+        text = _overlay_text(watermark_text)
+        for y in WATERMARK_ROWS:
+            steps.append(
+                f'l_text:{WATERMARK_FONT}:{text},co_white,o_{WATERMARK_OPACITY}'
+                f'/c_scale,fl_relative,w_0.8/a_{WATERMARK_ANGLE}'
+                f'/fl_layer_apply,g_center,y_{y}'
+            )
+    return url.replace('/upload/', '/upload/' + '/'.join(steps) + '/', 1)
+
+
+def derivative_urls(image_url, seller):
+    """{'thumb_url': ..., 'display_url': ...} for one image of `seller`."""
+    text = seller.business_name if seller is not None and seller.watermark_enabled else None
+    return {
+        'thumb_url':   cloudinary_variant(image_url, THUMB_WIDTH, text),
+        'display_url': cloudinary_variant(image_url, DISPLAY_WIDTH, text),
+    }
+
+
+def refresh_for_seller(seller, batch_size=500):
+    """Rebuild the stored derivative URLs for every image of `seller`. Returns the count."""
+    from products.models import ProductImage
+    images = list(ProductImage.objects.filter(product__seller=seller).only('id', 'image_url'))
+    for image in images:
+        for field, url in derivative_urls(image.image_url, seller).items():
+            setattr(image, field, url)
+    ProductImage.objects.bulk_update(images, ['thumb_url', 'display_url'], batch_size=batch_size)
+    return len(images)
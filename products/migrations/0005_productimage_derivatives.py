@@ -0,0 +1,23 @@
+# Generated by Django 5.2.2 on 2026-10-19 15:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0004_keyset_pagination_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='productimage',
+            name='display_url',
+            field=models.URLField(blank=True, default='', max_length=1000),
+        ),
+        migrations.AddField(
+            model_name='productimage',
+            name='thumb_url',
+            field=models.URLField(blank=True, default='', max_length=1000),
+        ),
+    ]
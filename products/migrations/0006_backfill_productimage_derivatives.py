@@ -0,0 +1,32 @@
+# Generated by Django 5.2.2 on 2026-10-19 18:05
+
+from django.db import migrations
+
+
+def backfill_derivatives(apps, schema_editor):
+    """Stored (watermarked) derivative URLs for every existing image, seller by seller."""
+    from products.derivatives import derivative_urls
+    Seller       = apps.get_model('sellers', 'Seller')
+    ProductImage = apps.get_model('products', 'ProductImage')
+    sellers = (
+        Seller.objects.filter(products__images__thumb_url='').distinct()
+        .only('id', 'business_name', 'watermark_enabled').order_by('id')
+    )
+    for seller in sellers.iterator():
+        images = list(ProductImage.objects.filter(product__seller=seller).only('id', 'image_url'))
+        for image in images:
+            for field, url in derivative_urls(image.image_url, seller).items():
+                setattr(image, field, url)
+        ProductImage.objects.bulk_update(images, ['thumb_url', 'display_url'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0005_productimage_derivatives'),
+        ('sellers', '0014_campaigncheckpoint_failed_ids'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_derivatives, migrations.RunPython.noop),
+    ]
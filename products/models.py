@@ -24,6 +24,7 @@ class Product(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes  = [models.Index(fields=['created_at', 'id'], name='product_created_id_idx')]
 
     # ── Helpers ──────────────────────────────────────────────────────────────
 
@@ -68,9 +69,33 @@ class ProductImage(models.Model):
     image_url = models.URLField(max_length=500)
     order     = models.IntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
+    # ── Server-rendered derivatives (see products/derivatives.py) ───────────
+    thumb_url   = models.URLField(max_length=1000, blank=True, default='')
+    display_url = models.URLField(max_length=1000, blank=True, default='')
 
     class Meta:
         ordering = ['order', 'created_at']
 
     def __str__(self):
-        return f"Image {self.order} for {self.product}"
\ No newline at end of file
+        return f"Image {self.order} for {self.product}"
+
+    def save(self, *args, **kwargs):
+        if not self.thumb_url or not self.display_url:
+            from products.derivatives import derivative_urls
+            for field, url in derivative_urls(self.image_url, self.product.seller).items():
+                setattr(self, field, url)
+            if kwargs.get('update_fields') is not None:
+                kwargs['update_fields'] = {*kwargs['update_fields'], 'thumb_url', 'display_url'}
+        super().save(*args, **kwargs)
+
+    @property
+    def thumb(self):
+        """Card-sized, watermarked URL; built on the fly if the row has none stored."""
+        from products.derivatives import derivative_urls
+        return self.thumb_url or derivative_urls(self.image_url, self.product.seller)['thumb_url']
+
+    @property
+    def display(self):
+        """Lightbox-sized, watermarked URL; built on the fly if the row has none stored."""
+        from products.derivatives import derivative_urls
+        return self.display_url or derivative_urls(self.image_url, self.product.seller)['display_url']
\ No newline at end of file
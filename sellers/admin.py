@@ -1,18 +1,20 @@
 # sellers/admin.py
 # ─────────────────────────────────────────────────────────────────────────────
-# Registers: Seller, PlatformSettings, VendorBankAccount, Order, Dispute, Review
+# Registers: Seller, PlatformSettings, VendorBankAccount, Order, Dispute, Review,
+#            PendingCheckout
 #
 # NOTE: Product and ProductImage are intentionally NOT registered here.
 #       They are owned exclusively by products/admin.py.
 #       Registering them in both files causes a duplicate registration crash.
 # ─────────────────────────────────────────────────────────────────────────────
 
-from django.contrib import admin
+from django.contrib import admin, messages
 from django.contrib.auth.admin import UserAdmin
 from django.utils.html import format_html
 from django.utils import timezone
 from django.urls import reverse
-from django.db.models import Sum, Count
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
 from datetime import timedelta
 from decimal import Decimal
 
@@ -22,9 +24,12 @@ from .models import (
     VendorBankAccount,
     Order,
     OrderItem,
+    PendingCheckout,
     Dispute,
     Review,
 )
+from . import http_cache, slugs
+from .order_states import InvalidTransition, OrderStateMachine
 
 
 # ─────────────────────────────────────────────────────────────
@@ -140,6 +145,37 @@ class SellerAdmin(UserAdmin):
         }),
     )
 
+    # ── Changelist annotations ────────────────────────────────
+    # One correlated subquery per column instead of a query per row per
+    # column; the annotations also make the columns sortable.
+
+    ORDER_STATUSES   = ['paid', 'shipped', 'delivered', 'completed', 'disputed']
+    REVENUE_STATUSES = ['delivered', 'completed']
+
+    def get_queryset(self, request):
+        from products.models import Product
+
+        def scalar(queryset, aggregate):
+            return Subquery(
+                queryset.filter(seller=OuterRef('pk')).order_by().values('seller')
+                .annotate(value=aggregate).values('value')[:1]
+            )
+
+        return super().get_queryset(request).annotate(
+            _product_count=Coalesce(
+                scalar(Product.objects.filter(is_archived=False), Count('id')), 0,
+                output_field=IntegerField(),
+            ),
+            _order_count=Coalesce(
+                scalar(Order.objects.filter(status__in=self.ORDER_STATUSES), Count('id')), 0,
+                output_field=IntegerField(),
+            ),
+            _revenue_paid=scalar(
+                Order.objects.filter(status__in=self.REVENUE_STATUSES, payout_triggered=True),
+                Sum('vendor_payout'),
+            ),
+        )
+
     # ── Computed columns ──────────────────────────────────────
 
     def subscription_badge(self, obj):
@@ -174,34 +210,30 @@ class SellerAdmin(UserAdmin):
     store_link.short_description = 'Public Store URL'
 
     def product_count(self, obj):
-        return obj.products.filter(is_archived=False).count()
+        return obj._product_count
     product_count.short_description = 'Products'
+    product_count.admin_order_field = '_product_count'
 
     def total_orders(self, obj):
-        count = Order.objects.filter(
-            seller=obj,
-            status__in=['paid', 'shipped', 'delivered', 'completed', 'disputed']
-        ).count()
+        count = obj._order_count
         if count:
             url = reverse('admin:sellers_order_changelist') + f'?seller__id__exact={obj.id}'
             return format_html('<a href="{}">{}</a>', url, count)
         return 0
     total_orders.short_description = 'Orders'
+    total_orders.admin_order_field = '_order_count'
 
     def total_revenue(self, obj):
-        total = Order.objects.filter(
-            seller=obj,
-            status__in=['delivered', 'completed'],
-            payout_triggered=True,
-        ).aggregate(t=Sum('vendor_payout'))['t'] or Decimal('0')
+        total = obj._revenue_paid or Decimal('0')
         if total:
             sym = obj.currency_symbol or '₦'
             return format_html(
-                '<strong style="color:#059669;">{}{:,.0f}</strong>',
-                sym, total
+                '<strong style="color:#059669;">{}{}</strong>',
+                sym, f'{total:,.0f}'
             )
         return '—'
     total_revenue.short_description = 'Revenue Paid Out'
+    total_revenue.admin_order_field = '_revenue_paid'
 
     # ── Bulk actions ──────────────────────────────────────────
 
@@ -214,35 +246,47 @@ class SellerAdmin(UserAdmin):
     ]
 
     def make_premium(self, request, queryset):
+        seller_ids = list(queryset.values_list('pk', flat=True))
         updated = queryset.update(
             subscription_type='premium',
             subscription_expires=timezone.now() + timedelta(days=30)
         )
+        http_cache.touch_sellers(seller_ids)
         self.message_user(request, f"✅ {updated} seller(s) upgraded to Premium (30 days)")
     make_premium.short_description = "Upgrade to Premium (30 days)"
 
     def make_free(self, request, queryset):
+        seller_ids = list(queryset.values_list('pk', flat=True))
         updated = queryset.update(subscription_type='free', subscription_expires=None)
+        http_cache.touch_sellers(seller_ids)
         self.message_user(request, f"⬇️ {updated} seller(s) downgraded to Free")
     make_free.short_description = "Downgrade to Free"
 
     def feature_seller(self, request, queryset):
+        seller_ids = list(queryset.values_list('pk', flat=True))
         updated = queryset.update(is_featured=True)
+        http_cache.touch_sellers(seller_ids)
         self.message_user(request, f"⭐ {updated} seller(s) featured on homepage")
     feature_seller.short_description = "Feature on homepage"
 
     def unfeature_seller(self, request, queryset):
+        seller_ids = list(queryset.values_list('pk', flat=True))
         updated = queryset.update(is_featured=False)
+        http_cache.touch_sellers(seller_ids)
         self.message_user(request, f"🗑️ {updated} seller(s) removed from featured")
     unfeature_seller.short_description = "Remove from featured"
 
     def enable_store_mode(self, request, queryset):
+        seller_ids = list(queryset.values_list('pk', flat=True))
         updated = queryset.update(store_mode=True, store_mode_enabled_at=timezone.now())
+        http_cache.touch_sellers(seller_ids)
         self.message_user(request, f"🔓 Store Mode enabled for {updated} seller(s)")
     enable_store_mode.short_description = "Enable Store Mode"
 
     def disable_store_mode(self, request, queryset):
+        seller_ids = list(queryset.values_list('pk', flat=True))
         updated = queryset.update(store_mode=False)
+        http_cache.touch_sellers(seller_ids)
         self.message_user(request, f"🔒 Store Mode disabled for {updated} seller(s)")
     disable_store_mode.short_description = "Disable Store Mode"
 
@@ -256,12 +300,18 @@ class SellerAdmin(UserAdmin):
     reset_weekly_analytics.short_description = "Reset weekly analytics"
 
     def deactivate_sellers(self, request, queryset):
+        seller_ids = list(queryset.values_list('pk', flat=True))
         updated = queryset.update(is_active=False)
+        http_cache.touch_sellers(seller_ids)
+        slugs.invalidate(*queryset.values_list('slug', flat=True))
         self.message_user(request, f"🚫 {updated} seller(s) deactivated")
     deactivate_sellers.short_description = "Deactivate sellers (ban)"
 
     def activate_sellers(self, request, queryset):
+        seller_ids = list(queryset.values_list('pk', flat=True))
         updated = queryset.update(is_active=True)
+        http_cache.touch_sellers(seller_ids)
+        slugs.invalidate(*queryset.values_list('slug', flat=True))
         self.message_user(request, f"✅ {updated} seller(s) activated")
     activate_sellers.short_description = "Activate sellers"
 
@@ -337,24 +387,28 @@ class OrderAdmin(admin.ModelAdmin):
         url = reverse('admin:sellers_seller_change', args=[obj.seller.id])
         return format_html('<a href="{}">{}</a>', url, obj.seller.business_name)
     seller_link.short_description = 'Seller'
+    seller_link.admin_order_field = 'seller__business_name'
 
     def subtotal_display(self, obj):
         return f"{obj.currency} {obj.subtotal:,.0f}"
     subtotal_display.short_description = 'Order Total'
+    subtotal_display.admin_order_field = 'subtotal'
 
     def fee_display(self, obj):
         return format_html(
-            '<span style="color:#b91c1c;">{} {:,.0f}</span>',
-            obj.currency, obj.platform_fee
+            '<span style="color:#b91c1c;">{} {}</span>',
+            obj.currency, f'{obj.platform_fee:,.0f}'
         )
     fee_display.short_description = 'Platform Fee'
+    fee_display.admin_order_field = 'platform_fee'
 
     def payout_display(self, obj):
         return format_html(
-            '<strong style="color:#059669;">{} {:,.0f}</strong>',
-            obj.currency, obj.vendor_payout
+            '<strong style="color:#059669;">{} {}</strong>',
+            obj.currency, f'{obj.vendor_payout:,.0f}'
         )
     payout_display.short_description = 'Vendor Payout'
+    payout_display.admin_order_field = 'vendor_payout'
 
     def status_badge(self, obj):
         colours = {
@@ -373,9 +427,10 @@ class OrderAdmin(admin.ModelAdmin):
             bg, fg, obj.get_status_display()
         )
     status_badge.short_description = 'Status'
+    status_badge.admin_order_field = 'status'
 
     def trigger_payout_action(self, request, queryset):
-        from sellers.views import _trigger_payout
+        from sellers.views.payouts import _trigger_payout
         count = 0
         for order in queryset.filter(payout_triggered=False, status__in=['delivered', 'completed']):
             _trigger_payout(order)
@@ -384,14 +439,15 @@ class OrderAdmin(admin.ModelAdmin):
     trigger_payout_action.short_description = "Trigger payout to vendor"
 
     def mark_delivered_action(self, request, queryset):
-        updated = queryset.filter(status='shipped').update(
-            status='delivered', delivered_at=timezone.now()
-        )
+        # 'admin_bulk' is not a payout source — payouts stay a separate action here
+        updated = len(OrderStateMachine.bulk_transition(
+            queryset.filter(status='shipped'), 'delivered', source='admin_bulk', delivered_at=timezone.now(),
+        ).rows)
         self.message_user(request, f"✅ {updated} order(s) marked as delivered")
     mark_delivered_action.short_description = "Mark as Delivered (admin override)"
 
     def mark_refunded_action(self, request, queryset):
-        updated = queryset.exclude(status='refunded').update(status='refunded')
+        updated = len(OrderStateMachine.bulk_transition(queryset, 'refunded', source='admin_bulk').rows)
         self.message_user(request, f"💜 {updated} order(s) marked as refunded")
     mark_refunded_action.short_description = "Mark as Refunded"
 
@@ -460,28 +516,44 @@ class DisputeAdmin(admin.ModelAdmin):
         )
     status_badge.short_description = 'Status'
 
-    def resolve_for_buyer(self, request, queryset):
-        for dispute in queryset.filter(status__in=['open', 'vendor_replied', 'under_review']):
-            dispute.status      = 'resolved_buyer'
+    def _resolve(self, request, queryset, dispute_status, to_status, **fields):
+        """
+        Move each open dispute's order to `to_status`, then mark the dispute
+        resolved. Orders that can no longer make the move are skipped and
+        their disputes left open. Returns (resolved count, skipped order refs).
+        """
+        resolved, skipped = 0, []
+        for dispute in queryset.filter(status__in=['open', 'vendor_replied', 'under_review']).select_related('order'):
+            order = dispute.order
+            try:
+                moved = OrderStateMachine.transition(order, to_status, source='dispute', **fields)
+            except InvalidTransition:
+                moved = False
+            if not moved:
+                skipped.append(f"#{str(order.order_ref)[:8].upper()} ({order.get_status_display()})")
+                continue
+            dispute.status      = dispute_status
             dispute.resolved_at = timezone.now()
             dispute.save()
-            dispute.order.status = 'refunded'
-            dispute.order.save()
-        self.message_user(request, "✅ Disputes resolved in buyer's favour — manual refund required")
+            resolved += 1
+        if skipped:
+            self.message_user(
+                request, f"⚠️ Skipped {len(skipped)} dispute(s) — order can no longer move: {', '.join(skipped)}",
+                level=messages.WARNING,
+            )
+        return resolved
+
+    def resolve_for_buyer(self, request, queryset):
+        resolved = self._resolve(request, queryset, 'resolved_buyer', 'refunded', is_disputed=False)
+        self.message_user(request, f"✅ {resolved} dispute(s) resolved in buyer's favour — manual refund required")
     resolve_for_buyer.short_description = "Resolve: Refund buyer (manual refund needed)"
 
     def resolve_for_vendor(self, request, queryset):
-        from sellers.views import _trigger_payout
-        for dispute in queryset.filter(status__in=['open', 'vendor_replied', 'under_review']):
-            dispute.status      = 'resolved_vendor'
-            dispute.resolved_at = timezone.now()
-            dispute.save()
-            order              = dispute.order
-            order.status       = 'delivered'
-            order.delivered_at = timezone.now()
-            order.save()
-            _trigger_payout(order)
-        self.message_user(request, "✅ Disputes resolved in vendor's favour — payouts triggered")
+        # The 'delivered' hook triggers the payout
+        resolved = self._resolve(
+            request, queryset, 'resolved_vendor', 'delivered', is_disputed=False, delivered_at=timezone.now(),
+        )
+        self.message_user(request, f"✅ {resolved} dispute(s) resolved in vendor's favour — payouts triggered")
     resolve_for_vendor.short_description = "Resolve: Pay vendor (triggers payout)"
 
 
@@ -573,6 +645,29 @@ class VendorBankAccountAdmin(admin.ModelAdmin):
     mark_unverified.short_description = "Mark as Unverified"
 
 
+# ─────────────────────────────────────────────────────────────
+# PENDING CHECKOUT ADMIN  (read-only — for "charged but no order" support)
+# ─────────────────────────────────────────────────────────────
+@admin.register(PendingCheckout)
+class PendingCheckoutAdmin(admin.ModelAdmin):
+    list_display  = ['tx_ref', 'seller_link', 'buyer_email', 'subtotal', 'currency', 'payment_type', 'created_at']
+    list_filter   = ['payment_type', 'currency', 'created_at']
+    search_fields = ['tx_ref', 'buyer_email', 'buyer_phone', 'seller__business_name']
+    list_select_related = ['seller']
+    ordering      = ['-created_at']
+
+    def seller_link(self, obj):
+        url = reverse('admin:sellers_seller_change', args=[obj.seller.id])
+        return format_html('<a href="{}">{}</a>', url, obj.seller.business_name)
+    seller_link.short_description = 'Seller'
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
 # ─────────────────────────────────────────────────────────────
 # PLATFORM SETTINGS ADMIN  (singleton — one row only)
 # ─────────────────────────────────────────────────────────────
@@ -4,3 +4,20 @@ from django.apps import AppConfig
 class SellersConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'sellers'
+
+    def ready(self):
+        # Cloudinary credentials, set once the app registry is up rather than
+        # as a side effect of importing settings
+        import cloudinary
+        from django.conf import settings
+
+        cloudinary.config(
+            cloud_name = settings.CLOUDINARY_STORAGE['CLOUD_NAME'],
+            api_key    = settings.CLOUDINARY_STORAGE['API_KEY'],
+            api_secret = settings.CLOUDINARY_STORAGE['API_SECRET'],
+            secure     = True
+        )
+
+        # Validator stamps / CDN purges for the cached public pages
+        from sellers.http_cache import connect_signals
+        connect_signals()
@@ -0,0 +1,157 @@
+# sellers/cache.py
+"""
+Cache toolkit on top of Django's default cache (Redis in production, see
+CACHES in settings — locmem when REDIS_URL is unset).
+
+Namespaces — every key is built with key(namespace, *parts), which embeds
+the namespace's current version. bump(namespace) increments the version so
+every key in it is orphaned at once (Redis evicts them on their TTL); there
+is no key scanning. PlatformSettings and the seller slug set use the same
+counters through version() / bump().
+
+Stampede protection — get_or_set(key, producer, timeout) stores the value with
+a soft expiry `timeout` seconds out and a hard TTL `timeout + grace`. After
+the soft expiry exactly one caller (whoever wins a cache.add() lock) recomputes
+while everyone else keeps serving the stale value. On a cold miss the losers
+wait up to `wait` seconds for the winner before computing themselves.
+
+Tags — get_or_set(..., tags=['seller:42']) records each tag's version next to
+the value; invalidate_tags('seller:42') bumps it, and any entry stored under
+an older version is treated as a miss on its next read.
+
+Shared or not — is_shared() is False for the locmem fallback. There, each
+process (every gunicorn worker, the Celery worker) has its own cache, so a
+bump or a write in one is invisible to the others. Code that relies on
+cross-process invalidation checks it and falls back to the database.
+"""
+import logging
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = 60 * 5
+DEFAULT_GRACE   = 60        # seconds a stale entry may be served while one caller refreshes
+LOCK_TIMEOUT    = 30
+WAIT_SECONDS    = 2.0
+WAIT_STEP       = 0.05
+
+
+def is_shared():
+    """True when the default cache is one store for every process (Redis, Memcached, DB)."""
+    backend = settings.CACHES['default']['BACKEND']
+    return not backend.endswith(('.LocMemCache', '.DummyCache'))
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# VERSIONED NAMESPACES / TAGS
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _version_key(name):
+    return f'cache:v:{name}'
+
+
+def version(name):
+    """Current version counter for a namespace or tag (created at 1)."""
+    value = cache.get(_version_key(name))
+    if value is None:
+        cache.add(_version_key(name), 1, None)
+        value = cache.get(_version_key(name), 1)
+    return value
+
+
+def versions(names):
+    """{name: version} for several namespaces / tags in one round trip."""
+    keys  = {_version_key(name): name for name in names}
+    found = cache.get_many(list(keys))
+    result = {}
+    for key, name in keys.items():
+        result[name] = found[key] if key in found else version(name)
+    return result
+
+
+def bump(name):
+    """Invalidate everything under a namespace or tag. Returns the new version."""
+    cache.add(_version_key(name), 1, None)
+    try:
+        return cache.incr(_version_key(name))
+    except ValueError:     # evicted between add() and incr()
+        cache.set(_version_key(name), 2, None)
+        return 2
+
+
+def key(namespace, *parts):
+    """'<namespace>:<version>:<part>:<part>…'"""
+    return ':'.join([namespace, str(version(namespace)), *map(str, parts)])
+
+
+def invalidate_tags(*tags):
+    for tag in tags:
+        bump(tag)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# STAMPEDE-PROTECTED GET_OR_SET
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _lock_key(cache_key):
+    return f'cache:lock:{cache_key}'
+
+
+def _fresh_tags(entry, tags):
+    if not tags:
+        return True
+    return entry.get('tags') == versions(tags)
+
+
+def _store(cache_key, producer, timeout, grace, tags):
+    tag_versions = versions(tags) if tags else None   # read before producing: a concurrent bump wins
+    value = producer()
+    cache.set(cache_key, {
+        'value':   value,
+        'expires': time.time() + timeout,
+        'tags':    tag_versions,
+    }, timeout + grace)
+    return value
+
+
+def get_or_set(cache_key, producer, timeout=DEFAULT_TIMEOUT, tags=(), grace=DEFAULT_GRACE,
+               wait=WAIT_SECONDS):
+    """
+    Cached producer() under `cache_key`, recomputed by a single caller at a time.
+    `tags` is a collection of tag names that invalidate_tags() can expire.
+    """
+    tags  = list(tags)
+    entry = cache.get(cache_key)
+    if entry is not None and _fresh_tags(entry, tags):
+        if time.time() < entry['expires']:
+            return entry['value']
+        # Stale but within grace: one caller refreshes, the rest serve stale
+        if not cache.add(_lock_key(cache_key), 1, LOCK_TIMEOUT):
+            return entry['value']
+        try:
+            return _store(cache_key, producer, timeout, grace, tags)
+        finally:
+            cache.delete(_lock_key(cache_key))
+
+    # Cold (or invalidated) — the lock holder computes, others wait briefly for it
+    if cache.add(_lock_key(cache_key), 1, LOCK_TIMEOUT):
+        try:
+            return _store(cache_key, producer, timeout, grace, tags)
+        finally:
+            cache.delete(_lock_key(cache_key))
+
+    deadline = time.monotonic() + wait
+    while time.monotonic() < deadline:
+        time.sleep(WAIT_STEP)
+        entry = cache.get(cache_key)
+        if entry is not None and _fresh_tags(entry, tags):
+            return entry['value']
+    logger.warning(f"Cache lock wait timed out for {cache_key}, computing without the lock")
+    return producer()
+
+
+def delete(cache_key):
+    cache.delete(cache_key)
@@ -0,0 +1,190 @@
+# sellers/campaigns.py
+"""
+Chunked, resumable runner for the seller email campaigns.
+
+    runner = CampaignRunner(
+        campaign='weekly_summary', run_key='2026-W42',
+        recipients=<annotated Seller queryset>,
+        build=lambda seller: {...send kwargs...} or None to skip,
+        send=send_weekly_summary_email,
+    )
+    result = runner.run()
+
+Recipients come from one annotated query and are walked in ascending id,
+`chunk_size` at a time. Each chunk is sent concurrently on a small thread
+pool behind a shared rate limit. A CampaignCheckpoint row is updated after
+each chunk, so a rerun with the same run_key continues after the last
+finished chunk instead of re-sending to everyone. At most one chunk can be
+re-sent after a hard crash.
+
+Failed sends are not lost behind the checkpoint: their seller ids are kept
+in CampaignCheckpoint.failed_ids and every rerun with the same run_key
+(finished or not) retries them first. Recipients that no longer match the
+campaign's query drop out of the list. Failures are reported through
+`error_log` (the command's stderr), everything else through `log`.
+"""
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.utils import timezone
+
+from sellers.models import CampaignCheckpoint
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 100
+DEFAULT_WORKERS    = 8
+DEFAULT_RATE       = 10   # sends per second — comfortably under Brevo's transactional limit
+
+
+class RateLimiter:
+    """Spaces calls at least 1/rate seconds apart across all threads."""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate else 0
+        self._lock    = threading.Lock()
+        self._next_at = time.monotonic()
+
+    def wait(self):
+        if not self.interval:
+            return
+        with self._lock:
+            now           = time.monotonic()
+            wait_for      = self._next_at - now
+            self._next_at = max(now, self._next_at) + self.interval
+        if wait_for > 0:
+            time.sleep(wait_for)
+
+
+class CampaignRunner:
+    def __init__(self, campaign, run_key, recipients, build, send, on_sent=None,
+                 chunk_size=DEFAULT_CHUNK_SIZE, workers=DEFAULT_WORKERS, rate=DEFAULT_RATE,
+                 dry_run=False, restart=False, log=None, error_log=None):
+        self.campaign   = campaign
+        self.run_key    = run_key
+        self.recipients = recipients.order_by('id')
+        self.build      = build
+        self.send       = send
+        self.on_sent    = on_sent
+        self.chunk_size = chunk_size
+        self.workers    = workers
+        self.limiter    = RateLimiter(rate)
+        self.dry_run    = dry_run
+        self.restart    = restart
+        self.log        = log or logger.info
+        self.error_log  = error_log or logger.error
+
+    def _checkpoint(self):
+        if self.dry_run:
+            return CampaignCheckpoint(campaign=self.campaign, run_key=self.run_key)
+        checkpoint, created = CampaignCheckpoint.objects.get_or_create(
+            campaign=self.campaign, run_key=self.run_key,
+        )
+        if self.restart and not created:
+            checkpoint.last_seller_id = 0
+            checkpoint.sent = checkpoint.skipped = checkpoint.errors = 0
+            checkpoint.failed_ids  = []
+            checkpoint.finished_at = None
+            checkpoint.save()
+        elif checkpoint.last_seller_id:
+            self.log(f"Resuming {self.campaign} [{self.run_key}] after seller {checkpoint.last_seller_id}")
+        return checkpoint
+
+    def _send_one(self, seller, kwargs):
+        self.limiter.wait()
+        try:
+            return seller, bool(self.send(**kwargs))
+        except Exception as e:
+            logger.error(f"{self.campaign} send error for seller {seller.id}: {e}")
+            return seller, False
+
+    def _send_chunk(self, pool, checkpoint, sellers, retry=False):
+        """Build and send to `sellers`, moving each id into or out of checkpoint.failed_ids."""
+        failed = set(checkpoint.failed_ids)
+        jobs   = []
+        for seller in sellers:
+            kwargs = self.build(seller)
+            if kwargs is None:
+                failed.discard(seller.id)
+                if not retry:
+                    checkpoint.skipped += 1
+            elif self.dry_run:
+                self.log(f"[DRY RUN] Would send to {seller.email}")
+                checkpoint.sent += 1
+            else:
+                jobs.append((seller, kwargs))
+
+        sent_ids = []
+        for seller, ok in pool.map(lambda job: self._send_one(*job), jobs):
+            if ok:
+                sent_ids.append(seller.id)
+                failed.discard(seller.id)
+                self.log(f"✅ Sent to {seller.email}")
+            else:
+                failed.add(seller.id)
+                self.error_log(f"❌ Failed for {seller.email}")
+        checkpoint.sent      += len(sent_ids)
+        checkpoint.failed_ids = sorted(failed)
+        checkpoint.errors     = len(failed)
+
+        if sent_ids and self.on_sent:
+            self.on_sent(sent_ids)
+
+    def _retry_failed(self, pool, checkpoint):
+        retry_ids = list(checkpoint.failed_ids)
+        self.log(f"Retrying {len(retry_ids)} failed send(s) for {self.campaign} [{self.run_key}]")
+        sellers = list(self.recipients.filter(id__in=retry_ids))
+        # Sellers that no longer qualify for the campaign are not retried
+        checkpoint.failed_ids = sorted({seller.id for seller in sellers} & set(retry_ids))
+        self._send_chunk(pool, checkpoint, sellers, retry=True)
+        if not self.dry_run:
+            checkpoint.save()
+
+    def run(self):
+        checkpoint = self._checkpoint()
+        if checkpoint.finished_at and not checkpoint.failed_ids:
+            self.log(f"{self.campaign} [{self.run_key}] already finished — use --restart to send again")
+            return checkpoint
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            if checkpoint.failed_ids:
+                self._retry_failed(pool, checkpoint)
+
+            while not checkpoint.finished_at:
+                chunk = list(self.recipients.filter(id__gt=checkpoint.last_seller_id)[:self.chunk_size])
+                if not chunk:
+                    break
+                self._send_chunk(pool, checkpoint, chunk)
+                checkpoint.last_seller_id = chunk[-1].id
+                if not self.dry_run:
+                    checkpoint.save()
+
+        checkpoint.finished_at = checkpoint.finished_at or timezone.now()
+        if not self.dry_run:
+            checkpoint.save()
+        if checkpoint.failed_ids:
+            self.error_log(
+                f"{len(checkpoint.failed_ids)} send(s) failed — rerun with --run-key {self.run_key} to retry them"
+            )
+        return checkpoint
+
+
+def add_runner_arguments(parser):
+    """Options shared by every campaign command."""
+    parser.add_argument('--run-key', help='Override the run identifier used for checkpointing')
+    parser.add_argument('--restart', action='store_true', help='Ignore the checkpoint and send to everyone again')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS)
+    parser.add_argument('--rate', type=float, default=DEFAULT_RATE, help='Max sends per second')
+
+
+def runner_options(options):
+    return {
+        'chunk_size': options['chunk_size'],
+        'workers':    options['workers'],
+        'rate':       options['rate'],
+        'dry_run':    options['dry_run'],
+        'restart':    options['restart'],
+    }
@@ -1,33 +1,82 @@
 # sellers/email.py
 import os
-import sib_api_v3_sdk
-from sib_api_v3_sdk.rest import ApiException
+import re
 from django.conf import settings
 
+from sellers.metrics import timed_call
+
 SITE_URL     = 'https://www.vendopage.com'
 SUPPORT_EMAIL = 'support@vendopage.com'
 
 TEMPLATE_DIR = os.path.join(os.path.dirname(__file__), 'email_templates')
 
 
+# ─────────────────────────────────────────────
+# TEMPLATE CACHE
+# Each template is read and split into literal/placeholder parts once per
+# process, then rendered in a single join. With DEBUG on, the file's mtime is
+# checked on every render so edits show up without a restart.
+# ─────────────────────────────────────────────
+_PLACEHOLDER_RE = re.compile(r'\{\{([^{}]+?)\}\}')
+_compiled       = {}   # filename → (mtime, CompiledTemplate)
+
+
+class CompiledTemplate:
+    """
+    Alternating literal text and placeholder keys: parts[0::2] are literals,
+    parts[1::2] are keys. Unknown keys render back as '{{key}}', matching the
+    old replace-based behaviour.
+    """
+    __slots__ = ('parts',)
+
+    def __init__(self, source):
+        self.parts = _PLACEHOLDER_RE.split(source)
+
+    def render(self, context):
+        parts = self.parts
+        out   = [parts[0]]
+        for i in range(1, len(parts), 2):
+            key = parts[i]
+            out.append(str(context[key]) if key in context else '{{' + key + '}}')
+            out.append(parts[i + 1])
+        return ''.join(out)
+
+
 def _load_template(filename):
     path = os.path.join(TEMPLATE_DIR, filename)
     with open(path, 'r', encoding='utf-8') as f:
         return f.read()
 
 
+def get_template(filename):
+    cached = _compiled.get(filename)
+    if cached and not settings.DEBUG:
+        return cached[1]
+    mtime = os.path.getmtime(os.path.join(TEMPLATE_DIR, filename))
+    if cached and cached[0] == mtime:
+        return cached[1]
+    template            = CompiledTemplate(_load_template(filename))
+    _compiled[filename] = (mtime, template)
+    return template
+
+
 def _render(filename, context):
-    """Simple {{key}} → value replacement."""
-    html = _load_template(filename)
-    for key, value in context.items():
-        html = html.replace('{{' + key + '}}', str(value))
-    return html
+    """Single-pass {{key}} → value replacement using the compiled template cache."""
+    return get_template(filename).render(context)
 
 
+@timed_call('brevo', 'send_transac_email')
 def send_email_via_brevo(to_email, subject, html_content, text_content=None):
+    # The generated Brevo SDK loads hundreds of model modules — import it on
+    # the first send, not in every process that imports this module
+    import sib_api_v3_sdk
+    from sib_api_v3_sdk.rest import ApiException
+
     try:
         configuration = sib_api_v3_sdk.Configuration()
         configuration.api_key['api-key'] = settings.BREVO_API_KEY
+        if settings.BREVO_API_HOST:
+            configuration.host = settings.BREVO_API_HOST
 
         api_instance = sib_api_v3_sdk.TransactionalEmailsApi(
             sib_api_v3_sdk.ApiClient(configuration)
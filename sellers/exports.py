@@ -0,0 +1,238 @@
+# sellers/exports.py
+"""
+Streaming exports for finance reconciliation.
+
+Each dataset is a filtered queryset plus a list of (header, field) columns.
+Rows are read with values_list(...).iterator(chunk_size=...) and written one
+line at a time, so memory stays flat no matter how many rows match. The
+filter helpers are shared with the admin_dashboard list views so an export
+always matches what the admin is looking at.
+
+Under ASGI a StreamingHttpResponse over a sync iterator is consumed with
+sync_to_async(list) — the whole export in memory at once. astream_export()
+is the async twin for that case: the same lines from
+.values(...).aiterator(chunk_size=...), one chunk per thread hop. The
+queryset is still built synchronously, since a filter may touch the cache or
+flush presence first.
+"""
+import csv
+import json
+from datetime import timedelta
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from django.utils import timezone
+
+from sellers.models import Order, Seller
+
+CHUNK_SIZE     = 2000
+FORMATS        = ('csv', 'jsonl')
+CONTENT_TYPES  = {'csv': 'text/csv', 'jsonl': 'application/x-ndjson'}
+PAYOUT_STATUSES = ['delivered', 'RECEIVED', 'FAILED_PAYOUT', 'completed']
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# FILTERS — shared with the admin_dashboard list views
+# ─────────────────────────────────────────────────────────────────────────────
+
+def filter_orders(orders, params):
+    status_filter = params.get('status', '')
+    payout_filter = params.get('payout', '')
+    search        = (params.get('search') or '').strip()
+    if status_filter:
+        orders = orders.filter(status=status_filter)
+    if payout_filter == 'pending':
+        orders = orders.filter(payout_triggered=False, status__in=['delivered', 'completed'])
+    elif payout_filter == 'sent':
+        orders = orders.filter(payout_triggered=True)
+    if search:
+        orders = orders.filter(
+            Q(order_ref__icontains=search) | Q(buyer_name__icontains=search)
+            | Q(buyer_email__icontains=search) | Q(flutterwave_tx_ref__icontains=search)
+            | Q(seller__business_name__icontains=search)
+        )
+    return orders
+
+
+def filter_sellers(sellers, params):
+    subscription_filter = params.get('subscription')
+    store_mode_filter   = params.get('store_mode')
+    active_filter       = params.get('active')
+    seen_filter         = params.get('seen')
+    search              = (params.get('search') or '').strip()
+    if subscription_filter:
+        sellers = sellers.filter(subscription_type=subscription_filter)
+    if store_mode_filter == 'on':
+        sellers = sellers.filter(store_mode=True)
+    elif store_mode_filter == 'off':
+        sellers = sellers.filter(store_mode=False)
+    if active_filter == '1':
+        sellers = sellers.filter(is_active=True)
+    elif active_filter == '0':
+        sellers = sellers.filter(is_active=False)
+    if seen_filter == '24h':
+        from sellers.presence import flush
+        flush()
+        sellers = sellers.filter(last_seen__gte=timezone.now() - timedelta(hours=24))
+    if search:
+        sellers = sellers.filter(
+            Q(business_name__icontains=search) | Q(username__icontains=search) | Q(email__icontains=search)
+        )
+    return sellers
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# DATASETS
+# ─────────────────────────────────────────────────────────────────────────────
+
+ORDER_COLUMNS = [
+    ('order_ref',        'order_ref'),
+    ('created_at',       'created_at'),
+    ('seller_id',        'seller_id'),
+    ('seller',           'seller__business_name'),
+    ('buyer_name',       'buyer_name'),
+    ('buyer_email',      'buyer_email'),
+    ('status',           'status'),
+    ('payment_type',     'payment_type'),
+    ('currency',         'currency'),
+    ('subtotal',         'subtotal'),
+    ('platform_fee',     'platform_fee'),
+    ('vendor_payout',    'vendor_payout'),
+    ('commission_rate',  'commission_rate_applied'),
+    ('tx_ref',           'flutterwave_tx_ref'),
+    ('tx_id',            'flutterwave_tx_id'),
+    ('paid_at',          'paid_at'),
+    ('delivered_at',     'delivered_at'),
+    ('payout_triggered', 'payout_triggered'),
+    ('payout_at',        'payout_at'),
+]
+
+PAYOUT_COLUMNS = [
+    ('order_ref',      'order_ref'),
+    ('seller_id',      'seller_id'),
+    ('seller',         'seller__business_name'),
+    ('bank_name',      'seller__bank_account__bank_name'),
+    ('bank_code',      'seller__bank_account__bank_code'),
+    ('account_number', 'seller__bank_account__account_number'),
+    ('account_name',   'seller__bank_account__account_name'),
+    ('status',         'status'),
+    ('currency',       'currency'),
+    ('vendor_payout',  'vendor_payout'),
+    ('delivered_at',   'delivered_at'),
+    ('payout_triggered', 'payout_triggered'),
+    ('payout_at',      'payout_at'),
+    ('transfer_id',    'flutterwave_transfer_id'),
+]
+
+SELLER_COLUMNS = [
+    ('id',                'id'),
+    ('business_name',     'business_name'),
+    ('username',          'username'),
+    ('email',             'email'),
+    ('whatsapp_number',   'whatsapp_number'),
+    ('slug',              'slug'),
+    ('category',          'category'),
+    ('subscription_type', 'subscription_type'),
+    ('subscription_tier', 'subscription_tier'),
+    ('store_mode',        'store_mode'),
+    ('is_active',         'is_active'),
+    ('total_page_views',  'total_page_views'),
+    ('created_at',        'created_at'),
+]
+
+
+def orders_queryset(params):
+    return filter_orders(Order.objects.order_by('-created_at', '-id'), params)
+
+
+def payouts_queryset(params):
+    orders = Order.objects.filter(status__in=PAYOUT_STATUSES).order_by('-created_at', '-id')
+    return filter_orders(orders, params)
+
+
+def sellers_queryset(params):
+    sellers = Seller.objects.filter(is_staff=False, is_superuser=False).order_by('-created_at', '-id')
+    return filter_sellers(sellers, params)
+
+
+DATASETS = {
+    'orders':  (orders_queryset,  ORDER_COLUMNS),
+    'payouts': (payouts_queryset, PAYOUT_COLUMNS),
+    'sellers': (sellers_queryset, SELLER_COLUMNS),
+}
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# WRITERS
+# ─────────────────────────────────────────────────────────────────────────────
+
+# Cells a spreadsheet would evaluate as a formula (OWASP "CSV injection")
+FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+
+class _Echo:
+    """File-like object whose write() just hands the line back to csv.writer."""
+    def write(self, value):
+        return value
+
+
+def iter_rows(queryset, columns, chunk_size=CHUNK_SIZE):
+    fields = [field for _, field in columns]
+    return queryset.values_list(*fields).iterator(chunk_size=chunk_size)
+
+
+def _csv_safe(value):
+    """Buyer/seller-typed text starting like a formula is prefixed with ' so Excel shows it as text."""
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def iter_csv(queryset, columns, chunk_size=CHUNK_SIZE):
+    writer = csv.writer(_Echo())
+    yield writer.writerow([header for header, _ in columns])
+    for row in iter_rows(queryset, columns, chunk_size):
+        yield writer.writerow([_csv_safe(value) for value in row])
+
+
+def iter_jsonl(queryset, columns, chunk_size=CHUNK_SIZE):
+    headers = [header for header, _ in columns]
+    for row in iter_rows(queryset, columns, chunk_size):
+        yield json.dumps(dict(zip(headers, row)), cls=DjangoJSONEncoder) + '\n'
+
+
+def stream_export(dataset, params, fmt='csv', chunk_size=CHUNK_SIZE):
+    """Returns a generator of text lines for `dataset` filtered by `params`."""
+    build_queryset, columns = DATASETS[dataset]
+    writer = iter_jsonl if fmt == 'jsonl' else iter_csv
+    return writer(build_queryset(params), columns, chunk_size)
+
+
+# ── Async twins (ASGI) ───────────────────────────────────────────────────────
+
+async def aiter_rows(queryset, columns, chunk_size=CHUNK_SIZE):
+    # .values(), not .values_list(): ValuesListIterable runs its query when the
+    # iterator is created, which aiterator() does in the event loop
+    fields = [field for _, field in columns]
+    async for row in queryset.values(*fields).aiterator(chunk_size=chunk_size):
+        yield tuple(row[field] for field in fields)
+
+
+async def aiter_csv(queryset, columns, chunk_size=CHUNK_SIZE):
+    writer = csv.writer(_Echo())
+    yield writer.writerow([header for header, _ in columns])
+    async for row in aiter_rows(queryset, columns, chunk_size):
+        yield writer.writerow([_csv_safe(value) for value in row])
+
+
+async def aiter_jsonl(queryset, columns, chunk_size=CHUNK_SIZE):
+    headers = [header for header, _ in columns]
+    async for row in aiter_rows(queryset, columns, chunk_size):
+        yield json.dumps(dict(zip(headers, row)), cls=DjangoJSONEncoder) + '\n'
+
+
+def astream_export(dataset, params, fmt='csv', chunk_size=CHUNK_SIZE):
+    """stream_export() as an async generator; call it from sync code, iterate it in the event loop."""
+    build_queryset, columns = DATASETS[dataset]
+    writer = aiter_jsonl if fmt == 'jsonl' else aiter_csv
+    return writer(build_queryset(params), columns, chunk_size)
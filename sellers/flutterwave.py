@@ -16,6 +16,8 @@ import requests
 from decimal import Decimal
 from django.conf import settings
 
+from sellers.metrics import timed_call
+
 logger = logging.getLogger(__name__)
 
 SUPPORTED_CURRENCIES = {
@@ -34,8 +36,27 @@ def resolve_currency(currency_code: str) -> str:
     return SUPPORTED_CURRENCIES.get((currency_code or '').upper(), DEFAULT_CURRENCY)
 
 
+def payment_payload(email, amount, tx_ref, redirect_url, customer_name, currency, title, description):
+    """Body of POST /payments (hosted checkout), shared with the async client."""
+    return {
+        "tx_ref":       tx_ref,
+        "amount":       str(amount),
+        "currency":     resolve_currency(currency),
+        "redirect_url": redirect_url,
+        "customer": {
+            "email": email,
+            "name":  customer_name,
+        },
+        "customizations": {
+            "title":       title,
+            "description": description,
+            "logo":        getattr(settings, 'SITE_LOGO_URL', ''),
+        },
+    }
+
+
 class FlutterwavePayment:
-    BASE_URL = "https://api.flutterwave.com/v3"
+    BASE_URL = settings.FLUTTERWAVE_BASE_URL.rstrip('/')
 
     def __init__(self):
         self.public_key          = settings.FLUTTERWAVE_PUBLIC_KEY
@@ -49,6 +70,7 @@ class FlutterwavePayment:
         }
 
     # ── Payment initialization ───────────────────────────────────
+    @timed_call('flutterwave')
     def initialize_payment(
         self,
         email: str,
@@ -60,22 +82,9 @@ class FlutterwavePayment:
         title: str = "VendoPage Payment",
         description: str = "",
     ) -> dict:
-        currency = resolve_currency(currency)
-        payload  = {
-            "tx_ref":       tx_ref,
-            "amount":       str(amount),
-            "currency":     currency,
-            "redirect_url": redirect_url,
-            "customer": {
-                "email": email,
-                "name":  customer_name,
-            },
-            "customizations": {
-                "title":       title,
-                "description": description,
-                "logo":        getattr(settings, 'SITE_LOGO_URL', ''),
-            },
-        }
+        payload = payment_payload(
+            email, amount, tx_ref, redirect_url, customer_name, currency, title, description,
+        )
         try:
             resp = requests.post(
                 f"{self.BASE_URL}/payments",
@@ -88,6 +97,7 @@ class FlutterwavePayment:
             return {"status": "error", "message": str(e)}
 
     # ── Verify by transaction ID ─────────────────────────────────
+    @timed_call('flutterwave')
     def verify_payment(self, transaction_id) -> dict:
         try:
             resp = requests.get(
@@ -101,6 +111,7 @@ class FlutterwavePayment:
             return {"status": "error", "message": str(e)}
 
     # ── Verify by tx_ref ─────────────────────────────────────────
+    @timed_call('flutterwave')
     def verify_by_tx_ref(self, tx_ref: str) -> dict:
         try:
             resp = requests.get(
@@ -129,6 +140,7 @@ class FlutterwavePayment:
         )
 
     # ── Transfer to vendor bank account ──────────────────────────
+    @timed_call('flutterwave')
     def transfer_to_vendor(self, order) -> dict:
         """
         Send vendor payout via Flutterwave Transfer API.
@@ -183,6 +195,7 @@ class FlutterwavePayment:
             return {"status": "error", "message": str(e)}
 
     # ── Refund payment to buyer ───────────────────────────────────
+    @timed_call('flutterwave')
     def refund_payment(self, transaction_id: str, amount=None) -> dict:
         """
         Refunds a buyer's payment via Flutterwave.
@@ -249,6 +262,7 @@ class FlutterwavePayment:
             return {"status": "error", "message": str(e)}
 
     # ── Get banks ────────────────────────────────────────────────
+    @timed_call('flutterwave')
     def get_banks(self, country: str = 'NG') -> list:
         try:
             resp = requests.get(
@@ -262,6 +276,7 @@ class FlutterwavePayment:
             return []
 
     # ── Verify bank account ──────────────────────────────────────
+    @timed_call('flutterwave')
     def verify_bank_account(self, account_number: str, bank_code: str) -> dict:
         try:
             resp = requests.post(
@@ -274,7 +289,3 @@ class FlutterwavePayment:
         except requests.exceptions.RequestException as e:
             logger.error("FLW verify_bank_account error: %s", e)
             return {"status": "error", "message": str(e)}
-
-
-# Singleton
-flw = FlutterwavePayment()
\ No newline at end of file
@@ -0,0 +1,116 @@
+# sellers/flutterwave_async.py
+#
+# aiohttp twin of sellers.flutterwave.FlutterwavePayment for the async views.
+# Under ASGI (uvicorn workers, see Procfile) a view awaiting Flutterwave no
+# longer holds its worker: the event loop serves other requests until the
+# gateway answers. Same endpoints, payloads and return shapes as the sync
+# client, so the views read results exactly as before.
+#
+# Only the calls made on the request path live here — checkout, order /
+# subscription verification and the payout-account bank lookups. Transfers
+# and refunds run from the payout cron and the admin and stay on the sync
+# client.
+#
+# Each call opens its own ClientSession (like the sync client's bare
+# requests.post): a session is bound to one event loop, and under WSGI every
+# async view runs on a fresh loop.
+
+import asyncio
+import logging
+
+import aiohttp
+from django.conf import settings
+
+from sellers.flutterwave import FlutterwavePayment, payment_payload
+from sellers.metrics import timed_call
+
+logger = logging.getLogger(__name__)
+
+TIMEOUT       = aiohttp.ClientTimeout(total=30)
+SHORT_TIMEOUT = aiohttp.ClientTimeout(total=15)
+
+
+def _failed(operation, e):
+    message = str(e) or type(e).__name__    # asyncio.TimeoutError has no message
+    logger.error("FLW %s error: %s", operation, message)
+    return {"status": "error", "message": message}
+
+
+class AsyncFlutterwavePayment:
+    BASE_URL = FlutterwavePayment.BASE_URL
+
+    def __init__(self):
+        self.secret_key = settings.FLUTTERWAVE_SECRET_KEY
+
+    def _headers(self):
+        return {
+            "Authorization": f"Bearer {self.secret_key}",
+            "Content-Type":  "application/json",
+        }
+
+    async def _request(self, method, path, timeout=TIMEOUT, **kwargs):
+        """JSON body of a 2xx response; raises aiohttp.ClientError / asyncio.TimeoutError."""
+        async with aiohttp.ClientSession(headers=self._headers(), timeout=timeout) as session:
+            async with session.request(method, f"{self.BASE_URL}{path}", **kwargs) as resp:
+                resp.raise_for_status()
+                return await resp.json(content_type=None)
+
+    # ── Payment initialization ───────────────────────────────────
+    @timed_call('flutterwave')
+    async def initialize_payment(
+        self,
+        email: str,
+        amount,
+        tx_ref: str,
+        redirect_url: str,
+        customer_name: str = '',
+        currency: str = 'NGN',
+        title: str = "VendoPage Payment",
+        description: str = "",
+    ) -> dict:
+        payload = payment_payload(
+            email, amount, tx_ref, redirect_url, customer_name, currency, title, description,
+        )
+        try:
+            return await self._request('POST', '/payments', json=payload)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            return _failed('initialize_payment', e)
+
+    # ── Verify by transaction ID ─────────────────────────────────
+    @timed_call('flutterwave')
+    async def verify_payment(self, transaction_id) -> dict:
+        try:
+            return await self._request('GET', f'/transactions/{transaction_id}/verify')
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            return _failed('verify_payment', e)
+
+    # ── Verify by tx_ref ─────────────────────────────────────────
+    @timed_call('flutterwave')
+    async def verify_by_tx_ref(self, tx_ref: str) -> dict:
+        try:
+            return await self._request(
+                'GET', '/transactions/verify_by_reference', params={"tx_ref": tx_ref},
+            )
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            return _failed('verify_by_tx_ref', e)
+
+    # ── Get banks ────────────────────────────────────────────────
+    @timed_call('flutterwave')
+    async def get_banks(self, country: str = 'NG') -> list:
+        try:
+            body = await self._request('GET', f'/banks/{country}', timeout=SHORT_TIMEOUT)
+            return body.get('data', [])
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            _failed('get_banks', e)
+            return []
+
+    # ── Verify bank account ──────────────────────────────────────
+    @timed_call('flutterwave')
+    async def verify_bank_account(self, account_number: str, bank_code: str) -> dict:
+        try:
+            return await self._request(
+                'POST', '/accounts/resolve', timeout=SHORT_TIMEOUT,
+                json={"account_number": account_number, "account_bank": bank_code},
+            )
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            return _failed('verify_bank_account', e)
@@ -0,0 +1,231 @@
+# sellers/http_cache.py
+"""
+Conditional GET and edge-cache headers for the public pages.
+
+Validators — every cacheable page names the scopes its content depends on:
+
+    seller:<id>   one store page (seller profile, products, images, reviews)
+    directory     /stores/
+    pages         home, about, faq, robots.txt (templates only)
+    sitemaps      sitemap.xml and its shards
+
+Each scope has a "changed at" timestamp in the shared cache. touch(*scopes)
+stamps it (after the transaction commits); a missing stamp is created on
+first read. The ETag is a hash of RELEASE_VERSION and the stamps of the
+page's scopes, so a deploy or a catalog change moves it; the release is not
+part of the stamp keys, so every process reads the same stamps.
+Last-Modified is the newest stamp. A request costs one cache get_many before
+the view runs, and a matching If-None-Match / If-Modified-Since returns 304
+without running it.
+
+Without a shared cache (the locmem fallback) each process would keep its own
+stamps and a touch() in one would not move the others' validators, so pages
+render normally with no validators or public cache headers.
+
+Stamps expire after HTTP_CACHE_VALIDATOR_TTL, which bounds how long a page
+can keep its validators while something time-based (a premium plan lapsing,
+the last-seen badge) changes underneath it without a save.
+
+Who gets cached — only anonymous viewers: a request carrying the session or
+messages cookie renders normally and is marked `private, no-cache` (its
+navbar, owner controls and flash messages are per user). Anonymous
+responses that set no cookies get `public, max-age, s-maxage` and a
+`Surrogate-Key` header listing their scopes.
+
+Purge — the save/delete signals connected in connect_signals() touch the
+scopes a model change affects. Product images are only written next to a
+save of their product, which already touches the store. Bulk
+queryset.update()s and bulk_update()s send no signals, so the code doing
+them calls touch() / touch_sellers() itself. With CDN_PURGE_URL set,
+touch() also queues sellers.tasks.purge_cdn_keys for the scopes.
+"""
+import hashlib
+import logging
+import time
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date, quote_etag
+
+from sellers.cache import is_shared
+
+logger = logging.getLogger(__name__)
+
+# update_fields that never show on a public page — counters, tokens, presence
+SELLER_PRIVATE_FIELDS = frozenset({
+    'last_seen', 'last_login', 'password', 'email_verify_token',
+    'total_page_views', 'weekly_page_views', 'weekly_whatsapp_clicks',
+    'last_analytics_reset', 'last_reengagement_sent',
+})
+PRODUCT_PRIVATE_FIELDS = frozenset({'views', 'whatsapp_clicks'})
+
+
+def _changed_key(scope):
+    return f'http:changed:{scope}'
+
+
+def seller_scope(seller_id):
+    return f'seller:{seller_id}'
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# VALIDATORS
+# ─────────────────────────────────────────────────────────────────────────────
+
+def changed_at(scopes):
+    """{scope: unix timestamp} in one round trip; missing scopes are stamped now."""
+    keys  = {_changed_key(scope): scope for scope in scopes}
+    found = cache.get_many(list(keys))
+    stamps = {}
+    for key, scope in keys.items():
+        if key not in found:
+            cache.add(key, time.time(), settings.HTTP_CACHE_VALIDATOR_TTL)
+            found[key] = cache.get(key) or time.time()
+        stamps[scope] = found[key]
+    return stamps
+
+
+def touch(*scopes):
+    """Mark `scopes` as changed once the current transaction commits."""
+    scopes = [scope for scope in dict.fromkeys(scopes) if scope]
+    if not scopes:
+        return
+
+    def stamp():
+        now = time.time()
+        cache.set_many({_changed_key(scope): now for scope in scopes}, settings.HTTP_CACHE_VALIDATOR_TTL)
+        if settings.CDN_PURGE_URL:
+            from sellers.tasks import purge_cdn_keys
+            try:
+                purge_cdn_keys.delay(scopes)
+            except Exception as e:
+                logger.error(f"Could not queue CDN purge for {scopes}: {e}")
+
+    transaction.on_commit(stamp)
+
+
+def touch_sellers(seller_ids, directory=True):
+    """touch() the store pages of `seller_ids` (and /stores/) — for bulk updates."""
+    scopes = [seller_scope(seller_id) for seller_id in seller_ids if seller_id]
+    touch(*scopes, *(['directory'] if directory and scopes else []))
+
+
+def is_shareable(request):
+    """True for a viewer with no session and no pending flash messages."""
+    from django.contrib.messages.storage.cookie import CookieStorage
+    return (
+        settings.SESSION_COOKIE_NAME not in request.COOKIES
+        and CookieStorage.cookie_name not in request.COOKIES
+    )
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# DECORATOR
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _private(response):
+    patch_cache_control(response, private=True, no_cache=True)
+    patch_vary_headers(response, ['Cookie'])
+    return response
+
+
+def public_page(scopes):
+    """
+    Conditional GET + cache headers for an anonymous-cacheable view.
+
+    `scopes` is a list of scope names, or a callable (request, *args, **kwargs)
+    returning one — None from the callable skips caching (e.g. unknown slug,
+    so the view can 404 as usual).
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            if request.method not in ('GET', 'HEAD'):
+                return view(request, *args, **kwargs)
+            if not is_shareable(request):
+                return _private(view(request, *args, **kwargs))
+
+            page_scopes = scopes(request, *args, **kwargs) if callable(scopes) else scopes
+            if not page_scopes or not is_shared():
+                return view(request, *args, **kwargs)
+
+            stamps = changed_at(page_scopes)
+            parts  = [settings.RELEASE_VERSION, request.get_full_path(), *(f'{scope}={stamps[scope]!r}' for scope in page_scopes)]
+            etag          = quote_etag(hashlib.sha1('|'.join(parts).encode()).hexdigest()[:20])
+            last_modified = int(max(stamps.values()))
+
+            response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+            if response is None:
+                response = view(request, *args, **kwargs)
+                if response.status_code != 200:
+                    return response
+                if response.cookies:
+                    return _private(response)
+
+            response['ETag']          = etag
+            response['Last-Modified'] = http_date(last_modified)
+            response['Surrogate-Key'] = ' '.join(page_scopes)
+            patch_cache_control(
+                response, public=True,
+                max_age=settings.HTTP_CACHE_MAX_AGE,
+                s_maxage=settings.HTTP_CACHE_S_MAXAGE,
+                stale_while_revalidate=settings.HTTP_CACHE_S_MAXAGE,
+            )
+            patch_vary_headers(response, ['Cookie'])
+            return response
+        return wrapper
+    return decorator
+
+
+def seller_page_scopes(request, slug, *args, **kwargs):
+    from sellers import slugs
+    seller_id = slugs.resolve(slug)
+    return [seller_scope(seller_id)] if seller_id is not None else None
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# PURGE HOOKS
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _only(update_fields, private):
+    return update_fields is not None and set(update_fields) <= private
+
+
+def _seller_saved(sender, instance, update_fields=None, **kwargs):
+    if not _only(update_fields, SELLER_PRIVATE_FIELDS):
+        touch(seller_scope(instance.pk), 'directory')
+
+
+def _seller_deleted(sender, instance, **kwargs):
+    touch(seller_scope(instance.pk), 'directory')
+
+
+def _product_saved(sender, instance, update_fields=None, **kwargs):
+    if instance.seller_id and not _only(update_fields, PRODUCT_PRIVATE_FIELDS):
+        touch(seller_scope(instance.seller_id), 'directory')
+
+
+def _product_deleted(sender, instance, **kwargs):
+    if instance.seller_id:
+        touch(seller_scope(instance.seller_id), 'directory')
+
+
+def _review_changed(sender, instance, **kwargs):
+    touch(seller_scope(instance.seller_id))
+
+
+def connect_signals():
+    """Called from SellersConfig.ready()."""
+    from django.db.models.signals import post_delete, post_save
+    from products.models import Product
+    from sellers.models import Review, Seller
+
+    post_save.connect(_seller_saved, sender=Seller, dispatch_uid='http_cache_seller_saved')
+    post_delete.connect(_seller_deleted, sender=Seller, dispatch_uid='http_cache_seller_deleted')
+    post_save.connect(_product_saved, sender=Product, dispatch_uid='http_cache_product_saved')
+    post_delete.connect(_product_deleted, sender=Product, dispatch_uid='http_cache_product_deleted')
+    post_save.connect(_review_changed, sender=Review, dispatch_uid='http_cache_review_saved')
+    post_delete.connect(_review_changed, sender=Review, dispatch_uid='http_cache_review_deleted')
@@ -0,0 +1,170 @@
+# sellers/ledger.py
+"""
+Per-seller transaction ledger.
+
+SellerLedger holds one row per (seller, status, payout_triggered) with the
+order count and vendor payout total in that bucket. Every bucket change is
+applied in the same transaction as the order write that causes it:
+
+    update_order()   one conditional UPDATE of one order. The WHERE pins
+                     every ledger field the UPDATE changes, so the row's
+                     actual old state is known, and move() applies exactly
+                     old → new. Used by OrderStateMachine.transition(), the
+                     payout bookkeeping and Order.save().
+    rebuild()        one GROUP BY for the sellers of a bulk transition, or
+                     after a delete.
+
+Two concurrent writers of one order cannot both move it: the second one's
+WHERE no longer matches. The nightly reconcile task rebuilds everyone as a
+safety net.
+
+summary_for() turns a seller's rows into the summary cards and tab counts on
+the transactions page. If a seller has no rows yet it falls back to a single
+GROUP BY over their orders and stores the result.
+"""
+import logging
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import Count, Sum
+
+from sellers.models import Order, SellerLedger
+
+logger = logging.getLogger(__name__)
+
+# The order fields a ledger bucket is keyed / summed on, in ledger-state order
+LEDGER_FIELDS = ('status', 'payout_triggered', 'vendor_payout')
+
+# Transactions-page tabs → the buckets they cover. payout_triggered=None means either.
+TABS = {
+    'pending':  (['paid', 'shipped'],  None),
+    'received': (['RECEIVED'],         None),
+    'paid_out': (['completed'],        True),
+    'failed':   (['FAILED_PAYOUT'],    None),
+    'disputed': (['disputed'],         None),
+    'refunded': (['refunded'],         None),
+}
+
+
+def move(seller_id, old_state, new_state):
+    """
+    Move one order from the `old_state` bucket to `new_state`.
+    States are (status, payout_triggered, vendor_payout); None means "no order"
+    (a new order has no old state, a deleted one has no new state).
+    """
+    if old_state == new_state:
+        return
+    if old_state is not None:
+        status, payout_triggered, payout = old_state
+        SellerLedger.bump(seller_id, status, payout_triggered, -1, -(payout or Decimal('0')))
+    if new_state is not None:
+        status, payout_triggered, payout = new_state
+        SellerLedger.bump(seller_id, status, payout_triggered, 1, payout or Decimal('0'))
+
+
+def update_order(order_id, where, **updates):
+    """
+    UPDATE the order `order_id` WHERE `where` (field → value) matches, and
+    move it between ledger buckets by what actually changed — in one
+    transaction. Every ledger field in `updates` must be pinned in `where`.
+    Returns the row's (seller_id, new ledger state), or None if the WHERE
+    did not match and nothing was written.
+    """
+    unpinned = (set(LEDGER_FIELDS) & set(updates)) - set(where)
+    if unpinned:
+        raise ValueError(f"update_order: pin {sorted(unpinned)} in `where`")
+
+    with transaction.atomic():
+        if not Order.objects.filter(pk=order_id, **where).update(**updates):
+            return None
+        seller_id, *new_state = (
+            Order.objects.filter(pk=order_id).values_list('seller_id', *LEDGER_FIELDS).get()
+        )
+        # Pinned fields were exactly `where` before the UPDATE; the rest were not touched by it
+        old_state = tuple(where.get(name, value) for name, value in zip(LEDGER_FIELDS, new_state))
+        move(seller_id, old_state, tuple(new_state))
+    return seller_id, tuple(new_state)
+
+
+def _grouped(orders):
+    return (
+        orders.order_by()
+        .values('seller_id', 'status', 'payout_triggered')
+        .annotate(order_count=Count('id'), total_payout=Sum('vendor_payout'))
+    )
+
+
+def rebuild(seller_ids=None):
+    """
+    Recompute ledger rows from orders with one GROUP BY — for the given
+    sellers, or everyone when seller_ids is None. Returns the number of rows written.
+    """
+    orders = Order.objects.all()
+    rows   = SellerLedger.objects.all()
+    if seller_ids is not None:
+        seller_ids = list(set(seller_ids))
+        orders = orders.filter(seller_id__in=seller_ids)
+        rows   = rows.filter(seller_id__in=seller_ids)
+
+    fresh = [
+        SellerLedger(
+            seller_id=row['seller_id'], status=row['status'], payout_triggered=row['payout_triggered'],
+            order_count=row['order_count'], total_payout=row['total_payout'] or Decimal('0'),
+        )
+        for row in _grouped(orders)
+    ]
+    with transaction.atomic():
+        rows.delete()
+        SellerLedger.objects.bulk_create(fresh, batch_size=1000)
+    return len(fresh)
+
+
+def _bucket_rows(seller):
+    rows = list(SellerLedger.objects.filter(seller=seller).values(
+        'status', 'payout_triggered', 'order_count', 'total_payout',
+    ))
+    if rows:
+        return rows
+    # Fallback: nothing recorded yet — one GROUP BY over this seller's orders
+    rows = list(_grouped(Order.objects.filter(seller=seller)))
+    if rows:
+        SellerLedger.objects.bulk_create([
+            SellerLedger(seller=seller, **{k: v for k, v in row.items() if k != 'seller_id'})
+            for row in rows
+        ], ignore_conflicts=True)
+    return rows
+
+
+def summary_for(seller):
+    """
+    Returns (tab_counts, summary) for the transactions page:
+    tab_counts keyed by tab name (plus 'all'), summary with the totals/counts
+    the summary cards show.
+    """
+    rows = _bucket_rows(seller)
+
+    def pick(tab):
+        statuses, payout_triggered = TABS[tab]
+        matching = [
+            row for row in rows
+            if row['status'] in statuses and (payout_triggered is None or row['payout_triggered'] == payout_triggered)
+        ]
+        count = sum(row['order_count'] for row in matching)
+        total = sum((row['total_payout'] or Decimal('0') for row in matching), Decimal('0'))
+        return count, (total if count else None)
+
+    picked     = {tab: pick(tab) for tab in TABS}
+    tab_counts = {'all': sum(row['order_count'] for row in rows)}
+    tab_counts.update({tab: count for tab, (count, _) in picked.items()})
+
+    summary = {
+        'total_paid_out':  picked['paid_out'][1],
+        'total_pending':   picked['pending'][1],
+        'total_in_buffer': picked['received'][1],
+        'total_failed':    picked['failed'][1],
+        'count_completed': picked['paid_out'][0],
+        'count_pending':   picked['pending'][0],
+        'count_received':  picked['received'][0],
+        'count_failed':    picked['failed'][0],
+    }
+    return tab_counts, summary
@@ -0,0 +1,20 @@
+# sellers/loadtest/__init__.py
+"""
+Offline load testing for the checkout path.
+
+    gateway.FakeGateway   local stand-in for the Flutterwave v3 API (payments,
+                          hosted checkout, verify, transfers, balances, banks,
+                          account resolve, refunds, charge webhooks) and for
+                          Brevo's transactional email endpoint
+    traffic               scripted buyer / vendor journeys against a running
+                          server, with per-step throughput and p50/p95/p99
+
+The app is pointed at the stand-in with two settings, so no live keys or
+network access are needed:
+
+    FLUTTERWAVE_BASE_URL=http://127.0.0.1:8765/v3
+    BREVO_API_HOST=http://127.0.0.1:8765/brevo/v3
+    FLW_SECRET_HASH=loadtest
+
+Commands: `manage.py fake_gateway` (stand-in only) and `manage.py run_loadtest`.
+"""
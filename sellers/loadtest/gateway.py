@@ -0,0 +1,348 @@
+# sellers/loadtest/gateway.py
+"""
+Local stand-in for Flutterwave and Brevo.
+
+Responses follow the shapes sellers.flutterwave and sellers.email read, not
+the full upstream schema. Hosted checkout is simulated: POST /v3/payments
+returns a link to /checkout/<tx_ref> on this server, which marks the charge
+successful, fires the `charge.completed` webhook (when a webhook URL is set)
+and 302s to the merchant's redirect_url exactly like the real hosted page.
+
+    POST /v3/payments                         hosted link
+    GET  /checkout/<tx_ref>                   "pay" → redirect_url?status=successful&…
+    GET  /v3/transactions/<id>/verify
+    GET  /v3/transactions/verify_by_reference?tx_ref=
+    POST /v3/transactions/<id>/refund
+    POST /v3/transfers                        debits the fake balance
+    GET  /v3/balances/<currency>
+    GET  /v3/banks/<country>
+    POST /v3/accounts/resolve
+    POST /brevo/v3/smtp/email                 201 + messageId, nothing is sent
+
+`latency_ms` adds a random delay (0.5×–1.5×) to every API call and
+`failure_rate` answers that fraction of them with a 500, to see how the app
+behaves when the gateway is slow or flaky.
+"""
+import itertools
+import json
+import logging
+import random
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BALANCE  = 10_000_000_000
+LIVE_FLUTTERWAVE = 'https://api.flutterwave.com'
+
+BANKS = [
+    {'id': 1, 'code': '044', 'name': 'Access Bank'},
+    {'id': 2, 'code': '058', 'name': 'Guaranty Trust Bank (GTB)'},
+    {'id': 3, 'code': '033', 'name': 'United Bank for Africa'},
+    {'id': 4, 'code': '057', 'name': 'Zenith Bank'},
+    {'id': 5, 'code': '50211', 'name': 'Kuda Bank'},
+]
+
+
+def configured_origin():
+    """
+    Origin of the stand-in the app is configured for (FLUTTERWAVE_BASE_URL
+    without /v3), or None while it still points at live Flutterwave.
+    """
+    from django.conf import settings
+    base_url = settings.FLUTTERWAVE_BASE_URL.rstrip('/')
+    if base_url.startswith(LIVE_FLUTTERWAVE):
+        return None
+    return base_url.removesuffix('/v3')
+
+
+class GatewayState:
+    """Charges, transfers and the balance, shared by all handler threads."""
+
+    def __init__(self, balance=DEFAULT_BALANCE):
+        self.lock         = threading.Lock()
+        self.ids          = itertools.count(9_000_000)
+        self.charges      = {}    # id → charge
+        self.by_tx_ref    = {}    # tx_ref → charge
+        self.transfers    = {}    # reference → transfer
+        self.balance      = balance
+        self.emails_sent  = 0
+
+    def create_charge(self, payload):
+        customer = payload.get('customer') or {}
+        with self.lock:
+            charge = {
+                'id':             next(self.ids),
+                'tx_ref':         payload.get('tx_ref', ''),
+                'flw_ref':        f'FLW-LOAD-{uuid.uuid4().hex[:12].upper()}',
+                'amount':         float(payload.get('amount') or 0),
+                'charged_amount': float(payload.get('amount') or 0),
+                'currency':       payload.get('currency', 'NGN'),
+                'status':         'pending',
+                'redirect_url':   payload.get('redirect_url', ''),
+                'customer':       {'email': customer.get('email', ''), 'name': customer.get('name', '')},
+                'amount_refunded': 0.0,
+            }
+            self.charges[charge['id']]     = charge
+            self.by_tx_ref[charge['tx_ref']] = charge
+        return charge
+
+    def complete_charge(self, tx_ref):
+        with self.lock:
+            charge = self.by_tx_ref.get(tx_ref)
+            if charge is not None and charge['status'] == 'pending':
+                charge['status'] = 'successful'
+            return charge
+
+    def transfer(self, payload):
+        amount = float(payload.get('amount') or 0)
+        with self.lock:
+            reference = payload.get('reference') or f'LOAD-TRF-{uuid.uuid4().hex[:12]}'
+            if reference in self.transfers:
+                return None, 'Transfer reference already exists'
+            if amount > self.balance:
+                return None, 'Insufficient balance'
+            self.balance -= amount
+            transfer = {
+                'id':             next(self.ids),
+                'reference':      reference,
+                'amount':         amount,
+                'currency':       payload.get('currency', 'NGN'),
+                'account_number': payload.get('account_number', ''),
+                'bank_code':      payload.get('account_bank', ''),
+                'status':         'NEW',
+            }
+            self.transfers[reference] = transfer
+        return transfer, None
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = 'FakeFlutterwave/1.0'
+    protocol_version = 'HTTP/1.1'
+
+    # ── plumbing ─────────────────────────────────────────────────
+    @property
+    def gateway(self):
+        return self.server.gateway
+
+    def log_message(self, format, *args):
+        logger.debug('fake gateway: ' + format, *args)
+
+    def _body(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        if not length:
+            return {}
+        try:
+            return json.loads(self.rfile.read(length) or b'{}')
+        except ValueError:
+            return {}
+
+    def _send(self, status, payload=None, headers=None):
+        body = json.dumps(payload).encode() if payload is not None else b''
+        self.send_response(status)
+        if payload is not None:
+            self.send_header('Content-Type', 'application/json')
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _ok(self, message, data, status=200):
+        self._send(status, {'status': 'success', 'message': message, 'data': data})
+
+    def _error(self, status, message):
+        self._send(status, {'status': 'error', 'message': message, 'data': None})
+
+    def _simulate_network(self):
+        """Injected latency / failures. True if the call should fail."""
+        gateway = self.gateway
+        if gateway.latency_ms:
+            time.sleep(gateway.latency_ms * gateway.rng.uniform(0.5, 1.5) / 1000)
+        return gateway.failure_rate and gateway.rng.random() < gateway.failure_rate
+
+    def _route(self, method):
+        url   = urlsplit(self.path)
+        parts = [p for p in url.path.split('/') if p]
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+
+        if method == 'GET' and len(parts) == 2 and parts[0] == 'checkout':
+            return self.hosted_checkout(parts[1])
+        if parts[:1] == ['brevo'] and parts[-2:] == ['smtp', 'email'] and method == 'POST':
+            return self.brevo_send()
+        if parts[:1] != ['v3']:
+            return self._error(404, 'Not found')
+
+        if self._simulate_network():
+            return self._error(500, 'Simulated gateway failure')
+
+        route = (method, *parts[1:])
+        if route == ('POST', 'payments'):
+            return self.create_payment()
+        if route[:2] == ('GET', 'transactions') and len(route) == 4 and route[3] == 'verify':
+            return self.verify(charge_id=route[2])
+        if route == ('GET', 'transactions', 'verify_by_reference'):
+            return self.verify(tx_ref=query.get('tx_ref', ''))
+        if route[:2] == ('POST', 'transactions') and len(route) == 4 and route[3] == 'refund':
+            return self.refund(route[2])
+        if route == ('POST', 'transfers'):
+            return self.create_transfer()
+        if route[:2] == ('GET', 'balances') and len(route) == 3:
+            return self.balance(route[2])
+        if route[:2] == ('GET', 'banks') and len(route) == 3:
+            return self._ok('Banks fetched successfully', BANKS)
+        if route == ('POST', 'accounts', 'resolve'):
+            return self.resolve_account()
+        return self._error(404, 'Not found')
+
+    def do_GET(self):
+        self._route('GET')
+
+    def do_POST(self):
+        self._route('POST')
+
+    # ── Flutterwave ──────────────────────────────────────────────
+    def create_payment(self):
+        payload = self._body()
+        if not payload.get('tx_ref') or not payload.get('redirect_url'):
+            return self._error(400, 'tx_ref and redirect_url are required')
+        charge = self.gateway.state.create_charge(payload)
+        self._ok('Hosted Link', {'link': f"{self.gateway.public_url}/checkout/{charge['tx_ref']}"})
+
+    def hosted_checkout(self, tx_ref):
+        charge = self.gateway.state.complete_charge(tx_ref)
+        if charge is None:
+            return self._error(404, 'Unknown tx_ref')
+        self.gateway.send_charge_webhook(charge)
+        query = urlencode({'status': 'successful', 'tx_ref': tx_ref, 'transaction_id': charge['id']})
+        separator = '&' if '?' in charge['redirect_url'] else '?'
+        self._send(302, headers={'Location': f"{charge['redirect_url']}{separator}{query}"})
+
+    def verify(self, charge_id=None, tx_ref=None):
+        state = self.gateway.state
+        with state.lock:
+            if tx_ref is not None:
+                charge = state.by_tx_ref.get(tx_ref)
+            else:
+                charge = state.charges.get(int(charge_id)) if str(charge_id).isdigit() else None
+            charge = dict(charge) if charge else None
+        if charge is None:
+            return self._error(400, 'No transaction was found for this id')
+        charge.pop('redirect_url', None)
+        self._ok('Transaction fetched successfully', charge)
+
+    def refund(self, charge_id):
+        payload = self._body()
+        state   = self.gateway.state
+        with state.lock:
+            charge = state.charges.get(int(charge_id)) if charge_id.isdigit() else None
+            if charge is None or charge['status'] != 'successful':
+                charge = None
+            else:
+                amount = float(payload.get('amount') or charge['amount'] - charge['amount_refunded'])
+                charge['amount_refunded'] += amount
+        if charge is None:
+            return self._error(400, 'Transaction not found or not refundable')
+        self._ok('Transaction refunded', {
+            'id':              next(state.ids),
+            'tx_id':           charge['id'],
+            'amount_refunded': amount,
+            'status':          'completed',
+        })
+
+    def create_transfer(self):
+        transfer, error = self.gateway.state.transfer(self._body())
+        if error:
+            return self._error(400, error)
+        self._ok('Transfer Queued Successfully', transfer)
+
+    def balance(self, currency):
+        available = self.gateway.state.balance
+        self._ok('Wallet balance fetched', {
+            'currency':          currency.upper(),
+            'available_balance': available,
+            'ledger_balance':    available,
+        })
+
+    def resolve_account(self):
+        payload = self._body()
+        if not payload.get('account_number') or not payload.get('account_bank'):
+            return self._error(400, 'account_number and account_bank are required')
+        self._ok('Account details fetched', {
+            'account_number': payload['account_number'],
+            'account_name':   'LOAD TEST ACCOUNT',
+        })
+
+    # ── Brevo ────────────────────────────────────────────────────
+    def brevo_send(self):
+        self._body()
+        if self._simulate_network():
+            return self._send(500, {'code': 'internal_error', 'message': 'Simulated Brevo failure'})
+        with self.gateway.state.lock:
+            self.gateway.state.emails_sent += 1
+        self._send(201, {'messageId': f'<{uuid.uuid4().hex}@loadtest.vendopage.com>'})
+
+
+class FakeGateway:
+    """
+    The stand-in server. `public_url` is the origin the app reaches it at
+    (the hosted checkout link is built from it); `webhook_url` receives
+    charge.completed events signed with `secret_hash` after `webhook_delay`
+    seconds — leave it empty to rely on the redirect alone.
+    """
+
+    def __init__(self, host='127.0.0.1', port=8765, public_url=None, webhook_url='',
+                 secret_hash='', webhook_delay=0.5, latency_ms=0, failure_rate=0.0,
+                 balance=DEFAULT_BALANCE, seed=None):
+        self.state         = GatewayState(balance)
+        self.webhook_url   = webhook_url
+        self.secret_hash   = secret_hash
+        self.webhook_delay = webhook_delay
+        self.latency_ms    = latency_ms
+        self.failure_rate  = failure_rate
+        self.rng           = random.Random(seed)
+        self.httpd         = ThreadingHTTPServer((host, port), _Handler)
+        self.httpd.daemon_threads = True
+        self.httpd.gateway = self
+        self.public_url    = (public_url or f'http://{host}:{self.httpd.server_port}').rstrip('/')
+        self._thread       = None
+
+    # ── webhooks ─────────────────────────────────────────────────
+    def send_charge_webhook(self, charge):
+        if not self.webhook_url:
+            return
+        payload = {
+            'event': 'charge.completed',
+            'data':  {key: value for key, value in charge.items() if key != 'redirect_url'},
+        }
+        timer = threading.Timer(self.webhook_delay, self._post_webhook, args=(payload,))
+        timer.daemon = True
+        timer.start()
+
+    def _post_webhook(self, payload):
+        try:
+            requests.post(
+                self.webhook_url, json=payload,
+                headers={'verif-hash': self.secret_hash}, timeout=30,
+            )
+        except requests.RequestException as e:
+            logger.warning(f"Fake gateway webhook to {self.webhook_url} failed: {e}")
+
+    # ── lifecycle ────────────────────────────────────────────────
+    def serve_forever(self):
+        self.httpd.serve_forever()
+
+    def start(self):
+        """Serve from a daemon thread; returns self."""
+        self._thread = threading.Thread(target=self.serve_forever, name='fake-gateway', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
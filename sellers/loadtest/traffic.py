@@ -0,0 +1,309 @@
+# sellers/loadtest/traffic.py
+"""
+Scripted traffic for a running VendoPage server.
+
+One journey is one buyer buying from one store, end to end:
+
+    browse          GET  /<slug>/
+    page_view       POST /api/seller/<slug>/view/       (the store page's beacon)
+    whatsapp_click  POST /api/product/<id>/track-whatsapp/
+    cart            GET  /order/<slug>/cart/
+    checkout        GET  /order/<slug>/checkout/
+    pay             POST /order/<slug>/pay/              → hosted checkout link
+    confirm         GET  /order/confirm/?status=…        (after the hosted page)
+    ship            POST /dashboard/orders/<ref>/ship/   as the seller
+    receive         POST /order/<ref>/confirm-receipt/   as the buyer
+
+followed, once all journeys are done, by
+
+    payout          the escrow transfer process_payouts makes for each
+                    RECEIVED order, run in this process against the gateway
+
+Journeys run on a thread pool (one thread per virtual user) and every step
+is timed on its own. Seller sessions are created directly in the session
+store, so no passwords are needed; buyers get a CSRF cookie set up front.
+"""
+import json
+import random
+import secrets
+import string
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
+from urllib.parse import urlsplit
+
+import requests
+from django.conf import settings
+
+STEPS = ('browse', 'page_view', 'whatsapp_click', 'cart', 'checkout', 'pay', 'confirm', 'ship', 'receive', 'payout')
+
+_TOKEN_CHARS = string.ascii_letters + string.digits
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# STATS
+# ─────────────────────────────────────────────────────────────────────────────
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * pct // 100))    # ceil
+    return sorted_values[int(rank) - 1]
+
+
+class Recorder:
+    """Per-step latencies and errors, safe to share between threads."""
+
+    def __init__(self):
+        self.lock      = threading.Lock()
+        self.samples   = defaultdict(list)     # step → [seconds]
+        self.errors    = defaultdict(int)      # step → count
+        self.reasons   = defaultdict(int)      # (step, error) → count
+        self.wall      = {}                    # step → seconds the step's phase ran for
+
+    def record(self, step, seconds, error=None):
+        with self.lock:
+            self.samples[step].append(seconds)
+            if error:
+                self.errors[step] += 1
+                self.reasons[(step, error)] += 1
+
+    def rows(self):
+        """One dict per step with count, errors, req/s and p50/p95/p99/max in ms."""
+        rows = []
+        for step in STEPS:
+            values = sorted(self.samples.get(step, []))
+            if not values:
+                continue
+            wall = self.wall.get(step) or sum(values)
+            rows.append({
+                'step':   step,
+                'count':  len(values),
+                'errors': self.errors.get(step, 0),
+                'rps':    len(values) / wall if wall else 0.0,
+                'p50':    percentile(values, 50) * 1000,
+                'p95':    percentile(values, 95) * 1000,
+                'p99':    percentile(values, 99) * 1000,
+                'max':    values[-1] * 1000,
+            })
+        return rows
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# HTTP
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _plain_cookies(session):
+    # Outside DEBUG the session and CSRF cookies are Secure; the target is
+    # usually plain HTTP on localhost, so keep sending them anyway.
+    for cookie in session.cookies:
+        cookie.secure = False
+
+
+def _csrf_session():
+    """A requests.Session carrying a CSRF cookie it can echo in X-CSRFToken."""
+    session = requests.Session()
+    token   = ''.join(secrets.choice(_TOKEN_CHARS) for _ in range(32))
+    session.cookies.set(settings.CSRF_COOKIE_NAME, token)
+    session.headers['X-CSRFToken'] = token
+    return session
+
+
+def vendor_session(seller):
+    """A logged-in session for `seller`, created straight in the session store."""
+    from importlib import import_module
+    from django.contrib.auth import BACKEND_SESSION_KEY, HASH_SESSION_KEY, SESSION_KEY
+
+    store = import_module(settings.SESSION_ENGINE).SessionStore()
+    store[SESSION_KEY]         = str(seller.pk)
+    store[BACKEND_SESSION_KEY] = settings.AUTHENTICATION_BACKENDS[0]
+    store[HASH_SESSION_KEY]    = seller.get_session_auth_hash()
+    store.create()
+
+    session = _csrf_session()
+    session.cookies.set(settings.SESSION_COOKIE_NAME, store.session_key)
+    return session
+
+
+def _order_ref(response):
+    """The ref in a redirect to /order/<ref>/, else None."""
+    parts = [p for p in urlsplit(response.headers.get('Location', '')).path.split('/') if p]
+    return parts[1] if len(parts) == 2 and parts[0] == 'order' else None
+
+
+class Journey:
+    """One buyer's path through one store. run() returns (order_ref, payment_type) or None."""
+
+    def __init__(self, runner, store, rng):
+        self.runner   = runner
+        self.target   = runner.target
+        self.recorder = runner.recorder
+        self.store    = store
+        self.rng      = rng
+        self.buyer    = _csrf_session()
+
+    def _step(self, step, session, method, path, expect=(200,), check=None, **kwargs):
+        """
+        Timed request; returns the response, or None after recording an error.
+        `check(response)` may return an error string for a response whose
+        status was expected but whose content is wrong.
+        """
+        url     = path if path.startswith('http') else f'{self.target}{path}'
+        started = time.perf_counter()
+        try:
+            response = session.request(method, url, allow_redirects=False,
+                                       timeout=self.runner.timeout, **kwargs)
+        except requests.RequestException as e:
+            self.recorder.record(step, time.perf_counter() - started, type(e).__name__)
+            return None
+        elapsed = time.perf_counter() - started
+        _plain_cookies(session)
+        if response.status_code not in expect:
+            error = f'HTTP {response.status_code}'
+        else:
+            error = check(response) if check else None
+        self.recorder.record(step, elapsed, error)
+        return None if error else response
+
+    def _sent_to_gateway(self, response):
+        # initiate_payment redirects back to checkout / cart when it gives up
+        if response.headers.get('Location', '').startswith(self.runner.gateway_url):
+            return None
+        return 'not sent to gateway'
+
+    def _think(self):
+        if self.runner.think_time:
+            time.sleep(self.rng.uniform(0, self.runner.think_time))
+
+    def run(self):
+        slug, products = self.store['slug'], self.store['product_ids']
+
+        if not self._step('browse', self.buyer, 'GET', f'/{slug}/'):
+            return None
+        self._step('page_view', self.buyer, 'POST', f'/api/seller/{slug}/view/', expect=(204,))
+        self._think()
+        self._step('whatsapp_click', self.buyer, 'POST',
+                   f'/api/product/{self.rng.choice(products)}/track-whatsapp/')
+
+        cart = {
+            str(pid): {'qty': self.rng.randint(1, 2)}
+            for pid in self.rng.sample(products, min(len(products), self.rng.randint(1, 3)))
+        }
+        if not self._step('cart', self.buyer, 'GET', f'/order/{slug}/cart/'):
+            return None
+        self._think()
+        if not self._step('checkout', self.buyer, 'GET', f'/order/{slug}/checkout/'):
+            return None
+        self._think()
+
+        payment_type = 'direct' if self.rng.random() < self.runner.direct_share else 'escrow'
+        buyer_id     = self.rng.randrange(10 ** 9)
+        response     = self._step('pay', self.buyer, 'POST', f'/order/{slug}/pay/', expect=(302,),
+                                  check=self._sent_to_gateway, data={
+            'buyer_name':       f'Load Buyer {buyer_id}',
+            'buyer_email':      f'buyer{buyer_id}@loadtest.vendopage.com',
+            'buyer_phone':      f'080{buyer_id:08d}'[:11],
+            'delivery_address': f'{buyer_id % 200 + 1} Load Test Street',
+            'delivery_city':    'Lagos',
+            'cart_json':        json.dumps(cart),
+            'payment_type':     payment_type,
+        })
+        if response is None:
+            return None
+
+        # The buyer "pays" on the hosted page, which redirects back to us
+        hosted = self.buyer.get(response.headers['Location'], allow_redirects=False,
+                                timeout=self.runner.timeout)
+        query  = urlsplit(hosted.headers.get('Location', '')).query
+        response = self._step('confirm', self.buyer, 'GET', f'/order/confirm/?{query}', expect=(200, 302),
+                              check=lambda r: None if _order_ref(r) else 'no order created')
+        if response is None:
+            return None
+        order_ref = _order_ref(response)
+        self._think()
+
+        vendor = self.runner.vendor_session(self.store)
+        if not self._step('ship', vendor, 'POST', f'/dashboard/orders/{order_ref}/ship/', expect=(302,), data={
+            'courier_name':  'Load Test Logistics',
+            'tracking_info': f'LT-{order_ref[:8].upper()}',
+        }):
+            return None
+        self._think()
+        if not self._step('receive', self.buyer, 'POST', f'/order/{order_ref}/confirm-receipt/', expect=(302,)):
+            return None
+        return order_ref, payment_type
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# RUNNER
+# ─────────────────────────────────────────────────────────────────────────────
+
+class LoadRun:
+    """
+    `stores` is a list of {'slug', 'seller', 'product_ids'}; journeys pick a
+    store weighted by catalogue size, like real traffic.
+    """
+
+    def __init__(self, target, gateway_url, stores, users=10, journeys=100, seed=1,
+                 direct_share=0.2, think_time=0.0, timeout=30):
+        self.target       = target.rstrip('/')
+        self.gateway_url  = gateway_url.rstrip('/')
+        self.stores       = stores
+        self.weights      = [len(store['product_ids']) for store in stores]
+        self.users        = users
+        self.journeys     = journeys
+        self.seed         = seed
+        self.direct_share = direct_share
+        self.think_time   = think_time
+        self.timeout      = timeout
+        self.recorder     = Recorder()
+        self._vendors     = {}
+        self._vendor_lock = threading.Lock()
+
+    def vendor_session(self, store):
+        seller = store['seller']
+        with self._vendor_lock:
+            if seller.pk not in self._vendors:
+                self._vendors[seller.pk] = vendor_session(seller)
+            return self._vendors[seller.pk]
+
+    def _journey(self, index):
+        rng   = random.Random(self.seed * 1_000_003 + index)
+        store = rng.choices(self.stores, weights=self.weights)[0]
+        return Journey(self, store, rng).run()
+
+    def run_journeys(self):
+        """Run every journey; returns the escrow order refs that reached RECEIVED."""
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.users, thread_name_prefix='vu') as pool:
+            results = list(pool.map(self._journey, range(self.journeys)))
+        elapsed = time.perf_counter() - started
+        for step in STEPS[:-1]:
+            self.recorder.wall[step] = elapsed
+        self.completed = sum(1 for result in results if result)
+        self.elapsed   = elapsed
+        return [ref for ref, payment_type in filter(None, results) if payment_type == 'escrow']
+
+    def run_payouts(self, order_refs):
+        """The per-order transfer of process_payouts for each RECEIVED order."""
+        from sellers.flutterwave import FlutterwavePayment
+        from sellers.management.commands.process_payouts import Command as PayoutCommand
+        from sellers.models import Order
+
+        command = PayoutCommand(stdout=StringIO(), stderr=StringIO())
+        flw     = FlutterwavePayment()
+        orders  = (
+            Order.objects
+            .filter(order_ref__in=order_refs, status='RECEIVED', payout_triggered=False)
+            .select_related('seller', 'seller__bank_account')
+        )
+        started = time.perf_counter()
+        for order in orders:
+            step_started = time.perf_counter()
+            ok = command._execute_transfer(order, flw)
+            self.recorder.record('payout', time.perf_counter() - step_started,
+                                 None if ok else 'transfer failed')
+        self.recorder.wall['payout'] = time.perf_counter() - started
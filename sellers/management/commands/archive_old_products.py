@@ -2,6 +2,7 @@ from django.core.management.base import BaseCommand
 from django.utils import timezone
 from datetime import timedelta
 from products.models import Product
+from sellers import http_cache
 
 class Command(BaseCommand):
     help = 'Archive products older than 30 days'
@@ -9,10 +10,13 @@ class Command(BaseCommand):
     def handle(self, *args, **options):
         thirty_days_ago = timezone.now() - timedelta(days=30)
         
-        updated = Product.objects.filter(
+        expired = Product.objects.filter(
             created_at__lt=thirty_days_ago,
             is_archived=False
-        ).update(is_archived=True)
+        )
+        seller_ids = set(expired.values_list('seller_id', flat=True))
+        updated = expired.update(is_archived=True)
+        http_cache.touch_sellers(seller_ids)
         
         self.stdout.write(
             self.style.SUCCESS(f'Archived {updated} products')
@@ -0,0 +1,27 @@
+# sellers/management/commands/backfill_image_derivatives.py
+from django.core.management.base import BaseCommand
+from products.derivatives import refresh_for_seller
+from sellers import http_cache
+from sellers.models import Seller
+
+
+class Command(BaseCommand):
+    help = "Build stored thumbnail / display URLs for product images (all images, or only ones missing them)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--all', action='store_true',
+                            help="Rebuild every seller's images, not just those missing derivatives")
+
+    def handle(self, *args, **options):
+        sellers = Seller.objects.only('id', 'business_name', 'watermark_enabled').order_by('id')
+        if not options['all']:
+            sellers = sellers.filter(products__images__thumb_url='').distinct()
+
+        total, seller_ids = 0, []
+        for seller in sellers.iterator():
+            total += refresh_for_seller(seller)
+            seller_ids.append(seller.pk)
+        # bulk_update sends no signals — move the store pages' validators ourselves
+        http_cache.touch_sellers(seller_ids, directory=False)
+
+        self.stdout.write(self.style.SUCCESS(f"✅ Rebuilt derivatives for {total} image(s)."))
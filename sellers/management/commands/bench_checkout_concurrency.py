@@ -0,0 +1,179 @@
+# sellers/management/commands/bench_checkout_concurrency.py
+"""
+Concurrent-checkout capacity of ONE worker, before and after the async views.
+
+A checkout is the two requests that wait on Flutterwave: POST
+/order/<slug>/pay/ (initialize_payment) and, after the hosted page, GET
+/order/confirm/ (verify_payment + order creation). The fake gateway
+(sellers.loadtest) answers after --latency-ms, standing in for the real
+round-trip.
+
+    wsgi    Django's WSGI handler on one thread — a gunicorn sync worker:
+            one request at a time, blocked for the whole gateway call
+    asgi    Django's ASGI handler on one event loop — a uvicorn worker:
+            --concurrency checkouts in flight, the loop serves the others
+            while any of them awaits the gateway
+
+Requests go through the full middleware stack in-process (test clients), so
+the numbers exclude the HTTP server itself. "in flight" is busy time / wall
+time: how many checkouts the worker was effectively serving at once.
+
+Usage:
+    FLUTTERWAVE_BASE_URL=http://127.0.0.1:8765/v3 python manage.py bench_checkout_concurrency
+    ... bench_checkout_concurrency --checkouts 200 --concurrency 50 --latency-ms 800
+"""
+import asyncio
+import json
+import time
+from urllib.parse import urlsplit
+
+import aiohttp
+import requests
+from asgiref.sync import ThreadSensitiveContext
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test import AsyncClient, Client
+from django.test.utils import override_settings
+
+from products.models import Product
+from sellers.loadtest.gateway import FakeGateway, configured_origin
+from sellers.loadtest.traffic import percentile
+from sellers.models import Seller
+
+
+class Command(BaseCommand):
+    help = 'Checkouts per second one worker sustains, sync WSGI vs async ASGI views'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--checkouts', type=int, default=60, help='Checkouts per mode')
+        parser.add_argument('--concurrency', type=int, default=20, help='Checkouts in flight (asgi)')
+        parser.add_argument('--latency-ms', type=int, default=500, help='Fake gateway latency per call')
+        parser.add_argument('--prefix', default='load', help='generate_load_data prefix')
+        parser.add_argument('--mode', choices=['both', 'wsgi', 'asgi'], default='both')
+
+    def handle(self, *args, **options):
+        origin = configured_origin()
+        if origin is None:
+            raise CommandError(
+                "FLUTTERWAVE_BASE_URL points at live Flutterwave — point it at the fake gateway, "
+                "e.g. http://127.0.0.1:8765/v3"
+            )
+        store = self._store(options['prefix'])
+
+        address = urlsplit(origin)
+        gateway = FakeGateway(
+            host=address.hostname, port=address.port or 80, public_url=origin,
+            latency_ms=options['latency_ms'], seed=1,
+        ).start()
+
+        results = {}
+        try:
+            with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, 'testserver']):
+                if options['mode'] in ('both', 'wsgi'):
+                    results['wsgi'] = self._run_wsgi(store, options['checkouts'])
+                if options['mode'] in ('both', 'asgi'):
+                    results['asgi'] = asyncio.run(
+                        self._run_asgi(store, options['checkouts'], options['concurrency'])
+                    )
+        finally:
+            gateway.stop()
+
+        self.stdout.write(
+            f"\nGateway latency ≈{options['latency_ms']} ms per call, 2 calls per checkout\n"
+            f"{'mode':<6} {'ok':>5} {'failed':>6} {'wall s':>8} {'checkout/s':>11} "
+            f"{'p50 ms':>8} {'p95 ms':>8} {'in flight':>10}"
+        )
+        for mode, row in results.items():
+            self.stdout.write(
+                f"{mode:<6} {row['ok']:>5} {row['failed']:>6} {row['wall']:>8.2f} {row['rate']:>11.2f} "
+                f"{row['p50']:>8.0f} {row['p95']:>8.0f} {row['in_flight']:>10.1f}"
+            )
+        if len(results) == 2 and results['wsgi']['rate']:
+            self.stdout.write(self.style.SUCCESS(
+                f"\n✅ One ASGI worker: {results['asgi']['rate'] / results['wsgi']['rate']:.1f}x "
+                f"the checkouts/s of one sync worker"
+            ))
+
+    # ── setup ────────────────────────────────────────────────────
+    def _store(self, prefix):
+        seller = (
+            Seller.objects
+            .filter(username__startswith=f'{prefix}_', store_mode=True, is_active=True)
+            .filter(products__is_archived=False, products__price__gt=0)
+            .order_by('pk').first()
+        )
+        if seller is None:
+            raise CommandError(f"No store-mode seller with prefix '{prefix}' — run generate_load_data first")
+        product = Product.objects.filter(seller=seller, is_archived=False, price__gt=0).first()
+        return {'slug': seller.slug, 'cart_json': json.dumps({str(product.id): {'qty': 1}})}
+
+    @staticmethod
+    def _form(store, n):
+        return {
+            'buyer_name':       f'Bench Buyer {n}',
+            'buyer_email':      f'bench{n}@loadtest.vendopage.com',
+            'buyer_phone':      '08000000000',
+            'delivery_address': '1 Bench Street',
+            'cart_json':        store['cart_json'],
+        }
+
+    @staticmethod
+    def _summary(durations, failed, wall):
+        ordered = sorted(durations)
+        return {
+            'ok':        len(ordered),
+            'failed':    failed,
+            'wall':      wall,
+            'rate':      len(ordered) / wall if wall else 0.0,
+            'p50':       percentile(ordered, 50) * 1000,
+            'p95':       percentile(ordered, 95) * 1000,
+            'in_flight': sum(ordered) / wall if wall else 0.0,
+        }
+
+    # ── sync worker ──────────────────────────────────────────────
+    def _run_wsgi(self, store, checkouts):
+        durations, failed = [], 0
+        started = time.perf_counter()
+        for n in range(checkouts):
+            t0     = time.perf_counter()
+            client = Client()
+            pay    = client.post(f"/order/{store['slug']}/pay/", self._form(store, n))
+            if pay.status_code != 302 or '/checkout/' not in pay['Location']:
+                failed += 1
+                continue
+            hosted  = requests.get(pay['Location'], allow_redirects=False, timeout=30)
+            confirm = client.get(f"/order/confirm/?{urlsplit(hosted.headers['Location']).query}")
+            if confirm.status_code != 302 or not confirm['Location'].startswith('/order/'):
+                failed += 1
+                continue
+            durations.append(time.perf_counter() - t0)
+        return self._summary(durations, failed, time.perf_counter() - started)
+
+    # ── async worker ─────────────────────────────────────────────
+    async def _run_asgi(self, store, checkouts, concurrency):
+        durations, failed = [], 0
+        slots = asyncio.Semaphore(concurrency)
+
+        async def checkout(n, http):
+            nonlocal failed
+            async with slots:
+                t0     = time.perf_counter()
+                client = AsyncClient()
+                async with ThreadSensitiveContext():    # per request, as ASGIHandler does
+                    pay = await client.post(f"/order/{store['slug']}/pay/", self._form(store, n))
+                if pay.status_code != 302 or '/checkout/' not in pay['Location']:
+                    failed += 1
+                    return
+                async with http.get(pay['Location'], allow_redirects=False) as hosted:
+                    query = urlsplit(hosted.headers['Location']).query
+                async with ThreadSensitiveContext():
+                    confirm = await client.get(f'/order/confirm/?{query}')
+                if confirm.status_code != 302 or not confirm['Location'].startswith('/order/'):
+                    failed += 1
+                    return
+                durations.append(time.perf_counter() - t0)
+
+        started = time.perf_counter()
+        async with aiohttp.ClientSession() as http:
+            await asyncio.gather(*(checkout(n, http) for n in range(checkouts)))
+        return self._summary(durations, failed, time.perf_counter() - started)
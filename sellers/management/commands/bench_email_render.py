@@ -0,0 +1,61 @@
+# sellers/management/commands/bench_email_render.py
+"""
+Micro-benchmark: compiled email template cache vs the old disk-read +
+per-key str.replace renderer.
+
+Usage:
+    python manage.py bench_email_render
+    python manage.py bench_email_render --iterations 5000 --template weekly_summary.html
+"""
+import os
+import timeit
+
+from django.core.management.base import BaseCommand
+
+from sellers import email as email_module
+
+
+def _legacy_render(filename, context):
+    """The previous implementation, kept here only as the benchmark baseline."""
+    html = email_module._load_template(filename)
+    for key, value in context.items():
+        html = html.replace('{{' + key + '}}', str(value))
+    return html
+
+
+class Command(BaseCommand):
+    help = 'Benchmark the compiled email template cache against the legacy renderer'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=2000)
+        parser.add_argument('--template', help='Benchmark a single template (default: all)')
+
+    def handle(self, *args, **options):
+        iterations = options['iterations']
+        templates  = [options['template']] if options['template'] else sorted(
+            f for f in os.listdir(email_module.TEMPLATE_DIR) if f.endswith('.html')
+        )
+
+        total_legacy = total_compiled = 0.0
+        self.stdout.write(f"{'template':<34} {'legacy µs':>10} {'compiled µs':>12} {'speedup':>8}")
+        for filename in templates:
+            source  = email_module._load_template(filename)
+            keys    = set(email_module._PLACEHOLDER_RE.findall(source))
+            context = {key: f'<{key} value>' for key in keys}
+
+            if email_module._render(filename, context) != _legacy_render(filename, context):
+                self.stderr.write(self.style.ERROR(f'Output mismatch for {filename}'))
+
+            legacy   = timeit.timeit(lambda: _legacy_render(filename, context), number=iterations)
+            compiled = timeit.timeit(lambda: email_module._render(filename, context), number=iterations)
+            total_legacy   += legacy
+            total_compiled += compiled
+            self.stdout.write(
+                f'{filename:<34} {legacy / iterations * 1e6:>10.1f} {compiled / iterations * 1e6:>12.1f} '
+                f'{legacy / compiled:>7.1f}x'
+            )
+
+        self.stdout.write(self.style.SUCCESS(
+            f'\nTotal — legacy {total_legacy:.3f}s, compiled {total_compiled:.3f}s '
+            f'({total_legacy / total_compiled:.1f}x faster) over {iterations} renders per template'
+        ))
@@ -18,7 +18,7 @@ from datetime import timedelta
 import random
 import uuid
 
-from sellers.models import Seller, VendorBankAccount, Order, OrderItem
+from sellers.models import Seller, SellerMonthlyVolume, VendorBankAccount, Order, OrderItem
 from products.models import Product, ProductImage
 
 
@@ -241,12 +241,16 @@ class Command(BaseCommand):
             total_page_views=random.randint(2400, 5800),
             weekly_page_views=random.randint(180, 420),
             weekly_whatsapp_clicks=random.randint(60, 160),
-            monthly_volume_processed=Decimal(str(random.randint(600000, 1800000))),
             last_analytics_reset=timezone.now() - timedelta(days=2),
             watermark_enabled=True,
             password=make_password('DemoSeller2024!'),
         )
         seller.save()
+        SellerMonthlyVolume.objects.create(
+            seller=seller,
+            month=SellerMonthlyVolume.current_month(),
+            volume=Decimal(str(random.randint(600000, 1800000))),
+        )
         self.stdout.write(f'  ✓ Seller created: @{username}')
 
         # ── Bank account ─────────────────────────────────────────────────
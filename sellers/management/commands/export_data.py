@@ -0,0 +1,64 @@
+# sellers/management/commands/export_data.py
+"""
+Full CSV/JSONL export of orders, payouts or sellers for finance reconciliation.
+
+Usage:
+    python manage.py export_data orders --format csv --output orders.csv
+    python manage.py export_data payouts --payout pending
+    python manage.py export_data sellers --subscription premium --format jsonl
+
+Filters mirror the admin_dashboard list views. Rows are streamed in chunks,
+so memory stays flat regardless of table size. Without --output the export
+is written to stdout.
+"""
+import sys
+
+from django.core.management.base import BaseCommand
+
+from sellers.exports import CHUNK_SIZE, DATASETS, FORMATS, stream_export
+
+
+class Command(BaseCommand):
+    help = 'Stream a full CSV/JSONL export of orders, payouts or sellers'
+
+    def add_arguments(self, parser):
+        parser.add_argument('dataset', choices=sorted(DATASETS))
+        parser.add_argument('--format', choices=FORMATS, default='csv')
+        parser.add_argument('--output', help='File to write to (default: stdout)')
+        parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE)
+        # ── Same filters as the list views ───────────────────────────────────
+        parser.add_argument('--status', default='')
+        parser.add_argument('--payout', choices=['pending', 'sent'], default='')
+        parser.add_argument('--search', default='')
+        parser.add_argument('--subscription', default='')
+        parser.add_argument('--store-mode', choices=['on', 'off'], default='')
+        parser.add_argument('--active', choices=['1', '0'], default='')
+        parser.add_argument('--seen', choices=['24h'], default='')
+
+    def handle(self, *args, **options):
+        params = {
+            'status':       options['status'],
+            'payout':       options['payout'],
+            'search':       options['search'],
+            'subscription': options['subscription'],
+            'store_mode':   options['store_mode'],
+            'active':       options['active'],
+            'seen':         options['seen'],
+        }
+        lines = stream_export(options['dataset'], params, options['format'], options['chunk_size'])
+
+        out   = open(options['output'], 'w', newline='', encoding='utf-8') if options['output'] else sys.stdout
+        count = 0
+        try:
+            for line in lines:
+                out.write(line)
+                count += 1
+        finally:
+            if out is not sys.stdout:
+                out.close()
+
+        if options['output']:
+            rows = count - 1 if options['format'] == 'csv' else count
+            self.stderr.write(self.style.SUCCESS(
+                f"✅ Exported {rows} {options['dataset']} row(s) to {options['output']}"
+            ))
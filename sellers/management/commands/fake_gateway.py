@@ -0,0 +1,64 @@
+# sellers/management/commands/fake_gateway.py
+"""
+Run the local Flutterwave / Brevo stand-in (sellers.loadtest.gateway) in
+the foreground. Start the app with
+
+    FLUTTERWAVE_BASE_URL=http://127.0.0.1:8765/v3
+    BREVO_API_HOST=http://127.0.0.1:8765/brevo/v3
+    FLW_SECRET_HASH=loadtest
+
+Usage:
+    python manage.py fake_gateway
+    python manage.py fake_gateway --port 8765 --latency-ms 400 --failure-rate 0.02 \\
+        --webhook-url http://127.0.0.1:8000/webhook/flutterwave/order/
+"""
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from sellers.loadtest.gateway import DEFAULT_BALANCE, FakeGateway
+
+
+class Command(BaseCommand):
+    help = 'Serve a local stand-in for the Flutterwave and Brevo APIs (load tests only)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--host', default='127.0.0.1')
+        parser.add_argument('--port', type=int, default=8765)
+        parser.add_argument('--webhook-url', default='',
+                            help='Where to POST charge.completed webhooks (default: none)')
+        parser.add_argument('--webhook-delay', type=float, default=0.5,
+                            help='Seconds between the hosted-page redirect and the webhook')
+        parser.add_argument('--secret-hash', default=None,
+                            help='verif-hash sent with webhooks (default: FLW_SECRET_HASH)')
+        parser.add_argument('--latency-ms', type=int, default=0,
+                            help='Mean delay added to every API call')
+        parser.add_argument('--failure-rate', type=float, default=0.0,
+                            help='Fraction of API calls answered with a 500')
+        parser.add_argument('--balance', type=float, default=DEFAULT_BALANCE,
+                            help='Starting available balance for transfers')
+        parser.add_argument('--seed', type=int, default=None)
+
+    def handle(self, *args, **options):
+        gateway = FakeGateway(
+            host=options['host'], port=options['port'],
+            webhook_url=options['webhook_url'], webhook_delay=options['webhook_delay'],
+            secret_hash=settings.FLW_SECRET_HASH if options['secret_hash'] is None else options['secret_hash'],
+            latency_ms=options['latency_ms'], failure_rate=options['failure_rate'],
+            balance=options['balance'], seed=options['seed'],
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ Fake gateway on {gateway.public_url}\n"
+            f"   FLUTTERWAVE_BASE_URL={gateway.public_url}/v3\n"
+            f"   BREVO_API_HOST={gateway.public_url}/brevo/v3"
+        ))
+        try:
+            gateway.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            gateway.stop()
+            state = gateway.state
+            self.stdout.write(
+                f"\n{len(state.charges)} charge(s), {len(state.transfers)} transfer(s), "
+                f"{state.emails_sent} email(s) accepted"
+            )
@@ -1,4 +1,5 @@
 from django.core.management.base import BaseCommand
+from sellers import slugs
 from sellers.models import Seller
 
 
@@ -6,8 +7,8 @@ class Command(BaseCommand):
     help = 'Fix sellers without slugs'
 
     def handle(self, *args, **options):
-        sellers_without_slugs = Seller.objects.filter(slug='')
-        count = sellers_without_slugs.count()
+        sellers_without_slugs = list(Seller.objects.filter(slug='').only('id', 'business_name', 'slug'))
+        count = len(sellers_without_slugs)
         
         if count == 0:
             self.stdout.write(self.style.SUCCESS('✅ All sellers have slugs!'))
@@ -15,9 +16,12 @@ class Command(BaseCommand):
         
         self.stdout.write(f'Found {count} sellers without slugs. Fixing...')
         
-        for seller in sellers_without_slugs:
-            old_slug = seller.slug
-            seller.save()  # This triggers slug generation
+        # One allocation pass for the whole batch, then a single bulk UPDATE
+        new_slugs = slugs.allocate_many('slug', [slugs.slug_base(s.business_name) for s in sellers_without_slugs])
+        for seller, slug in zip(sellers_without_slugs, new_slugs):
+            old_slug, seller.slug = seller.slug, slug
             self.stdout.write(f'  ✓ {seller.business_name}: "{old_slug}" → "{seller.slug}"')
+        Seller.objects.bulk_update(sellers_without_slugs, ['slug'], batch_size=500)
+        slugs.invalidate(*new_slugs)
         
-        self.stdout.write(self.style.SUCCESS(f'\n✅ Fixed {count} sellers!'))
\ No newline at end of file
+        self.stdout.write(self.style.SUCCESS(f'\n✅ Fixed {count} sellers!'))
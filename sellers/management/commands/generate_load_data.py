@@ -0,0 +1,311 @@
+"""
+Management command: generate_load_data
+======================================
+Bulk-generates a production-shaped dataset for load tests and benchmarks:
+sellers, products with images, orders in every status with their items,
+reviews and disputes.
+
+Store sizes follow a Pareto distribution, so a handful of sellers own huge
+catalogues and order books while most have a few products — the shape that
+makes seller_page, the dashboards and the admin slow in production. Orders
+scale with catalogue size.
+
+Everything comes from one random.Random(seed): the same arguments always
+produce the same rows. Rows are written with bulk_create in chunks, one
+batch of sellers at a time, so memory stays flat. Image derivatives and
+seller ledgers are written with each batch; the slug set is refreshed at
+the end.
+
+Usage:
+    python manage.py generate_load_data --sellers 2000 --products 60 --orders 40
+    python manage.py generate_load_data --sellers 5000 --seed 7 --reset
+    python manage.py generate_load_data --reset --sellers 0       # just delete
+
+Generated sellers are identified by --prefix (usernames, slugs, emails), which
+is what --reset deletes. Password for all of them: LoadTest2024!
+"""
+import random
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import timedelta
+from decimal import Decimal
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from products.derivatives import derivative_urls
+from products.models import Product, ProductImage
+from sellers import ledger, slugs
+from sellers.models import Dispute, Order, OrderItem, Review, Seller, VendorBankAccount
+
+SELLER_BATCH = 200      # sellers generated (and their products/orders) per round
+FEE_PERCENT  = Decimal('5')
+HISTORY_DAYS = 365
+
+# Status mix for generated orders (weights)
+ORDER_STATUSES = {
+    'completed':     45,
+    'RECEIVED':       6,
+    'shipped':        8,
+    'paid':           8,
+    'pending':       12,
+    'delivered':      3,
+    'disputed':       3,
+    'refunded':       4,
+    'FAILED_PAYOUT':  1,
+}
+PRODUCT_WORDS = [
+    'Ankara', 'Leather', 'Silk', 'Denim', 'Linen', 'Classic', 'Premium', 'Vintage',
+    'Handmade', 'Slim-Fit', 'Oversized', 'Luxury', 'Sport', 'Casual', 'Beaded',
+]
+PRODUCT_NOUNS = [
+    'Dress', 'Sneakers', 'Handbag', 'Watch', 'Shirt', 'Gown', 'Sandals', 'Wig',
+    'Perfume', 'Agbada', 'Jersey', 'Cap', 'Earrings', 'Hoodie', 'Body Cream',
+]
+FIRST_NAMES = ['Emeka', 'Chioma', 'Tunde', 'Amaka', 'Seun', 'Ngozi', 'Chidi', 'Funmi', 'Kelechi', 'Yetunde']
+LAST_NAMES  = ['Okafor', 'Nwosu', 'Adeleke', 'Eze', 'Adebayo', 'Obi', 'Bello', 'Ibe', 'Afolabi', 'Coker']
+CITIES      = ['Lagos', 'Abuja', 'Port Harcourt', 'Ibadan', 'Enugu', 'Kano', 'Benin City', 'Owerri']
+COMMENTS    = ['Great quality!', 'Fast delivery, thank you.', 'Exactly as pictured.', 'Good, but took a while.', '']
+IMAGE_URL   = 'https://res.cloudinary.com/vendopage/image/upload/v1/loadtest/{}.jpg'
+
+
+@contextmanager
+def _manual_timestamps(*models):
+    """Let bulk_create keep the generated created_at values instead of now()."""
+    fields = [
+        field for model in models for field in model._meta.concrete_fields
+        if getattr(field, 'auto_now_add', False)
+    ]
+    for field in fields:
+        field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field in fields:
+            field.auto_now_add = True
+
+
+class Command(BaseCommand):
+    help = 'Bulk-generate a large, skewed, deterministic dataset for load testing'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sellers',  type=int, default=1000, help='Number of sellers')
+        parser.add_argument('--products', type=int, default=50, help='Mean products per seller')
+        parser.add_argument('--orders',   type=int, default=30, help='Mean orders per seller')
+        parser.add_argument('--images',   type=int, default=3, help='Max images per product')
+        parser.add_argument('--seed',     type=int, default=42)
+        parser.add_argument('--skew',     type=float, default=1.3,
+                            help='Pareto shape for store sizes — lower means a few much bigger stores')
+        parser.add_argument('--chunk',    type=int, default=5000, help='bulk_create batch size')
+        parser.add_argument('--prefix',   default='load', help='Marks generated sellers')
+        parser.add_argument('--reset',    action='store_true', help='Delete previously generated sellers first')
+
+    def handle(self, *args, **options):
+        self.rng    = random.Random(options['seed'])
+        self.chunk  = options['chunk']
+        self.prefix = options['prefix']
+        self.now    = timezone.now()
+        started     = time.monotonic()
+
+        existing = Seller.objects.filter(username__startswith=f'{self.prefix}_')
+        if options['reset']:
+            deleted, _ = existing.delete()
+            slugs.invalidate()
+            self.stdout.write(f'  Deleted {deleted} previously generated row(s)')
+        elif existing.exists():
+            raise CommandError(f"Sellers with prefix '{self.prefix}' already exist — use --reset or another --prefix")
+
+        n_sellers = options['sellers']
+        if n_sellers <= 0:
+            return
+
+        product_counts = self._skewed(n_sellers, options['products'], options['skew'])
+        order_weights  = [count + 1 for count in product_counts]
+        order_counts   = self._scaled(order_weights, n_sellers * options['orders'])
+        self.password  = make_password('LoadTest2024!')
+        self.totals    = dict.fromkeys(['sellers', 'products', 'images', 'orders', 'items', 'reviews', 'disputes'], 0)
+
+        with _manual_timestamps(Seller, Product, ProductImage, Order, Dispute, Review):
+            for start in range(0, n_sellers, SELLER_BATCH):
+                stop = min(start + SELLER_BATCH, n_sellers)
+                with transaction.atomic():
+                    self._generate_batch(
+                        range(start, stop), product_counts[start:stop], order_counts[start:stop], options['images'],
+                    )
+                rows = sum(self.totals.values())
+                self.stdout.write(f'  {stop}/{n_sellers} sellers — {rows:,} rows ({time.monotonic() - started:.0f}s)')
+
+        slugs.invalidate()
+
+        summary = ', '.join(f'{count:,} {name}' for name, count in self.totals.items())
+        self.stdout.write(self.style.SUCCESS(
+            f'✅ Generated {summary} in {time.monotonic() - started:.0f}s '
+            f'(largest store: {max(product_counts):,} products, {max(order_counts):,} orders)'
+        ))
+
+    # ── Distributions ─────────────────────────────────────────────────────
+
+    def _skewed(self, n, mean, shape):
+        """n Pareto-distributed sizes averaging `mean`, in seller order."""
+        return self._scaled([self.rng.paretovariate(shape) for _ in range(n)], n * mean)
+
+    @staticmethod
+    def _scaled(weights, total):
+        scale = total / (sum(weights) or 1)
+        return [int(weight * scale) for weight in weights]
+
+    def _moment(self, days=HISTORY_DAYS):
+        return self.now - timedelta(seconds=self.rng.randint(0, days * 86400))
+
+    def _uuid(self):
+        return str(uuid.UUID(int=self.rng.getrandbits(128), version=4))
+
+    # ── One batch of sellers with everything they own ─────────────────────
+
+    def _generate_batch(self, indexes, product_counts, order_counts, max_images):
+        rng = self.rng
+        categories = [code for code, _ in Seller.CATEGORY_CHOICES]
+        tiers      = [code for code, _ in Seller.TIER_CHOICES]
+
+        sellers = []
+        for i in indexes:
+            premium = rng.random() < 0.15
+            name    = f'{rng.choice(PRODUCT_WORDS)} {rng.choice(PRODUCT_NOUNS)} Hub {i}'
+            sellers.append(Seller(
+                username=f'{self.prefix}_{i}', email=f'{self.prefix}{i}@loadtest.vendopage.com',
+                password=self.password, business_name=name, slug=f'{self.prefix}-{i}',
+                whatsapp_number=f'299{i:010d}'[-20:], category=rng.choice(categories),
+                subscription_type='premium' if premium else 'free',
+                subscription_tier=rng.choice(tiers),
+                subscription_expires=self.now + timedelta(days=rng.randint(1, 300)) if premium else None,
+                store_mode=rng.random() < 0.4, watermark_enabled=rng.random() < 0.7,
+                is_active=rng.random() > 0.02, email_verified=rng.random() > 0.1,
+                created_at=self._moment(), last_seen=self._moment(30),
+                total_page_views=rng.randint(0, 50000), weekly_page_views=rng.randint(0, 2000),
+                weekly_whatsapp_clicks=rng.randint(0, 300),
+            ))
+        sellers = Seller.objects.bulk_create(sellers, batch_size=self.chunk)
+        VendorBankAccount.objects.bulk_create([
+            VendorBankAccount(
+                seller=seller, account_name=seller.business_name, account_number=f'{rng.randint(0, 10**10 - 1):010d}',
+                bank_name='Guaranty Trust Bank (GTB)', bank_code='058', is_verified=True,
+            )
+            for seller in sellers if seller.store_mode
+        ], batch_size=self.chunk)
+        self.totals['sellers'] += len(sellers)
+
+        # Products + images
+        products = []
+        for seller, count in zip(sellers, product_counts):
+            for _ in range(count):
+                title = f'{rng.choice(PRODUCT_WORDS)} {rng.choice(PRODUCT_NOUNS)}'
+                products.append(Product(
+                    seller=seller, name=title, description=f'{title} — load test item',
+                    price=Decimal(rng.randrange(1500, 250000, 500)),
+                    is_archived=rng.random() < 0.1, is_sold_out=rng.random() < 0.08,
+                    created_at=self._moment(), views=rng.randint(0, 3000), whatsapp_clicks=rng.randint(0, 200),
+                ))
+        products = Product.objects.bulk_create(products, batch_size=self.chunk)
+        self.totals['products'] += len(products)
+
+        images = []
+        for product in products:
+            for position in range(rng.randint(1, max_images)):
+                url = IMAGE_URL.format(self._uuid())
+                images.append(ProductImage(
+                    product=product, image_url=url, order=position, created_at=product.created_at,
+                    **derivative_urls(url, product.seller),
+                ))
+                if len(images) >= self.chunk:
+                    self.totals['images'] += len(ProductImage.objects.bulk_create(images))
+                    images = []
+        self.totals['images'] += len(ProductImage.objects.bulk_create(images))
+
+        self._generate_orders(sellers, products, order_counts)
+        ledger.rebuild([seller.id for seller in sellers])
+
+    def _generate_orders(self, sellers, products, order_counts):
+        rng      = self.rng
+        statuses = list(ORDER_STATUSES)
+        weights  = list(ORDER_STATUSES.values())
+        catalogue = {}
+        for product in products:
+            catalogue.setdefault(product.seller_id, []).append(product)
+
+        orders, lines = [], []
+        for seller, count in zip(sellers, order_counts):
+            items = catalogue.get(seller.id)
+            if not items:
+                continue
+            for status in rng.choices(statuses, weights, k=count):
+                picked   = [(rng.choice(items), rng.randint(1, 3)) for _ in range(rng.choice((1, 1, 1, 2, 3)))]
+                subtotal = sum((product.price * qty for product, qty in picked), Decimal('0'))
+                fee      = (subtotal * FEE_PERCENT / Decimal('100')).quantize(Decimal('0.01'))
+                created  = self._moment()
+                order    = Order(
+                    seller=seller, order_ref=self._uuid(), status=status,
+                    buyer_name=f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}',
+                    buyer_email=f'buyer{rng.randint(1, 10**6)}@loadtest.vendopage.com',
+                    buyer_phone=f'080{rng.randint(10**7, 10**8 - 1)}',
+                    delivery_address=f'{rng.randint(1, 200)} Loadtest Street', delivery_city=rng.choice(CITIES),
+                    subtotal=subtotal, platform_fee=fee, vendor_payout=subtotal - fee,
+                    commission_rate_applied=FEE_PERCENT, currency='NGN',
+                    payment_type='escrow' if rng.random() < 0.85 else 'direct',
+                    flutterwave_tx_ref=f'LOAD-{self.prefix}-{self._uuid()}',
+                    created_at=created,
+                    is_disputed=status == 'disputed',
+                    **self._timeline(status, created),
+                )
+                orders.append(order)
+                lines.append(picked)
+
+        orders = Order.objects.bulk_create(orders, batch_size=self.chunk)
+        self.totals['orders'] += len(orders)
+
+        order_items, reviews, disputes = [], [], []
+        for order, picked in zip(orders, lines):
+            for product, qty in picked:
+                order_items.append(OrderItem(
+                    order=order, product_id=product.id, product_name=product.name,
+                    price=product.price, quantity=qty,
+                ))
+            if order.status in ('completed', 'RECEIVED', 'delivered') and rng.random() < 0.3:
+                reviews.append(Review(
+                    order=order, seller_id=order.seller_id, rating=rng.choice((5, 5, 5, 4, 4, 3, 2, 1)),
+                    comment=rng.choice(COMMENTS), created_at=order.delivered_at or order.created_at,
+                ))
+            if order.status == 'disputed' or (order.status == 'refunded' and rng.random() < 0.5):
+                disputes.append(Dispute(
+                    order=order, reason=rng.choice([code for code, _ in Dispute.REASON_CHOICES]),
+                    buyer_message='Load test dispute', created_at=order.created_at + timedelta(days=3),
+                    status='open' if order.status == 'disputed' else 'resolved_buyer',
+                    resolved_at=None if order.status == 'disputed' else order.created_at + timedelta(days=6),
+                ))
+
+        self.totals['items']    += len(OrderItem.objects.bulk_create(order_items, batch_size=self.chunk))
+        self.totals['reviews']  += len(Review.objects.bulk_create(reviews, batch_size=self.chunk))
+        self.totals['disputes'] += len(Dispute.objects.bulk_create(disputes, batch_size=self.chunk))
+
+    def _timeline(self, status, created):
+        """Timestamps / payout flags consistent with how far the order got."""
+        if status == 'pending':
+            return {}
+        rng     = self.rng
+        paid    = created + timedelta(minutes=rng.randint(1, 120))
+        shipped = paid + timedelta(hours=rng.randint(4, 48))
+        landed  = shipped + timedelta(hours=rng.randint(12, 96))
+        fields  = {'paid_at': paid, 'payment_verified': True, 'flutterwave_tx_id': str(rng.randint(4000000, 9999999))}
+        if status in ('paid', 'refunded'):
+            return fields
+        fields.update(shipped_at=shipped, auto_release_at=shipped + timedelta(hours=72),
+                      tracking_info=f'GIG{rng.randint(100000, 999999)}', courier_name='GIG Logistics')
+        if status in ('shipped', 'disputed'):
+            return fields
+        fields['delivered_at'] = landed
+        if status == 'completed':
+            fields.update(payout_triggered=True, payout_at=landed + timedelta(hours=rng.randint(14, 30)),
+                          flutterwave_transfer_id=str(rng.randint(4000000, 9999999)))
+        return fields
@@ -0,0 +1,115 @@
+# sellers/management/commands/importtime.py
+"""
+Startup cost per module, from `python -X importtime` in a fresh interpreter.
+
+    web     django.setup() plus the URLconf — what a web worker pays before
+            its first request
+    worker  django.setup() plus the Celery app and sellers.tasks — what a
+            Celery worker (or a call_command from a task) pays
+    <name>  any dotted module, after django.setup()
+
+The first table groups self time by top-level package; the second lists
+the slowest modules by cumulative time (their imports included).
+
+Usage:
+    python manage.py importtime
+    python manage.py importtime --target worker --top 40
+    python manage.py importtime --target sellers.email --min-ms 1
+"""
+import os
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+TARGETS = {
+    'web': (
+        "from django.urls import get_resolver\n"
+        "get_resolver().url_patterns\n"
+    ),
+    'worker': (
+        "import config.celery\n"
+        "import sellers.tasks\n"
+    ),
+}
+
+
+def parse_importtime(stderr):
+    """[(module, self_us, cumulative_us, depth)] in import order."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return rows
+
+
+class Command(BaseCommand):
+    help = 'Report import time per module for the web / worker startup path'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--target', default='web',
+                            help="'web', 'worker' or a dotted module path (default: web)")
+        parser.add_argument('--top', type=int, default=25, help='Rows per table')
+        parser.add_argument('--min-ms', type=float, default=0.0,
+                            help='Hide modules cheaper than this (cumulative)')
+
+    def handle(self, *args, **options):
+        target = options['target']
+        code   = TARGETS.get(target, f"import {target}\n")
+        script = (
+            "import os, django\n"
+            f"os.environ.setdefault('DJANGO_SETTINGS_MODULE', {settings.SETTINGS_MODULE!r})\n"
+            "django.setup()\n"
+            + code
+        )
+
+        started = time.perf_counter()
+        result  = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', script],
+            capture_output=True, text=True, env=os.environ.copy(),
+        )
+        wall = time.perf_counter() - started
+        if result.returncode != 0:
+            raise CommandError(f"Import of '{target}' failed:\n{result.stderr[-2000:]}")
+
+        rows = parse_importtime(result.stderr)
+        if not rows:
+            raise CommandError('No -X importtime output — is this CPython 3.7+?')
+
+        by_package = defaultdict(lambda: [0, 0])
+        for name, self_us, _, _ in rows:
+            package = by_package[name.split('.')[0]]
+            package[0] += self_us
+            package[1] += 1
+        total_us = sum(self_us for _, self_us, _, _ in rows)
+
+        self.stdout.write(
+            f"\n{target}: {len(rows)} modules, {total_us / 1000:.0f} ms importing "
+            f"({wall * 1000:.0f} ms wall, interpreter start included)\n"
+        )
+        self.stdout.write(f"{'package':<32} {'modules':>8} {'self ms':>9} {'share':>7}")
+        for package, (self_us, count) in sorted(by_package.items(), key=lambda kv: -kv[1][0])[:options['top']]:
+            self.stdout.write(
+                f"{package:<32} {count:>8} {self_us / 1000:>9.1f} {self_us / total_us:>7.1%}"
+            )
+
+        slowest = sorted(
+            (row for row in rows if row[2] / 1000 >= options['min_ms']),
+            key=lambda row: -row[2],
+        )[:options['top']]
+        self.stdout.write(f"\n{'module':<48} {'self ms':>9} {'cumul ms':>9}")
+        for name, self_us, cumulative_us, _ in slowest:
+            self.stdout.write(f"{name:<48} {self_us / 1000:>9.1f} {cumulative_us / 1000:>9.1f}")
+
+        loaded = {name for name, *_ in rows}
+        lazy   = [m for m in ('sib_api_v3_sdk', 'aiohttp', 'requests') if m in loaded]
+        self.stdout.write(self.style.SUCCESS(
+            f"\n✅ {target}: {total_us / 1000:.0f} ms in imports"
+            + (f" — loaded eagerly: {', '.join(lazy)}" if lazy else '')
+        ))
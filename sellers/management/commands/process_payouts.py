@@ -19,7 +19,8 @@ Payout Logic
 4. Walk the queue oldest-first:
       - Running balance check: if remaining spendable < this order's vendor_payout → SKIP
       - Send vendor_payout via Flutterwave Transfer API (already net of 5% — stored at checkout)
-      - On success → status='completed', payout_triggered=True
+      - On success → transfer id + payout_triggered=True recorded, then status='completed'
+        (a bookkeeping failure after a transfer is logged critical, never FAILED_PAYOUT)
       - On gateway error → status='FAILED_PAYOUT' (retries tomorrow)
 5. The 5% platform fee NEVER moves — it already sits in our Flutterwave balance
    as accumulated revenue. The cron ONLY sends order.vendor_payout, nothing more.
@@ -46,12 +47,14 @@ from itertools import chain
 
 import requests
 from django.core.management.base import BaseCommand, CommandError
-from django.db import transaction
 from django.utils import timezone
 
 from sellers.flutterwave import FlutterwavePayment
+from sellers.metrics import timed_call
 from sellers.models import Order
+from sellers.order_states import InvalidTransition, OrderStateMachine
 from sellers.telegram import notify_telegram
+from sellers.views.payouts import record_payout
 
 logger = logging.getLogger(__name__)
 CURRENCY = "NGN"
@@ -290,6 +293,7 @@ class Command(BaseCommand):
             )
 
     # ── Flutterwave balance ────────────────────────────────────────────────────
+    @timed_call('flutterwave', 'get_balance')
     def _get_balance(self, flw: FlutterwavePayment) -> Decimal:
         try:
             resp = requests.get(
@@ -325,55 +329,49 @@ class Command(BaseCommand):
                 "PAYOUT BELOW MINIMUM | order=%s | amount=₦%s — marking completed",
                 ref_short, order.vendor_payout,
             )
-            order.payout_triggered = True
-            order.payout_at = timezone.now()
-            order.status = "completed"
-            order.save(update_fields=["payout_triggered", "payout_at", "status"])
+            record_payout(order, "", source="payout_run")
             return True  # don't retry — it will never pass ₦100 minimum
 
         try:
-            with transaction.atomic():
-                result = flw.transfer_to_vendor(order)
+            result = flw.transfer_to_vendor(order)
+        except Exception as exc:
+            result = {"status": "error", "message": str(exc)}
 
-                if result.get("status") != "success":
-                    raise ValueError(f"Flutterwave returned non-success: {result}")
-
-                order.payout_triggered        = True
-                order.payout_at               = timezone.now()
-                order.status                  = "completed"
-                order.flutterwave_transfer_id = str(
-                    result.get("data", {}).get("id", "")
-                )
-                order.save(update_fields=[
-                    "payout_triggered", "payout_at",
-                    "status", "flutterwave_transfer_id",
-                ])
-
-            self.stdout.write(self.style.SUCCESS(
-                f"  ✅ Paid — FLW transfer id: {order.flutterwave_transfer_id}"
-            ))
-            logger.info(
-                "PAYOUT SUCCESS | order=%s | seller=%s | amount=₦%s | "
-                "confirmed_at=%s | transfer_id=%s",
-                ref_short, order.seller.business_name,
-                order.vendor_payout, order.delivered_at,
-                order.flutterwave_transfer_id,
-            )
-            return True
-
-        except (requests.RequestException, ValueError, Exception) as exc:
+        if result.get("status") != "success":
             logger.error(
                 "PAYOUT FAILED | order=%s | seller=%s | error=%s",
-                ref_short, order.seller.business_name, exc,
-                exc_info=True,
+                ref_short, order.seller.business_name, result,
             )
-            order.status = "FAILED_PAYOUT"
-            order.save(update_fields=["status"])
+            try:
+                OrderStateMachine.transition(order, "FAILED_PAYOUT", source="payout_run")
+            except InvalidTransition as exc:
+                logger.error("PAYOUT FAILED | order=%s | not marked FAILED_PAYOUT: %s", ref_short, exc)
             self.stdout.write(self.style.ERROR(
-                f"  ❌ Transfer failed — marked FAILED_PAYOUT. Error: {exc}"
+                f"  ❌ Transfer failed — marked FAILED_PAYOUT. Error: {result}"
             ))
             return False
 
+        # The money has moved from here on — never FAILED_PAYOUT
+        transfer_id = str(result.get("data", {}).get("id", ""))
+        if not record_payout(order, transfer_id, source="payout_run"):
+            self.stdout.write(self.style.WARNING(
+                f"  ⚠  Transferred (FLW transfer id: {transfer_id}) but the order was not "
+                f"fully updated — see the critical log and reconcile by hand."
+            ))
+            return True
+
+        self.stdout.write(self.style.SUCCESS(
+            f"  ✅ Paid — FLW transfer id: {order.flutterwave_transfer_id}"
+        ))
+        logger.info(
+            "PAYOUT SUCCESS | order=%s | seller=%s | amount=₦%s | "
+            "confirmed_at=%s | transfer_id=%s",
+            ref_short, order.seller.business_name,
+            order.vendor_payout, order.delivered_at,
+            order.flutterwave_transfer_id,
+        )
+        return True
+
     def _abort(self, reason: str):
         logger.warning("PAYOUT ABORTED — %s", reason)
         self.stdout.write(self.style.ERROR(f"\n  ⚠  ABORT: {reason}\n"))
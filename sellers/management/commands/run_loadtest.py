@@ -0,0 +1,154 @@
+# sellers/management/commands/run_loadtest.py
+"""
+Drive scripted buyer / vendor traffic at a running server and report
+throughput and p50/p95/p99 per step (see sellers.loadtest.traffic).
+
+Stores come from generate_load_data (--prefix): store-mode sellers with a
+payout account and priced products. Both the server and this command must
+be configured for the stand-in gateway (sellers.loadtest) — the command
+refuses to run while FLUTTERWAVE_BASE_URL is the live API, since the payout
+step sends transfers.
+
+Usage:
+    python manage.py generate_load_data --sellers 500
+    python manage.py run_loadtest --start-gateway --users 20 --journeys 500
+    python manage.py run_loadtest --target http://127.0.0.1:8000 --think-time 1 --json report.json
+"""
+import json
+import random
+from collections import defaultdict
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from products.models import Product
+from sellers.loadtest.gateway import FakeGateway, configured_origin
+from sellers.loadtest.traffic import LoadRun
+from sellers.models import Seller
+
+
+class Command(BaseCommand):
+    help = 'Load-test browse → checkout → payout against a running server and the fake gateway'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--target', default='http://127.0.0.1:8000', help='Server under test')
+        parser.add_argument('--users', type=int, default=10, help='Concurrent virtual users')
+        parser.add_argument('--journeys', type=int, default=100, help='Buyer journeys in total')
+        parser.add_argument('--stores', type=int, default=50, help='Stores to spread traffic over')
+        parser.add_argument('--prefix', default='load', help='generate_load_data prefix')
+        parser.add_argument('--seed', type=int, default=1)
+        parser.add_argument('--direct-share', type=float, default=0.2,
+                            help='Fraction of checkouts using Direct Pay instead of escrow')
+        parser.add_argument('--think-time', type=float, default=0.0,
+                            help='Max seconds a user pauses between steps')
+        parser.add_argument('--timeout', type=float, default=30.0)
+        parser.add_argument('--no-payout', action='store_true', help='Skip the payout step')
+        parser.add_argument('--start-gateway', action='store_true',
+                            help='Serve the fake gateway from this process at FLUTTERWAVE_BASE_URL')
+        parser.add_argument('--latency-ms', type=int, default=0, help='Gateway latency (with --start-gateway)')
+        parser.add_argument('--failure-rate', type=float, default=0.0,
+                            help='Gateway failure rate (with --start-gateway)')
+        parser.add_argument('--json', help='Also write the report to this file')
+
+    def handle(self, *args, **options):
+        gateway_url = configured_origin()
+        if gateway_url is None:
+            raise CommandError(
+                "FLUTTERWAVE_BASE_URL points at live Flutterwave — set it to the fake gateway "
+                "(e.g. http://127.0.0.1:8765/v3) here and on the server under test"
+            )
+
+        stores = self._stores(options)
+        if not stores:
+            raise CommandError(
+                f"No store-mode sellers with prefix '{options['prefix']}' and priced products — "
+                f"run generate_load_data first"
+            )
+
+        gateway = None
+        if options['start_gateway']:
+            origin  = urlsplit(gateway_url)
+            gateway = FakeGateway(
+                host=origin.hostname, port=origin.port or 80, public_url=gateway_url,
+                webhook_url=f"{options['target'].rstrip('/')}/webhook/flutterwave/order/",
+                secret_hash=settings.FLW_SECRET_HASH,
+                latency_ms=options['latency_ms'], failure_rate=options['failure_rate'],
+                seed=options['seed'],
+            ).start()
+
+        run = LoadRun(
+            options['target'], gateway_url, stores,
+            users=options['users'], journeys=options['journeys'], seed=options['seed'],
+            direct_share=options['direct_share'], think_time=options['think_time'],
+            timeout=options['timeout'],
+        )
+        self.stdout.write(
+            f"Running {options['journeys']} journeys with {options['users']} users "
+            f"over {len(stores)} stores → {run.target}"
+        )
+        try:
+            received = run.run_journeys()
+            if received and not options['no_payout']:
+                self.stdout.write(f"Paying out {len(received)} escrow order(s)…")
+                run.run_payouts(received)
+        finally:
+            if gateway is not None:
+                gateway.stop()
+
+        rows = run.recorder.rows()
+        self._print(rows, run)
+        if options['json']:
+            with open(options['json'], 'w') as fh:
+                json.dump({
+                    'journeys':  options['journeys'],
+                    'completed': run.completed,
+                    'users':     options['users'],
+                    'seconds':   round(run.elapsed, 3),
+                    'steps':     rows,
+                    'errors':    [{'step': step, 'error': error, 'count': count}
+                                  for (step, error), count in sorted(run.recorder.reasons.items())],
+                }, fh, indent=2)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"\n✅ {run.completed}/{options['journeys']} journeys completed in {run.elapsed:.1f}s "
+            f"({run.completed / run.elapsed:.1f} journeys/s)"
+        ))
+
+    def _stores(self, options):
+        sellers = list(
+            Seller.objects
+            .filter(username__startswith=f"{options['prefix']}_", store_mode=True, is_active=True)
+            .exclude(bank_account__bank_code='')
+            .filter(bank_account__isnull=False)
+            .order_by('pk')
+        )
+        rng     = random.Random(options['seed'])
+        sellers = rng.sample(sellers, min(options['stores'], len(sellers)))
+
+        product_ids = defaultdict(list)
+        for seller_id, product_id in (
+            Product.objects
+            .filter(seller__in=sellers, is_archived=False, price__gt=0)
+            .values_list('seller_id', 'id')
+        ):
+            product_ids[seller_id].append(product_id)
+
+        return [
+            {'slug': seller.slug, 'seller': seller, 'product_ids': product_ids[seller.pk]}
+            for seller in sellers if product_ids[seller.pk]
+        ]
+
+    def _print(self, rows, run):
+        self.stdout.write(
+            f"\n{'step':<16} {'count':>6} {'errors':>6} {'req/s':>8} "
+            f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8}"
+        )
+        for row in rows:
+            line = (
+                f"{row['step']:<16} {row['count']:>6} {row['errors']:>6} {row['rps']:>8.1f} "
+                f"{row['p50']:>8.1f} {row['p95']:>8.1f} {row['p99']:>8.1f} {row['max']:>8.1f}"
+            )
+            self.stdout.write(self.style.ERROR(line) if row['errors'] else line)
+        for (step, error), count in sorted(run.recorder.reasons.items()):
+            self.stdout.write(self.style.WARNING(f"  {step}: {error} ×{count}"))
@@ -1,8 +1,8 @@
-
 from django.core.management.base import BaseCommand
 from django.utils import timezone
 from datetime import timedelta
 from sellers.models import Seller
+from sellers.campaigns import CampaignRunner, add_runner_arguments, runner_options
 import logging
 
 logger = logging.getLogger(__name__)
@@ -28,13 +28,14 @@ class Command(BaseCommand):
             type=int,
             help='Send only to a specific seller (for testing)',
         )
+        add_runner_arguments(parser)
 
     def handle(self, *args, **options):
         from sellers.email import send_premium_expiry_warning
 
         days      = options['days']
-        dry_run   = options['dry_run']
         seller_id = options.get('seller_id')
+        run_key   = options.get('run_key') or timezone.localdate().isoformat()
 
         now        = timezone.now()
         warn_until = now + timedelta(days=days)
@@ -52,46 +53,24 @@ class Command(BaseCommand):
 
         if seller_id:
             sellers = sellers.filter(id=seller_id)
-
-        sent   = 0
-        errors = 0
-
-        for seller in sellers:
-            try:
-                days_left    = (seller.subscription_expires - now).days
-                expires_date = seller.subscription_expires.strftime('%B %d, %Y')
-
-                if dry_run:
-                    self.stdout.write(
-                        f'[DRY RUN] Would warn {seller.email} — '
-                        f'expires {expires_date} ({days_left} days left)'
-                    )
-                    sent += 1
-                    continue
-
-                success = send_premium_expiry_warning(
-                    to_email=seller.email,
-                    business_name=seller.business_name,
-                    expires_date=expires_date,
-                    days_left=days_left,
-                )
-
-                if success:
-                    sent += 1
-                    self.stdout.write(
-                        f'✅ Warned {seller.email} — expires {expires_date} ({days_left} days)'
-                    )
-                else:
-                    errors += 1
-                    self.stderr.write(f'❌ Failed for {seller.email}')
-
-            except Exception as e:
-                errors += 1
-                logger.error(f"Premium expiry warning error for seller {seller.id}: {e}")
-                self.stderr.write(f'❌ Error for {seller.email}: {e}')
+            run_key = f'{run_key}:seller-{seller_id}'
+
+        def build(seller):
+            return {
+                'to_email':      seller.email,
+                'business_name': seller.business_name,
+                'expires_date':  seller.subscription_expires.strftime('%B %d, %Y'),
+                'days_left':     (seller.subscription_expires - now).days,
+            }
+
+        result = CampaignRunner(
+            campaign='premium_expiry', run_key=run_key, recipients=sellers,
+            build=build, send=send_premium_expiry_warning,
+            log=self.stdout.write, error_log=self.stderr.write, **runner_options(options),
+        ).run()
 
         self.stdout.write(
             self.style.SUCCESS(
-                f'\nDone — {sent} sent, {errors} errors'
+                f'\nDone [{run_key}] — {result.sent} sent, {result.errors} errors'
             )
-        )
\ No newline at end of file
+        )
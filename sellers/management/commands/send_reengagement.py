@@ -1,8 +1,9 @@
 from django.core.management.base import BaseCommand
 from django.utils import timezone
+from django.db.models import Count, Max, Q
 from datetime import timedelta
 from sellers.models import Seller
-from products.models import Product
+from sellers.campaigns import CampaignRunner, add_runner_arguments, runner_options
 import logging
 
 logger = logging.getLogger(__name__)
@@ -28,87 +29,64 @@ class Command(BaseCommand):
             type=int,
             help='Send only to a specific seller (for testing)',
         )
+        add_runner_arguments(parser)
 
     def handle(self, *args, **options):
         from sellers.email import send_reengagement_email
 
         days      = options['days']
-        dry_run   = options['dry_run']
         seller_id = options.get('seller_id')
+        run_key   = options.get('run_key') or timezone.localdate().isoformat()
 
-        cutoff = timezone.now() - timedelta(days=days)
+        now    = timezone.now()
+        cutoff = now - timedelta(days=days)
 
+        # Presence is queued in the cache — write it out before reading last_seen.
+        from sellers.presence import flush
+        flush()
+
+        # One query selects exactly the recipients:
+        #   - has at least one product, latest upload older than the cutoff
+        #   - hasn't been seen on the platform since the cutoff either
+        #   - not already emailed within the last 7 days
         sellers = Seller.objects.filter(
             is_active=True,
             is_staff=False,
             is_superuser=False,
+        ).exclude(
+            last_seen__gt=cutoff,
+        ).annotate(
+            total_products=Count('products'),
+            latest_upload=Max('products__created_at'),
+        ).filter(
+            total_products__gt=0,
+            latest_upload__lte=cutoff,
+        ).filter(
+            Q(last_reengagement_sent__isnull=True) | Q(last_reengagement_sent__lte=now - timedelta(days=7))
         )
         if seller_id:
             sellers = sellers.filter(id=seller_id)
+            run_key = f'{run_key}:seller-{seller_id}'
 
-        sent    = 0
-        skipped = 0
-        errors  = 0
-
-        for seller in sellers:
-            try:
-                # Skip sellers with no products at all
-                total_products = Product.objects.filter(seller=seller).count()
-                if total_products == 0:
-                    skipped += 1
-                    continue
-
-                # Skip if uploaded recently
-                latest_product = Product.objects.filter(
-                    seller=seller
-                ).order_by('-created_at').first()
-
-                if not latest_product or latest_product.created_at > cutoff:
-                    skipped += 1
-                    continue
-
-                # Skip if already emailed within the last 7 days
-                if seller.last_reengagement_sent:
-                    days_since_last = (timezone.now() - seller.last_reengagement_sent).days
-                    if days_since_last < 7:
-                        skipped += 1
-                        continue
+        def build(seller):
+            return {
+                'to_email':      seller.email,
+                'business_name': seller.business_name,
+                'store_url':     f'https://www.vendopage.com/{seller.slug}',
+                'days_inactive': (now - seller.latest_upload).days,
+            }
 
-                days_inactive = (timezone.now() - latest_product.created_at).days
-                store_url     = f'https://www.vendopage.com/{seller.slug}'
+        def mark_sent(seller_ids):
+            Seller.objects.filter(id__in=seller_ids).update(last_reengagement_sent=timezone.now())
 
-                if dry_run:
-                    self.stdout.write(
-                        f'[DRY RUN] Would send to {seller.email} — '
-                        f'inactive for {days_inactive} days '
-                        f'(last upload: {latest_product.created_at.strftime("%Y-%m-%d")})'
-                    )
-                    sent += 1
-                    continue
-
-                success = send_reengagement_email(
-                    to_email=seller.email,
-                    business_name=seller.business_name,
-                    store_url=store_url,
-                    days_inactive=days_inactive,
-                )
-
-                if success:
-                    sent += 1
-                    seller.last_reengagement_sent = timezone.now()
-                    seller.save(update_fields=['last_reengagement_sent'])
-                    self.stdout.write(f'✅ Sent to {seller.email} ({days_inactive} days inactive)')
-                else:
-                    errors += 1
-                    self.stderr.write(f'❌ Failed for {seller.email}')
-
-            except Exception as e:
-                errors += 1
-                logger.error(f"Re-engagement email error for seller {seller.id}: {e}")
-                self.stderr.write(f'❌ Error for {seller.email}: {e}')
+        result = CampaignRunner(
+            campaign='reengagement', run_key=run_key, recipients=sellers,
+            build=build, send=send_reengagement_email, on_sent=mark_sent,
+            log=self.stdout.write, error_log=self.stderr.write, **runner_options(options),
+        ).run()
 
         self.stdout.write(
             self.style.SUCCESS(
-                f'\nDone — {sent} sent, {skipped} skipped, {errors} errors'
+                f'\nDone [{run_key}] — {result.sent} sent, {result.skipped} skipped, {result.errors} errors'
             )
-        )
\ No newline at end of file
+        )
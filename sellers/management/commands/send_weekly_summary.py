@@ -1,7 +1,7 @@
 from django.core.management.base import BaseCommand
 from django.utils import timezone
 from sellers.models import Seller
-from products.models import Product
+from sellers.campaigns import CampaignRunner, add_runner_arguments, runner_options
 from django.db.models import Count, Q
 import logging
  
@@ -22,70 +22,43 @@ class Command(BaseCommand):
             type=int,
             help='Send only to a specific seller (for testing)',
         )
+        add_runner_arguments(parser)
  
     def handle(self, *args, **options):
         from sellers.email import send_weekly_summary_email
  
-        dry_run   = options['dry_run']
         seller_id = options.get('seller_id')
+        run_key   = options.get('run_key') or timezone.localdate().strftime('%G-W%V')
  
+        # One query: active product counts come back as an annotation.
+        # Sellers with 0 products and 0 views are skipped — nothing useful to report.
         sellers = Seller.objects.filter(
             is_active=True, is_staff=False, is_superuser=False
-        )
+        ).annotate(
+            active_products=Count('products', filter=Q(products__is_archived=False, products__is_sold_out=False))
+        ).exclude(active_products=0, weekly_page_views=0)
         if seller_id:
             sellers = sellers.filter(id=seller_id)
- 
-        sent  = 0
-        skipped = 0
-        errors  = 0
- 
-        for seller in sellers:
-            try:
-                active_products = Product.objects.filter(
-                    seller=seller, is_archived=False, is_sold_out=False
-                ).count()
- 
-                # Skip sellers with 0 products — nothing useful to report
-                if active_products == 0 and seller.weekly_page_views == 0:
-                    skipped += 1
-                    continue
- 
-                store_url = f'https://www.vendopage.com/{seller.slug}'
- 
-                if dry_run:
-                    self.stdout.write(
-                        f'[DRY RUN] Would send to {seller.email} — '
-                        f'{seller.weekly_page_views} views, '
-                        f'{seller.weekly_whatsapp_clicks} WA clicks, '
-                        f'{active_products} products'
-                    )
-                    sent += 1
-                    continue
- 
-                success = send_weekly_summary_email(
-                    to_email=seller.email,
-                    business_name=seller.business_name,
-                    store_url=store_url,
-                    page_views=seller.weekly_page_views,
-                    whatsapp_clicks=seller.weekly_whatsapp_clicks,
-                    active_products=active_products,
-                )
- 
-                if success:
-                    sent += 1
-                    self.stdout.write(f'✅ Sent to {seller.email}')
-                else:
-                    errors += 1
-                    self.stderr.write(f'❌ Failed for {seller.email}')
- 
-            except Exception as e:
-                errors += 1
-                logger.error(f"Weekly summary error for seller {seller.id}: {e}")
-                self.stderr.write(f'❌ Error for {seller.email}: {e}')
+            run_key = f'{run_key}:seller-{seller_id}'
+ 
+        def build(seller):
+            return {
+                'to_email':        seller.email,
+                'business_name':   seller.business_name,
+                'store_url':       f'https://www.vendopage.com/{seller.slug}',
+                'page_views':      seller.weekly_page_views,
+                'whatsapp_clicks': seller.weekly_whatsapp_clicks,
+                'active_products': seller.active_products,
+            }
+ 
+        result = CampaignRunner(
+            campaign='weekly_summary', run_key=run_key, recipients=sellers,
+            build=build, send=send_weekly_summary_email,
+            log=self.stdout.write, error_log=self.stderr.write, **runner_options(options),
+        ).run()
  
         self.stdout.write(
             self.style.SUCCESS(
-                f'\nDone — {sent} sent, {skipped} skipped, {errors} errors'
+                f'\nDone [{run_key}] — {result.sent} sent, {result.skipped} skipped, {result.errors} errors'
             )
         )
- 
\ No newline at end of file
@@ -0,0 +1,25 @@
+# sellers/management/commands/trace_sql.py
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from sellers import sqltrace
+
+
+class Command(BaseCommand):
+    help = (
+        "Run another management command under a SQL trace and log repeated / slow "
+        "query shapes as JSON, e.g. `manage.py trace_sql send_weekly_summary --dry-run`."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('command_name')
+        parser.add_argument('command_args', nargs='...')
+
+    def handle(self, *args, **options):
+        name = options['command_name']
+        with sqltrace.trace(f'command:{name}', args=options['command_args']) as collector:
+            call_command(name, *options['command_args'])
+
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ {name}: {collector.queries} queries, {len(collector.shapes)} distinct shape(s), "
+            f"{collector.sql_ms:.0f} ms in SQL."
+        ))
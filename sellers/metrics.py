@@ -0,0 +1,227 @@
+# sellers/metrics.py
+"""
+Prometheus metrics.
+
+    observe_request         request latency by URL name, plus DB query count
+                            and SQL time per view (fed by config.middleware.MetricsMiddleware)
+    @timed_call(service)    latency / outcome of outbound calls — every
+                            FlutterwavePayment / AsyncFlutterwavePayment
+                            method and the Brevo sender
+    connect_celery_signals  task duration and queue lag (publish → start),
+                            served by the worker itself on CELERY_METRICS_PORT
+    metrics_view            /metrics, behind METRICS_TOKEN (or a staff session)
+
+Multiprocess: when PROMETHEUS_MULTIPROC_DIR is set (gunicorn with several
+workers, see config/gunicorn.conf.py) prometheus_client writes samples to
+files in that directory and metrics_view aggregates them per scrape.
+
+Celery samples are recorded in the worker, not in the web processes, so the
+worker exposes them on its own port: with CELERY_METRICS_PORT set, the main
+worker process starts prometheus_client's HTTP server before the pool forks.
+A prefork pool records in its child processes, so run the worker with its
+own PROMETHEUS_MULTIPROC_DIR (not the web one); the server aggregates the
+children's files like metrics_view does. Scrape it on the private network —
+the port has no token.
+"""
+import functools
+import inspect
+import os
+import time
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, CollectorRegistry, Counter, Gauge, Histogram, REGISTRY,
+    generate_latest, multiprocess,
+)
+
+QUERY_BUCKETS = (1, 2, 5, 10, 20, 35, 50, 100, 200, 500)
+
+REQUEST_LATENCY = Histogram(
+    'vendopage_request_seconds', 'Request latency by URL name',
+    ['view', 'method', 'status'],
+)
+REQUEST_QUERIES = Histogram(
+    'vendopage_request_db_queries', 'SQL queries issued per request',
+    ['view'], buckets=QUERY_BUCKETS,
+)
+REQUEST_SQL_TIME = Histogram(
+    'vendopage_request_db_seconds', 'Time spent in SQL per request',
+    ['view'],
+)
+OUTBOUND_LATENCY = Histogram(
+    'vendopage_outbound_seconds', 'Latency of calls to third-party APIs',
+    ['service', 'operation', 'outcome'],
+)
+TASK_DURATION = Histogram(
+    'vendopage_celery_task_seconds', 'Celery task run time',
+    ['task', 'state'], buckets=(.05, .1, .5, 1, 5, 15, 30, 60, 120, 300, 600, 1800),
+)
+TASK_QUEUE_LAG = Gauge(
+    'vendopage_celery_task_queue_lag_seconds', 'Seconds between publish and start of the last run',
+    ['task'], multiprocess_mode='mostrecent',
+)
+TASKS_IN_FLIGHT = Gauge(
+    'vendopage_celery_tasks_in_flight', 'Tasks currently executing',
+    ['task'], multiprocess_mode='livesum',
+)
+TASK_FAILURES = Counter(
+    'vendopage_celery_task_failures', 'Celery task failures',
+    ['task'],
+)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# REQUESTS
+# ─────────────────────────────────────────────────────────────────────────────
+
+def view_label(request):
+    match = getattr(request, 'resolver_match', None)
+    return (match.view_name if match else None) or '<unmatched>'
+
+
+def observe_request(request, response, elapsed, queries, sql_seconds):
+    view = view_label(request)
+    REQUEST_LATENCY.labels(view, request.method, f'{response.status_code // 100}xx').observe(elapsed)
+    REQUEST_QUERIES.labels(view).observe(queries)
+    REQUEST_SQL_TIME.labels(view).observe(sql_seconds)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# OUTBOUND CALLS
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _outcome(result):
+    """These clients report failure by return value rather than by raising."""
+    if result is False:
+        return 'error'
+    if isinstance(result, dict) and result.get('status') == 'error':
+        return 'error'
+    return 'ok'
+
+
+def timed_call(service, operation=None):
+    """
+    Decorator: record the wrapped call in OUTBOUND_LATENCY (operation defaults
+    to the function name). Works on coroutine functions too.
+    """
+    def decorate(func):
+        name = operation or func.__name__
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                started = time.perf_counter()
+                outcome = 'exception'
+                try:
+                    result  = await func(*args, **kwargs)
+                    outcome = _outcome(result)
+                    return result
+                finally:
+                    OUTBOUND_LATENCY.labels(service, name, outcome).observe(time.perf_counter() - started)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            outcome = 'exception'
+            try:
+                result  = func(*args, **kwargs)
+                outcome = _outcome(result)
+                return result
+            finally:
+                OUTBOUND_LATENCY.labels(service, name, outcome).observe(time.perf_counter() - started)
+        return wrapper
+    return decorate
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# CELERY
+# ─────────────────────────────────────────────────────────────────────────────
+
+_task_started = {}   # task_id → perf_counter at prerun
+
+
+def _on_publish(sender=None, headers=None, **kwargs):
+    if headers is not None:
+        headers.setdefault('published_at', time.time())
+
+
+def _on_prerun(task_id=None, task=None, **kwargs):
+    _task_started[task_id] = time.perf_counter()
+    TASKS_IN_FLIGHT.labels(task.name).inc()
+    published_at = task.request.get('published_at')
+    if published_at:
+        TASK_QUEUE_LAG.labels(task.name).set(max(0.0, time.time() - float(published_at)))
+
+
+def _on_postrun(task_id=None, task=None, state=None, **kwargs):
+    started = _task_started.pop(task_id, None)
+    TASKS_IN_FLIGHT.labels(task.name).dec()
+    if started is not None:
+        TASK_DURATION.labels(task.name, state or 'UNKNOWN').observe(time.perf_counter() - started)
+
+
+def _on_failure(sender=None, **kwargs):
+    TASK_FAILURES.labels(getattr(sender, 'name', 'unknown')).inc()
+
+
+def _on_worker_init(sender=None, **kwargs):
+    """Main worker process, before the pool forks: start the exporter."""
+    import logging
+    import shutil
+    from django.conf import settings
+    from prometheus_client import start_http_server
+
+    port = settings.CELERY_METRICS_PORT
+    if not port:
+        return
+    multiproc_dir = os.environ.get('PROMETHEUS_MULTIPROC_DIR')
+    if multiproc_dir:
+        # Same rule as gunicorn: the directory must be empty at startup
+        shutil.rmtree(multiproc_dir, ignore_errors=True)
+        os.makedirs(multiproc_dir, exist_ok=True)
+    elif 'prefork' in str(getattr(sender, 'pool_cls', 'prefork')):
+        logging.getLogger(__name__).warning(
+            "CELERY_METRICS_PORT is set without PROMETHEUS_MULTIPROC_DIR — "
+            "samples recorded in prefork children will not be served"
+        )
+    start_http_server(port, registry=_registry())
+
+
+def _on_worker_process_shutdown(pid=None, **kwargs):
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        multiprocess.mark_process_dead(pid or os.getpid())
+
+
+def connect_celery_signals():
+    from celery import signals
+    signals.before_task_publish.connect(_on_publish, weak=False)
+    signals.task_prerun.connect(_on_prerun, weak=False)
+    signals.task_postrun.connect(_on_postrun, weak=False)
+    signals.task_failure.connect(_on_failure, weak=False)
+    signals.worker_init.connect(_on_worker_init, weak=False)
+    signals.worker_process_shutdown.connect(_on_worker_process_shutdown, weak=False)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# EXPOSITION
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _registry():
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return registry
+    return REGISTRY
+
+
+def metrics_view(request):
+    import hmac
+    from django.conf import settings
+    from django.http import Http404, HttpResponse
+
+    token   = settings.METRICS_TOKEN
+    bearer  = request.headers.get('Authorization', '').removeprefix('Bearer ').strip()
+    allowed = (token and hmac.compare_digest(bearer.encode(), token.encode())) or request.user.is_staff
+    if not allowed:
+        raise Http404
+    return HttpResponse(generate_latest(_registry()), content_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,45 @@
+# Generated by Django 5.2.2 on 2026-10-19 15:39
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sellers', '0006_seller_last_reengagement_sent'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PlatformSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('taken_at', models.DateTimeField(db_index=True, default=django.utils.timezone.now)),
+                ('day', models.DateField(help_text='Local date the day-window figures below refer to.')),
+                ('is_day_close', models.BooleanField(default=False)),
+                ('total_sellers', models.PositiveIntegerField(default=0)),
+                ('premium_sellers', models.PositiveIntegerField(default=0)),
+                ('total_products', models.PositiveIntegerField(default=0)),
+                ('total_page_views', models.PositiveBigIntegerField(default=0)),
+                ('open_disputes', models.PositiveIntegerField(default=0)),
+                ('pending_payouts', models.PositiveIntegerField(default=0)),
+                ('new_sellers_7d', models.PositiveIntegerField(default=0)),
+                ('new_sellers_30d', models.PositiveIntegerField(default=0)),
+                ('new_products_7d', models.PositiveIntegerField(default=0)),
+                ('new_products_30d', models.PositiveIntegerField(default=0)),
+                ('subscription_stats', models.JSONField(blank=True, default=list)),
+                ('category_stats', models.JSONField(blank=True, default=list)),
+                ('sellers_joined', models.PositiveIntegerField(default=0)),
+                ('products_listed', models.PositiveIntegerField(default=0)),
+                ('orders_paid', models.PositiveIntegerField(default=0)),
+                ('gmv', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('fees', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('disputes_opened', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'ordering': ['-taken_at'],
+                'indexes': [models.Index(fields=['is_day_close', 'day'], name='snapshot_close_day_idx')],
+            },
+        ),
+    ]
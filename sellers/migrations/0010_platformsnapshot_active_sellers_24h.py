@@ -0,0 +1,18 @@
+# Generated by Django 5.2.2 on 2026-10-19 15:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sellers', '0009_campaigncheckpoint'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='platformsnapshot',
+            name='active_sellers_24h',
+            field=models.PositiveIntegerField(default=0, help_text='Sellers seen on the platform in the last 24h.'),
+        ),
+    ]
@@ -0,0 +1,66 @@
+# Generated by Django 5.2.2 on 2026-10-19 15:47
+
+import django.db.models.deletion
+from decimal import Decimal
+from django.conf import settings
+from django.db import migrations, models
+
+
+def copy_current_volume(apps, schema_editor):
+    """Carry each seller's running monthly_volume_processed into this month's ledger row."""
+    from django.utils import timezone
+    Seller              = apps.get_model('sellers', 'Seller')
+    SellerMonthlyVolume = apps.get_model('sellers', 'SellerMonthlyVolume')
+    month = timezone.localdate().replace(day=1)
+    SellerMonthlyVolume.objects.bulk_create(
+        [
+            SellerMonthlyVolume(seller_id=seller_id, month=month, volume=volume)
+            for seller_id, volume in Seller.objects.filter(
+                monthly_volume_processed__gt=0
+            ).values_list('id', 'monthly_volume_processed').iterator()
+        ],
+        batch_size=1000,
+    )
+
+
+def copy_volume_back(apps, schema_editor):
+    Seller              = apps.get_model('sellers', 'Seller')
+    SellerMonthlyVolume = apps.get_model('sellers', 'SellerMonthlyVolume')
+    from django.utils import timezone
+    month = timezone.localdate().replace(day=1)
+    for seller_id, volume in SellerMonthlyVolume.objects.filter(month=month).values_list('seller_id', 'volume'):
+        Seller.objects.filter(pk=seller_id).update(monthly_volume_processed=volume)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sellers', '0010_platformsnapshot_active_sellers_24h'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SellerMonthlyVolume',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('month', models.DateField(help_text='First day of the month this row covers.')),
+                ('volume', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=14)),
+                ('order_count', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('seller', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='monthly_volumes', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-month'],
+                'constraints': [models.UniqueConstraint(fields=('seller', 'month'), name='unique_seller_month_volume')],
+            },
+        ),
+        migrations.RunPython(copy_current_volume, copy_volume_back),
+        migrations.RemoveField(
+            model_name='seller',
+            name='monthly_volume_processed',
+        ),
+        migrations.RemoveField(
+            model_name='seller',
+            name='tier_reset_date',
+        ),
+    ]
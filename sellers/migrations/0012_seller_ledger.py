@@ -0,0 +1,54 @@
+# Generated by Django 5.2.2 on 2026-10-19 15:53
+
+import django.db.models.deletion
+from decimal import Decimal
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_ledger(apps, schema_editor):
+    """One GROUP BY over all orders seeds the ledger for existing sellers."""
+    from django.db.models import Count, Sum
+    Order        = apps.get_model('sellers', 'Order')
+    SellerLedger = apps.get_model('sellers', 'SellerLedger')
+    rows = (
+        Order.objects.order_by()
+        .values('seller_id', 'status', 'payout_triggered')
+        .annotate(order_count=Count('id'), total_payout=Sum('vendor_payout'))
+    )
+    SellerLedger.objects.bulk_create(
+        [
+            SellerLedger(
+                seller_id=row['seller_id'], status=row['status'], payout_triggered=row['payout_triggered'],
+                order_count=row['order_count'], total_payout=row['total_payout'] or Decimal('0'),
+            )
+            for row in rows
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sellers', '0011_seller_monthly_volume_ledger'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SellerLedger',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(max_length=20)),
+                ('payout_triggered', models.BooleanField(default=False)),
+                ('order_count', models.IntegerField(default=0)),
+                ('total_payout', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=14)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('seller', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='ledger', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('seller', 'status', 'payout_triggered'), name='unique_seller_ledger_bucket')],
+            },
+        ),
+        migrations.RunPython(backfill_ledger, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.2 on 2026-10-19 16:22
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sellers', '0012_seller_ledger'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PendingCheckout',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('tx_ref', models.CharField(max_length=200, unique=True)),
+                ('buyer_name', models.CharField(max_length=200)),
+                ('buyer_email', models.EmailField(max_length=254)),
+                ('buyer_phone', models.CharField(max_length=30)),
+                ('delivery_address', models.TextField()),
+                ('delivery_city', models.CharField(blank=True, max_length=100)),
+                ('line_items', models.JSONField(default=list)),
+                ('subtotal', models.DecimalField(decimal_places=2, max_digits=12)),
+                ('currency', models.CharField(default='NGN', max_length=10)),
+                ('payment_type', models.CharField(choices=[('escrow', 'Escrow'), ('direct', 'Direct')], default='escrow', max_length=10)),
+                ('delivery_required', models.BooleanField(default=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('seller', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='pending_checkouts', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+    ]
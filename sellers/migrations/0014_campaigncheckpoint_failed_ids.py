@@ -0,0 +1,18 @@
+# Generated by Django 5.2.2 on 2026-10-19 16:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sellers', '0013_pendingcheckout'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='campaigncheckpoint',
+            name='failed_ids',
+            field=models.JSONField(blank=True, default=list, help_text='Seller ids whose send failed; retried on the next run.'),
+        ),
+    ]
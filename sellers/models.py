@@ -1,9 +1,9 @@
 # sellers/models.py
-from decimal import Decimal
+from decimal import Decimal, InvalidOperation
 from django.db import models
 from django.contrib.auth.models import AbstractUser, UserManager
-from django.utils.text import slugify
 from django.utils import timezone
+from django.utils.functional import cached_property
 from cloudinary.models import CloudinaryField
 import uuid
 
@@ -106,14 +106,7 @@ class Seller(AbstractUser):
         max_length=10, choices=TIER_CHOICES, default='starter',
         help_text="Determines commission rate and monthly volume cap."
     )
-    monthly_volume_processed = models.DecimalField(
-        max_digits=14, decimal_places=2, default=Decimal('0.00'),
-        help_text="Total order subtotal processed this billing month."
-    )
-    tier_reset_date = models.DateField(
-        default=timezone.now,
-        help_text="Last date monthly_volume_processed was reset."
-    )
+    # Monthly processed volume lives in SellerMonthlyVolume (one row per month).
 
     is_featured = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
@@ -129,35 +122,55 @@ class Seller(AbstractUser):
     email_verified = models.BooleanField(default=False)
     email_verify_token = models.CharField(max_length=64, blank=True, null=True)
 
+    class Meta(AbstractUser.Meta):
+        # Keyset pagination on (created_at, id) — see sellers/pagination.py
+        indexes = [models.Index(fields=['created_at', 'id'], name='seller_created_id_idx')]
+
     def save(self, *args, **kwargs):
         if self.email:
             self.email = self.email.lower()
 
-        if not self.username:
-            base = slugify(self.business_name).replace('-', '_')[:25] or 'seller'
-            uname = base
-            counter = 1
-            while Seller.objects.filter(username__iexact=uname).exclude(pk=self.pk).exists():
-                uname = f"{base}_{counter}"
-                counter += 1
-            self.username = uname
-
-        if not self.slug:
-            base_slug = slugify(self.business_name)[:40]
-            if not base_slug:
-                base_slug = f"seller-{uuid.uuid4().hex[:8]}"
-
-            slug = base_slug
-            counter = 1
-            while Seller.objects.filter(slug=slug).exists():
-                slug = f"{base_slug}-{counter}"
-                counter += 1
-                if len(slug) > 50:
-                    base_slug = base_slug[:40 - len(str(counter))]
-                    slug = f"{base_slug}-{counter}"
-            self.slug = slug
+        from django.db import IntegrityError, transaction
+        from sellers import slugs
+
+        # Auto-allocated fields are re-picked if a concurrent save took the value first.
+        allocated = [field for field in ('username', 'slug') if not getattr(self, field)]
+        if not allocated:
+            super().save(*args, **kwargs)
+        for attempt in range(slugs.ALLOCATE_RETRIES if allocated else 0):
+            if 'username' in allocated:
+                self.username = slugs.allocate(
+                    'username', slugs.username_base(self.business_name), sep='_',
+                    max_length=150, exclude_pk=self.pk, case_insensitive=True,
+                )
+            if 'slug' in allocated:
+                self.slug = slugs.allocate('slug', slugs.slug_base(self.business_name))
+            try:
+                with transaction.atomic():
+                    super().save(*args, **kwargs)
+                break
+            except IntegrityError:
+                if attempt == slugs.ALLOCATE_RETRIES - 1:
+                    raise
+
+        # Keep the public slug resolver in step when this seller becomes
+        # routable, stops being routable, or changes slug.
+        old_slug, old_active = getattr(self, '_routing_state', (None, False))
+        if (old_slug if old_active else None) != (self.slug if self.is_active else None):
+            slugs.invalidate(old_slug, self.slug)
+        self._routing_state = (self.slug, self.is_active)
 
-        super().save(*args, **kwargs)
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._routing_state = (instance.__dict__.get('slug'), instance.__dict__.get('is_active'))
+        return instance
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        from sellers import slugs
+        slugs.invalidate(self.slug)
+        return result
 
     def get_product_limit(self):
         """Returns product limit based on subscription. None = unlimited"""
@@ -190,29 +203,46 @@ class Seller(AbstractUser):
     def get_tier_config(self):
         return self.TIER_CONFIG.get(self.subscription_tier, self.TIER_CONFIG['starter'])
 
-    def get_commission_rate(self, order_amount=None):
+    @property
+    def monthly_volume_processed(self):
+        """This month's processed volume, read once per instance from the ledger."""
+        if not hasattr(self, '_monthly_volume'):
+            self._monthly_volume = SellerMonthlyVolume.volume_for(self.pk)
+        return self._monthly_volume
+
+    def rate_for_volume(self, volume_before):
         """
-        Returns the platform fee % to apply to a transaction RIGHT NOW,
-        based on volume already processed this month.
+        Platform fee % for a transaction, given the volume processed this
+        month *before* it.
 
         - starter: always 5%
-        - growth/pro: tier rate, UNLESS monthly_volume_processed already
-          meets/exceeds the tier cap — then falls back to 5%.
+        - growth/pro: tier rate, UNLESS volume_before already meets/exceeds
+          the tier cap — then falls back to 5%.
         """
         config = self.get_tier_config()
 
         if self.subscription_tier == 'starter':
             return config['fee_percent']
 
-        if self.monthly_volume_processed >= config['cap']:
+        if volume_before >= config['cap']:
             return self.OVERFLOW_FEE_PERCENT
 
         return config['fee_percent']
 
+    def get_commission_rate(self, order_amount=None):
+        """Returns the platform fee % to apply to a transaction RIGHT NOW (display only)."""
+        return self.rate_for_volume(self.monthly_volume_processed)
+
     def record_volume(self, amount):
-        """Add an order's subtotal to this month's processed volume."""
-        self.monthly_volume_processed = (self.monthly_volume_processed or Decimal('0.00')) + amount
-        self.save(update_fields=['monthly_volume_processed'])
+        """
+        Atomically add an order's subtotal to this month's ledger row and
+        return the fee % for that order. The rate is derived from the value
+        the same INSERT ... ON CONFLICT ... RETURNING statement produced, so
+        concurrent orders can neither lose volume nor both slip under the cap.
+        """
+        volume_after          = SellerMonthlyVolume.add(self.pk, amount)
+        self._monthly_volume  = volume_after
+        return self.rate_for_volume(volume_after - amount)
 
     def __str__(self):
         return self.business_name
@@ -237,10 +267,129 @@ class VendorBankAccount(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
     recipient_code = models.CharField(max_length=100, blank=True)
 
+    class Meta:
+        indexes = [models.Index(fields=['created_at', 'id'], name='bankacct_created_id_idx')]
+
     def __str__(self):
         return f"{self.seller.business_name} — {self.bank_name} {self.account_number}"
 
 
+# ── Monthly volume ledger ───────────────────────────────────
+class SellerMonthlyVolume(models.Model):
+    """
+    Processed order volume per seller per calendar month (Africa/Lagos).
+    A new month simply starts a new row, so there is nothing to reset and
+    past months stay available as history.
+    """
+    seller = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='monthly_volumes'
+    )
+    month = models.DateField(help_text="First day of the month this row covers.")
+    volume = models.DecimalField(max_digits=14, decimal_places=2, default=Decimal('0.00'))
+    order_count = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['-month']
+        constraints = [
+            models.UniqueConstraint(fields=['seller', 'month'], name='unique_seller_month_volume'),
+        ]
+
+    def __str__(self):
+        return f"{self.seller_id} {self.month:%Y-%m}: {self.volume}"
+
+    @staticmethod
+    def current_month():
+        return timezone.localdate().replace(day=1)
+
+    @classmethod
+    def volume_for(cls, seller_id, month=None):
+        row = cls.objects.filter(seller_id=seller_id, month=month or cls.current_month()).values_list('volume', flat=True).first()
+        return row if row is not None else Decimal('0.00')
+
+    @classmethod
+    def add(cls, seller_id, amount, month=None):
+        """Upsert-increment this month's row and return the volume after the increment."""
+        from django.db import connection
+        table = connection.ops.quote_name(cls._meta.db_table)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                INSERT INTO {table} (seller_id, month, volume, order_count, updated_at)
+                VALUES (%s, %s, %s, 1, %s)
+                ON CONFLICT (seller_id, month) DO UPDATE
+                   SET volume      = {table}.volume + EXCLUDED.volume,
+                       order_count = {table}.order_count + 1,
+                       updated_at  = EXCLUDED.updated_at
+                RETURNING volume
+                """,
+                [
+                    seller_id,
+                    connection.ops.adapt_datefield_value(month or cls.current_month()),
+                    connection.ops.adapt_decimalfield_value(amount, 14, 2),
+                    connection.ops.adapt_datetimefield_value(timezone.now()),
+                ],
+            )
+            volume = cursor.fetchone()[0]
+        return Decimal(str(volume)).quantize(Decimal('0.01'))
+
+
+class SellerLedger(models.Model):
+    """
+    Order count and vendor payout total per seller per (status, payout_triggered)
+    bucket. Order.save()/delete() move an order between buckets as it changes;
+    bulk status updates rebuild the affected sellers (see sellers/ledger.py).
+    The transactions page reads its summary cards and tab counts from here.
+    """
+    seller = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='ledger'
+    )
+    status = models.CharField(max_length=20)
+    payout_triggered = models.BooleanField(default=False)
+    order_count = models.IntegerField(default=0)
+    total_payout = models.DecimalField(max_digits=14, decimal_places=2, default=Decimal('0.00'))
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['seller', 'status', 'payout_triggered'], name='unique_seller_ledger_bucket',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.seller_id} {self.status}/{self.payout_triggered}: {self.order_count} · {self.total_payout}"
+
+    @classmethod
+    def bump(cls, seller_id, status, payout_triggered, count, amount):
+        """Upsert-add `count` orders and `amount` payout to one bucket in a single statement."""
+        from django.db import connection
+        table = connection.ops.quote_name(cls._meta.db_table)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                INSERT INTO {table} (seller_id, status, payout_triggered, order_count, total_payout, updated_at)
+                VALUES (%s, %s, %s, %s, %s, %s)
+                ON CONFLICT (seller_id, status, payout_triggered) DO UPDATE
+                   SET order_count  = {table}.order_count + EXCLUDED.order_count,
+                       total_payout = {table}.total_payout + EXCLUDED.total_payout,
+                       updated_at   = EXCLUDED.updated_at
+                """,
+                [
+                    seller_id,
+                    status,
+                    payout_triggered,
+                    count,
+                    connection.ops.adapt_decimalfield_value(amount, 14, 2),
+                    connection.ops.adapt_datetimefield_value(timezone.now()),
+                ],
+            )
+
+
 # ── Order ────────────────────────────────────────────────────
 class Order(models.Model):
 
@@ -318,10 +467,85 @@ class Order(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes  = [
+            models.Index(fields=['created_at', 'id'], name='order_created_id_idx'),
+            models.Index(fields=['status', 'created_at', 'id'], name='order_status_created_id_idx'),
+        ]
 
     def __str__(self):
         return f"Order {self.order_ref} — {self.seller.business_name}"
 
+    # ── Seller ledger bookkeeping ───────────────────────────────
+    LEDGER_FIELDS = {'status', 'payout_triggered', 'vendor_payout'}
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        if cls.LEDGER_FIELDS.issubset(instance.__dict__):
+            instance._ledger_state = instance._current_ledger_state()
+        return instance
+
+    def _current_ledger_state(self):
+        return (self.status, self.payout_triggered, self.vendor_payout)
+
+    def save(self, *args, **kwargs):
+        from django.db import transaction
+        from sellers import ledger
+
+        update_fields = kwargs.get('update_fields')
+        old_state     = getattr(self, '_ledger_state', None)
+        new_state     = self._current_ledger_state()
+        if (update_fields is not None and not self.LEDGER_FIELDS & set(update_fields)) or (
+            old_state == new_state and not self._state.adding
+        ):
+            return super().save(*args, **kwargs)
+
+        with transaction.atomic():
+            if self._state.adding:
+                super().save(*args, **kwargs)
+                ledger.move(self.seller_id, None, new_state)
+            elif old_state is not None and ledger.update_order(
+                self.pk, dict(zip(ledger.LEDGER_FIELDS, old_state)), **dict(zip(ledger.LEDGER_FIELDS, new_state)),
+            ) is not None:
+                # The ledger fields were claimed from exactly old_state (and the
+                # bucket moved); write the rest of the row
+                super().save(*args, **kwargs)
+            else:
+                # Loaded without the ledger fields, or the row changed since it
+                # was loaded — save and recount this seller instead
+                super().save(*args, **kwargs)
+                ledger.rebuild([self.seller_id])
+        self._ledger_state = new_state
+
+    def delete(self, *args, **kwargs):
+        from django.db import transaction
+        from sellers import ledger
+        with transaction.atomic():
+            result = super().delete(*args, **kwargs)
+            ledger.rebuild([self.seller_id])
+        return result
+
+    @cached_property
+    def payout_eta(self):
+        """
+        When a RECEIVED order's payout should land: the 2 AM payout run
+        following the 24h buffer after delivery. None for other orders.
+        """
+        if self.status != 'RECEIVED' or not self.delivered_at:
+            return None
+        from datetime import timedelta
+        earliest  = self.delivered_at + timedelta(hours=24)
+        candidate = earliest.replace(hour=2, minute=0, second=0, microsecond=0)
+        if candidate < earliest:
+            candidate += timedelta(days=1)
+        return candidate
+
+    @cached_property
+    def hours_remaining(self):
+        if self.payout_eta is None:
+            return None
+        return max(0, int((self.payout_eta - timezone.now()).total_seconds() / 3600))
+
     def calculate_fees(self):
         """
         Determines platform fee % from the seller's subscription tier and
@@ -329,16 +553,14 @@ class Order(models.Model):
         tier's volume cap is reached), then records the volume processed.
         """
         seller = self.seller
-        fee_percent = seller.get_commission_rate(self.subtotal)
+        # One atomic statement records the volume and yields this order's rate;
+        # the cap check still reflects volume *before* this transaction.
+        fee_percent = seller.record_volume(self.subtotal)
 
         self.commission_rate_applied = fee_percent
         self.platform_fee = (self.subtotal * fee_percent) / Decimal('100')
         self.vendor_payout = self.subtotal - self.platform_fee
 
-        # Record volume AFTER computing this order's rate, so the cap
-        # check reflects volume *before* this transaction.
-        seller.record_volume(self.subtotal)
-
     def set_auto_release(self, hours=72):
         """Set auto-release timestamp after vendor marks shipped."""
         from datetime import timedelta
@@ -362,6 +584,50 @@ class OrderItem(models.Model):
         return f"{self.quantity}x {self.product_name}"
 
 
+# ── Pending Checkout ─────────────────────────────────────────
+class PendingCheckout(models.Model):
+    """
+    A checkout handed to Flutterwave and not paid yet, keyed by its tx_ref.
+    Whichever of order_confirmation and the order webhook arrives first turns
+    it into the paid Order and deletes it, so neither depends on the buyer's
+    session. Abandoned rows are purged by the purge_pending_checkouts task
+    after PENDING_CHECKOUT_TTL_HOURS.
+    """
+    tx_ref = models.CharField(max_length=200, unique=True)
+    seller = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='pending_checkouts'
+    )
+    buyer_name = models.CharField(max_length=200)
+    buyer_email = models.EmailField()
+    buyer_phone = models.CharField(max_length=30)
+    delivery_address = models.TextField()
+    delivery_city = models.CharField(max_length=100, blank=True)
+    # [{product_id, product_name, product_image, price, qty}], priced at checkout
+    line_items = models.JSONField(default=list)
+    subtotal = models.DecimalField(max_digits=12, decimal_places=2)
+    currency = models.CharField(max_length=10, default='NGN')
+    payment_type = models.CharField(
+        max_length=10,
+        choices=[('escrow', 'Escrow'), ('direct', 'Direct')],
+        default='escrow'
+    )
+    delivery_required = models.BooleanField(default=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    def __str__(self):
+        return f"Pending {self.tx_ref} — {self.buyer_email}"
+
+    def matches_charge(self, amount, currency):
+        """True when a Flutterwave charge covers this checkout in its currency."""
+        try:
+            charged = Decimal(str(amount))
+        except (InvalidOperation, TypeError):
+            return False
+        return charged >= self.subtotal and (currency or '').upper() == self.currency.upper()
+
+
 # ── Dispute ──────────────────────────────────────────────────
 class Dispute(models.Model):
     STATUS_CHOICES = [
@@ -392,6 +658,12 @@ class Dispute(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     resolved_at = models.DateTimeField(blank=True, null=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['created_at', 'id'], name='dispute_created_id_idx'),
+            models.Index(fields=['status', 'created_at', 'id'], name='dispute_status_created_id_idx'),
+        ]
+
     def __str__(self):
         return f"Dispute on Order {self.order.order_ref} — {self.status}"
 
@@ -411,6 +683,7 @@ class Review(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes  = [models.Index(fields=['created_at', 'id'], name='review_created_id_idx')]
 
     def __str__(self):
         return f"{self.rating}★ for {self.seller.business_name}"
@@ -442,11 +715,139 @@ class PlatformSettings(models.Model):
     def __str__(self):
         return f"Platform Settings (fee: {self.transaction_fee_percent}%, premium: ₦{self.premium_monthly_price}/mo)"
 
+    # ── Cached singleton ────────────────────────────────────────────────────
+    # Each process keeps its own copy and re-checks a shared version key at most
+    # every RECHECK_SECONDS; save()/delete() bump the version once the
+    # transaction commits, so other gunicorn workers pick up an edit within
+    # seconds. The common case costs no queries. The shared copy also expires
+    # after CACHE_TTL, which bounds the damage if a reader ever stores an old
+    # row under a new version.
+    # The version only reaches other processes through a shared cache (Redis).
+    # On the locmem fallback each process re-reads the row every
+    # RECHECK_SECONDS instead.
+    CACHE_VERSION_KEY = 'platform_settings'
+    RECHECK_SECONDS   = 5
+    CACHE_TTL         = 60 * 5
+    _local            = {'version': None, 'obj': None, 'checked_at': 0.0}
+
+    @classmethod
+    def _cache_key(cls, version):
+        return f'platform_settings:obj:{version}'
+
     @classmethod
     def get(cls):
-        obj, _ = cls.objects.get_or_create(pk=1)
-        return obj
+        import copy
+        import time
+        from django.core.cache import cache
+        from sellers.cache import is_shared, version as cache_version
+
+        local = cls._local
+        now   = time.monotonic()
+        if local['obj'] is not None and now - local['checked_at'] < cls.RECHECK_SECONDS:
+            return copy.copy(local['obj'])
+
+        if not is_shared():
+            local['obj'], _ = cls.objects.get_or_create(pk=1)
+            local['checked_at'] = now
+            return copy.copy(local['obj'])
+
+        version = cache_version(cls.CACHE_VERSION_KEY)
+        obj     = cache.get(cls._cache_key(version))
+        if obj is None:
+            obj, _ = cls.objects.get_or_create(pk=1)
+            cache.set(cls._cache_key(version), obj, cls.CACHE_TTL)
+        local['obj']        = obj
+        local['version']    = version
+        local['checked_at'] = now
+        return copy.copy(local['obj'])
+
+    @classmethod
+    def invalidate_cache(cls):
+        """Bump the version after the current transaction commits (at once outside one)."""
+        from django.db import transaction
+        from sellers.cache import bump
+
+        def invalidate():
+            bump(cls.CACHE_VERSION_KEY)
+            cls._local.update(version=None, obj=None, checked_at=0.0)
+
+        transaction.on_commit(invalidate)
 
     def save(self, *args, **kwargs):
         self.pk = 1
-        super().save(*args, **kwargs)
\ No newline at end of file
+        super().save(*args, **kwargs)
+        self.invalidate_cache()
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        self.invalidate_cache()
+        return result
+
+class PlatformSnapshot(models.Model):
+    """
+    Point-in-time platform KPIs written by the take_platform_snapshot task.
+    The admin dashboard and analytics pages read the latest row instead of
+    running their own counts. Rows with is_day_close=True hold the final
+    figures for a whole day and make up the trend history.
+    """
+    taken_at     = models.DateTimeField(default=timezone.now, db_index=True)
+    day          = models.DateField(help_text="Local date the day-window figures below refer to.")
+    is_day_close = models.BooleanField(default=False)
+
+    # ── Point-in-time totals ───────────────────────────────────────────────
+    total_sellers    = models.PositiveIntegerField(default=0)
+    premium_sellers  = models.PositiveIntegerField(default=0)
+    active_sellers_24h = models.PositiveIntegerField(default=0, help_text="Sellers seen on the platform in the last 24h.")
+    total_products   = models.PositiveIntegerField(default=0)
+    total_page_views = models.PositiveBigIntegerField(default=0)
+    open_disputes    = models.PositiveIntegerField(default=0)
+    pending_payouts  = models.PositiveIntegerField(default=0)
+    new_sellers_7d   = models.PositiveIntegerField(default=0)
+    new_sellers_30d  = models.PositiveIntegerField(default=0)
+    new_products_7d  = models.PositiveIntegerField(default=0)
+    new_products_30d = models.PositiveIntegerField(default=0)
+    subscription_stats = models.JSONField(default=list, blank=True)
+    category_stats     = models.JSONField(default=list, blank=True)
+
+    # ── Day-window figures (midnight → taken_at, or the full day when closed) ─
+    sellers_joined  = models.PositiveIntegerField(default=0)
+    products_listed = models.PositiveIntegerField(default=0)
+    orders_paid     = models.PositiveIntegerField(default=0)
+    gmv             = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    fees            = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    disputes_opened = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        ordering = ['-taken_at']
+        indexes  = [models.Index(fields=['is_day_close', 'day'], name='snapshot_close_day_idx')]
+
+    def __str__(self):
+        kind = 'close' if self.is_day_close else 'live'
+        return f"Snapshot {self.day} ({kind}) @ {self.taken_at:%H:%M}"
+
+
+class CampaignCheckpoint(models.Model):
+    """
+    Progress of one run of an email campaign (see sellers/campaigns.py).
+    Recipients are processed in ascending seller id, so last_seller_id is
+    enough to resume a crashed run without re-sending finished chunks.
+    """
+    campaign       = models.CharField(max_length=50)
+    run_key        = models.CharField(max_length=50, help_text="Identifies one run, e.g. the ISO week or date.")
+    last_seller_id = models.PositiveIntegerField(default=0)
+    sent           = models.PositiveIntegerField(default=0)
+    skipped        = models.PositiveIntegerField(default=0)
+    errors         = models.PositiveIntegerField(default=0)
+    failed_ids     = models.JSONField(default=list, blank=True, help_text="Seller ids whose send failed; retried on the next run.")
+    started_at     = models.DateTimeField(auto_now_add=True)
+    updated_at     = models.DateTimeField(auto_now=True)
+    finished_at    = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['campaign', 'run_key'], name='unique_campaign_run'),
+        ]
+
+    def __str__(self):
+        state = 'done' if self.finished_at else f'at seller {self.last_seller_id}'
+        return f"{self.campaign} [{self.run_key}] — {state}"
@@ -0,0 +1,216 @@
+# sellers/order_states.py
+"""
+Order state machine.
+
+Every status change goes through OrderStateMachine:
+
+    OrderStateMachine.transition(order, 'shipped', source='vendor',
+                                 shipped_at=now, tracking_info=...)
+    OrderStateMachine.bulk_transition(queryset, 'RECEIVED', source='auto_release',
+                                      delivered_at=F('auto_release_at'))
+
+A transition is validated against ALLOWED and applied as one conditional
+UPDATE ... WHERE status=<expected>, so two requests racing on the same order
+cannot both win and nothing is read-modify-written. The seller ledger is
+moved inside the same transaction, from the UPDATE's actual old → new state
+(sellers.ledger.update_order; a bulk transition rebuilds its sellers).
+After the transaction commits, hooks registered with
+@on_transition(to=..., source=...) run with the orders that actually moved.
+Payouts and emails hang off those instead of living in each view.
+"""
+import logging
+from dataclasses import dataclass, field
+
+from django.db import transaction
+from django.utils import timezone
+
+from sellers import ledger
+from sellers.models import Order
+
+logger = logging.getLogger(__name__)
+
+# target status → statuses it may be entered from
+ALLOWED = {
+    'paid':          {'pending'},
+    'shipped':       {'paid', 'disputed'},
+    'RECEIVED':      {'shipped'},
+    'delivered':     {'paid', 'shipped', 'disputed'},
+    'disputed':      {'paid', 'shipped'},
+    'completed':     {'paid', 'delivered', 'RECEIVED', 'FAILED_PAYOUT', 'completed'},   # paid: direct-pay checkout
+    'FAILED_PAYOUT': {'delivered', 'RECEIVED', 'FAILED_PAYOUT'},
+    'refunded':      {'pending', 'paid', 'shipped', 'RECEIVED', 'delivered', 'disputed', 'FAILED_PAYOUT', 'completed'},
+}
+
+# Only a booked payout completes an order (sellers.views.payouts.record_payout);
+# a paid-out order can never be marked failed
+GUARDS = {
+    'completed':     {'payout_triggered': True},
+    'FAILED_PAYOUT': {'payout_triggered': False},
+}
+
+
+class InvalidTransition(ValueError):
+    pass
+
+
+@dataclass
+class Transition:
+    """What a hook receives: the orders that moved to `to_status` in one call."""
+    to_status: str
+    source:    str
+    rows:      list                     # (order_id, seller_id, from_status) per moved order
+    orders:    list = field(default_factory=list)   # in-memory instances, single transitions only
+
+    @property
+    def order_ids(self):
+        return [row[0] for row in self.rows]
+
+    @property
+    def seller_ids(self):
+        return sorted({row[1] for row in self.rows})
+
+
+_hooks = []   # (callable, to_statuses or None, sources or None)
+
+
+def on_transition(to=None, source=None):
+    """
+    Register a post-transition hook. `to` / `source` may be a string or a
+    collection; None matches everything. Hooks run after the transaction
+    commits and must not raise — failures are logged.
+    """
+    def _normalise(value):
+        if value is None:
+            return None
+        return {value} if isinstance(value, str) else set(value)
+
+    def register(func):
+        _hooks.append((func, _normalise(to), _normalise(source)))
+        return func
+    return register
+
+
+def _run_hooks(result):
+    for func, to_statuses, sources in _hooks:
+        if to_statuses is not None and result.to_status not in to_statuses:
+            continue
+        if sources is not None and result.source not in sources:
+            continue
+        try:
+            func(result)
+        except Exception as e:
+            logger.error(f"Order transition hook {func.__name__} failed for {result.to_status}/{result.source}: {e}")
+
+
+def _emit(result):
+    if result.rows:
+        transaction.on_commit(lambda: _run_hooks(result))
+
+
+class OrderStateMachine:
+
+    @staticmethod
+    def can_transition(from_status, to_status):
+        return from_status in ALLOWED.get(to_status, ())
+
+    @classmethod
+    def transition(cls, order, to_status, source, **fields):
+        """
+        Move one order from its current (in-memory) status to `to_status`,
+        setting `fields` in the same UPDATE. Returns False if the row changed
+        underneath us (status no longer what we loaded); raises
+        InvalidTransition if the move is not allowed at all.
+        """
+        from_status = order.status
+        if not cls.can_transition(from_status, to_status):
+            raise InvalidTransition(f"Order {order.pk}: {from_status} → {to_status} is not allowed")
+
+        now     = timezone.now()
+        updates = {'status': to_status, 'updated_at': now, **fields}
+        where   = {'status': from_status, **GUARDS.get(to_status, {})}
+        for name in ledger.LEDGER_FIELDS:
+            if name in fields and name not in where:
+                where[name] = getattr(order, name)
+        if ledger.update_order(order.pk, where, **updates) is None:
+            logger.info(f"Order {order.pk}: {from_status} → {to_status} lost a race, skipped")
+            return False
+
+        # Mirror the UPDATE on the instance (expressions are re-read on demand)
+        expressions = [name for name, value in updates.items() if hasattr(value, 'resolve_expression')]
+        for name, value in updates.items():
+            if name not in expressions:
+                setattr(order, name, value)
+        if expressions:
+            order.refresh_from_db(fields=expressions)
+        order.__dict__.pop('payout_eta', None)
+        order.__dict__.pop('hours_remaining', None)
+        order._ledger_state = order._current_ledger_state()
+
+        _emit(Transition(to_status, source, [(order.pk, order.seller_id, from_status)], [order]))
+        return True
+
+    @classmethod
+    def bulk_transition(cls, queryset, to_status, source, **fields):
+        """
+        Move every order in `queryset` that is in an allowed source status.
+        One UPDATE per distinct source status; returns the Transition with
+        the rows that actually moved.
+        """
+        now        = timezone.now()
+        candidates = queryset.filter(status__in=ALLOWED[to_status], **GUARDS.get(to_status, {}))
+        candidates = list(candidates.order_by().values_list('id', 'seller_id', 'status'))
+
+        by_status = {}
+        for pk, _, status in candidates:
+            by_status.setdefault(status, []).append(pk)
+
+        with transaction.atomic():
+            for from_status, ids in by_status.items():
+                matched = queryset.filter(id__in=ids, status=from_status, **GUARDS.get(to_status, {}))
+                matched.update(status=to_status, updated_at=now, **fields)
+
+            # Only rows carrying this call's stamp actually moved
+            moved = set(Order.objects.filter(
+                id__in=[pk for pk, _, _ in candidates], status=to_status, updated_at=now,
+            ).values_list('id', flat=True))
+            result = Transition(to_status, source, [row for row in candidates if row[0] in moved])
+            if result.rows:
+                ledger.rebuild(result.seller_ids)
+            _emit(result)
+        return result
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# BUILT-IN HOOKS
+# ─────────────────────────────────────────────────────────────────────────────
+
+@on_transition(to='delivered', source={'confirm_receipt', 'admin', 'dispute', 'auto_release'})
+def pay_out_delivered(result):
+    """Delivered orders are paid straight away — inline for one order, queued for a batch."""
+    if result.orders:
+        from sellers.views.payouts import _trigger_payout
+        for order in result.orders:
+            _trigger_payout(order)
+    else:
+        from sellers.tasks import trigger_order_payout
+        for order_id in result.order_ids:
+            trigger_order_payout.delay(order_id)
+
+
+@on_transition(to={'delivered', 'RECEIVED'}, source='auto_release')
+def email_auto_released(result):
+    from sellers.tasks import send_order_auto_released_email
+    for order_id in result.order_ids:
+        send_order_auto_released_email.delay(order_id)
+
+
+@on_transition(to='shipped', source='vendor')
+def email_shipped(result):
+    from sellers.email import send_order_shipped_buyer
+    for order in result.orders:
+        send_order_shipped_buyer(
+            to_email=order.buyer_email, buyer_name=order.buyer_name,
+            order_ref=str(order.order_ref)[:8].upper(), seller_name=order.seller.business_name,
+            tracking_info=order.tracking_info, courier_name=order.courier_name,
+            order_url=f"https://www.vendopage.com/order/{order.order_ref}/",
+        )
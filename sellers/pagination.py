@@ -0,0 +1,122 @@
+# sellers/pagination.py
+"""
+Keyset pagination for the admin_dashboard list views.
+
+Rows are ordered newest first on (created_at, id). A page is fetched with a
+WHERE clause on that pair instead of OFFSET, so page 500 costs the same as
+page 1 and rows inserted while an admin is paging never shift the window.
+
+Cursors are opaque strings carried in ?after= (older rows) and ?before=
+(newer rows); every other query parameter — status, search, filters — is
+left untouched so the existing filters keep working across pages.
+"""
+import base64
+from datetime import datetime
+
+from django.db.models import Q
+
+DEFAULT_PER_PAGE = 50
+
+
+def encode_cursor(created_at, pk):
+    raw = f"{created_at.isoformat()}|{pk}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """Returns (created_at, pk), or None if the cursor is missing or malformed."""
+    if not cursor:
+        return None
+    try:
+        padded  = cursor + '=' * (-len(cursor) % 4)
+        ts, pk  = base64.urlsafe_b64decode(padded.encode()).decode().split('|', 1)
+        return datetime.fromisoformat(ts), int(pk)
+    except (ValueError, UnicodeDecodeError):
+        return None
+
+
+class KeysetPage:
+    def __init__(self, object_list, next_cursor, prev_cursor):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.prev_cursor = prev_cursor
+
+    @property
+    def has_next(self):
+        return self.next_cursor is not None
+
+    @property
+    def has_previous(self):
+        return self.prev_cursor is not None
+
+    @property
+    def has_other_pages(self):
+        return self.has_next or self.has_previous
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __bool__(self):
+        return bool(self.object_list)
+
+
+class KeysetPaginator:
+    """
+    paginator = KeysetPaginator(queryset, per_page=50)
+    page      = paginator.page(after=request.GET.get('after'), before=request.GET.get('before'))
+
+    `field` is the timestamp column to order on; it defaults to created_at and
+    is always paired with the primary key as a tie-breaker.
+    """
+
+    def __init__(self, queryset, per_page=DEFAULT_PER_PAGE, field='created_at'):
+        self.queryset = queryset.order_by()
+        self.per_page = per_page
+        self.field    = field
+
+    def _older_than(self, key):
+        ts, pk = key
+        return Q(**{f'{self.field}__lt': ts}) | Q(**{self.field: ts, 'pk__lt': pk})
+
+    def _newer_than(self, key):
+        ts, pk = key
+        return Q(**{f'{self.field}__gt': ts}) | Q(**{self.field: ts, 'pk__gt': pk})
+
+    def _cursor_for(self, obj):
+        return encode_cursor(getattr(obj, self.field), obj.pk)
+
+    def page(self, after=None, before=None):
+        after_key  = decode_cursor(after)
+        before_key = decode_cursor(before)
+
+        if before_key:
+            # Walk backwards (oldest→newest) from the cursor, then flip for display.
+            rows     = list(
+                self.queryset.filter(self._newer_than(before_key))
+                .order_by(self.field, 'pk')[:self.per_page + 1]
+            )
+            has_more = len(rows) > self.per_page
+            rows     = rows[:self.per_page][::-1]
+            next_cursor = self._cursor_for(rows[-1]) if rows else None
+            prev_cursor = self._cursor_for(rows[0]) if rows and has_more else None
+            return KeysetPage(rows, next_cursor, prev_cursor)
+
+        queryset = self.queryset
+        if after_key:
+            queryset = queryset.filter(self._older_than(after_key))
+        rows     = list(queryset.order_by(f'-{self.field}', '-pk')[:self.per_page + 1])
+        has_more = len(rows) > self.per_page
+        rows     = rows[:self.per_page]
+        next_cursor = self._cursor_for(rows[-1]) if rows and has_more else None
+        prev_cursor = self._cursor_for(rows[0]) if rows and after_key else None
+        return KeysetPage(rows, next_cursor, prev_cursor)
+
+
+def paginate(request, queryset, per_page=DEFAULT_PER_PAGE, field='created_at'):
+    """Shortcut for views: reads ?after= / ?before= from the request."""
+    return KeysetPaginator(queryset, per_page, field).page(
+        after=request.GET.get('after'), before=request.GET.get('before'),
+    )
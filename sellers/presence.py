@@ -0,0 +1,144 @@
+# sellers/presence.py
+"""
+Batched seller presence (last_seen) tracking.
+
+Requests call touch(). A short-lived cache key throttles each seller to one
+record per THROTTLE_SECONDS, no matter which worker serves the request or
+what request.user happened to load. A recorded timestamp is mirrored under
+a per-seller cache key for readers and queued in the shared cache: each
+record takes the next slot of an atomic counter (presence:seq) and is
+stored under presence:pending:<slot>.
+
+flush() drains the queue: every slot between the drained pointer and the
+counter is read with get_many and written with a single UPDATE ... CASE per
+DRAIN_BATCH slots. A slot whose record has expired or was evicted is skipped.
+Any process can drain, so it is not tied to the worker that recorded the
+timestamps. The flush-presence beat task runs it every minute, and readers
+that need exact figures (the KPI snapshot, the re-engagement query, the
+"seen in 24h" filter) call it first. A lock lets one drain run at a time.
+
+Without a shared cache (the locmem fallback) there is no queue another
+process could drain, so touch() writes the row directly. The throttle still
+applies.
+
+Readers that need the freshest value — the public store page, the admin
+"active sellers" figure — go through last_seen_for() / active_count(). Those
+merge the cache with the database column.
+"""
+import logging
+
+from django.core.cache import cache
+from django.db.models import Case, DateTimeField, Value, When
+from django.utils import timezone
+
+from sellers.cache import is_shared
+
+logger = logging.getLogger(__name__)
+
+THROTTLE_SECONDS = 300
+SEEN_TTL         = 60 * 60 # how long the cache mirror of a timestamp lives
+PENDING_TTL      = 60 * 60 # a queued record not drained by then is dropped
+DRAIN_BATCH      = 1000    # slots per get_many / UPDATE
+DRAIN_LOCK_TTL   = 120
+
+SEQ_KEY     = 'presence:seq'
+DRAINED_KEY = 'presence:drained'
+LOCK_KEY    = 'presence:drain-lock'
+
+
+def _throttle_key(seller_id):
+    return f'presence:throttle:{seller_id}'
+
+
+def _seen_key(seller_id):
+    return f'presence:seen:{seller_id}'
+
+
+def _pending_key(slot):
+    return f'presence:pending:{slot}'
+
+
+def _write(pending):
+    """One UPDATE for {seller_id: datetime}."""
+    from sellers.models import Seller
+    Seller.objects.filter(pk__in=pending.keys()).update(
+        last_seen=Case(
+            *[When(pk=pk, then=Value(seen)) for pk, seen in pending.items()],
+            output_field=DateTimeField(),
+        )
+    )
+
+
+def touch(seller_id, now=None):
+    """Record that `seller_id` was active. Cheap: usually a single cache add."""
+    if not cache.add(_throttle_key(seller_id), 1, THROTTLE_SECONDS):
+        return
+    now = now or timezone.now()
+    cache.set(_seen_key(seller_id), now, SEEN_TTL)
+    if not is_shared():
+        _write({seller_id: now})
+        return
+    cache.add(SEQ_KEY, 0, None)
+    slot = cache.incr(SEQ_KEY)
+    cache.set(_pending_key(slot), (seller_id, now), PENDING_TTL)
+
+
+def flush():
+    """Write every queued timestamp. Returns the number of sellers written."""
+    if not is_shared():
+        return 0
+    if not cache.add(LOCK_KEY, 1, DRAIN_LOCK_TTL):
+        return 0
+    written = 0
+    try:
+        seq     = cache.get(SEQ_KEY) or 0
+        drained = cache.get(DRAINED_KEY) or 0
+        if drained > seq:           # counter evicted and restarted
+            drained = 0
+        while drained < seq:
+            upto  = min(seq, drained + DRAIN_BATCH)
+            slots = {_pending_key(slot): slot for slot in range(drained + 1, upto + 1)}
+            found = cache.get_many(list(slots))
+            if upto == seq:
+                # A touch() between its incr and its set leaves a hole at the
+                # tail — stop before it so the next drain picks the record up
+                upto = max((slots[key] for key in found), default=drained)
+            pending = {}
+            for seller_id, seen in found.values():
+                if seller_id not in pending or seen > pending[seller_id]:
+                    pending[seller_id] = seen
+            if pending:
+                try:
+                    _write(pending)
+                except Exception as e:
+                    logger.error(f"Presence flush failed for {len(pending)} seller(s): {e}")
+                    break
+            cache.delete_many(list(found))
+            cache.set(DRAINED_KEY, upto, None)
+            written += len(pending)
+            if upto == drained:
+                break
+            drained = upto
+    finally:
+        cache.delete(LOCK_KEY)
+    return written
+
+
+def last_seen_for(seller):
+    """Freshest known last_seen for a seller instance (cache first, then the column)."""
+    cached = cache.get(_seen_key(seller.pk))
+    if cached and (seller.last_seen is None or cached > seller.last_seen):
+        return cached
+    return seller.last_seen
+
+
+def active_count(since):
+    """
+    Number of sellers seen since `since`. The shared queue is drained first,
+    so only records made while the count runs can be missing.
+    """
+    from sellers.models import Seller
+    flush()
+    return Seller.objects.filter(
+        is_staff=False, is_superuser=False, last_seen__gte=since,
+    ).count()
@@ -1,7 +1,70 @@
+# sellers/sitemaps.py
+"""
+Sharded, cached sitemaps.
+
+/sitemap.xml is a sitemap index pointing at /sitemap-<section>-<page>.xml
+shards of at most SHARD_SIZE URLs each, well under the 50k-per-file limit.
+Section querysets are values_list() rows — no model instances — and seller
+lastmod is the newest live product (falling back to the join date).
+
+Products are not listed separately. The store page is the only canonical
+URL for a product (?product=<id> opens it inside the store), and a seller's
+lastmod already moves when they add one.
+
+Shards and the index are rendered by rebuild_all() on a Celery beat schedule
+and served from the cache. A cache miss renders just the shard that was asked
+for, so a cold cache never costs more than one shard per crawler hit. Without
+a shared cache the worker's renders would never reach the web processes, so
+rebuild_all() does nothing there and every shard is rendered on demand.
+"""
+import logging
+from datetime import datetime, time
+
+from django.conf import settings
 from django.contrib.sitemaps import Sitemap
+from django.core.cache import cache
+from django.core.paginator import EmptyPage, PageNotAnInteger
+from django.db.models import Max, Q
+from django.db.models.functions import Coalesce
+from django.template.loader import render_to_string
 from django.urls import reverse
+from django.utils import timezone
+
+from . import http_cache
+from .cache import is_shared
 from .models import Seller
 
+logger = logging.getLogger(__name__)
+
+SHARD_SIZE      = 10000
+CACHE_TTL       = 60 * 60 * 3   # rebuilt hourly; the slack covers a missed run
+MISS_TTL        = 60 * 10       # shards rendered on demand expire sooner
+INDEX_CACHE_KEY = 'sitemap:index'
+
+
+def _shard_key(section, page):
+    return f'sitemap:{section}:{page}'
+
+
+class _Site:
+    """Stand-in for contrib.sites — lets shards render outside a request."""
+    def __init__(self, domain):
+        self.domain = domain
+        self.name   = domain
+
+
+def _site():
+    return _Site(settings.SITE_URL.split('://', 1)[-1].rstrip('/'))
+
+
+def _protocol():
+    return settings.SITE_URL.split('://', 1)[0] if '://' in settings.SITE_URL else 'https'
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# SECTIONS
+# ─────────────────────────────────────────────────────────────────────────────
+
 class StaticSitemap(Sitemap):
     changefreq = "daily"
     priority = 0.8
@@ -26,9 +89,103 @@ class StaticSitemap(Sitemap):
 class SellerSitemap(Sitemap):
     changefreq = "daily"
     priority = 0.9
+    limit = SHARD_SIZE
 
     def items(self):
-        return Seller.objects.filter(email_verified=True)
+        # (slug, lastmod) rows, newest live product first, join date otherwise
+        return (
+            Seller.objects.filter(email_verified=True, is_active=True)
+            .annotate(lastmod=Coalesce(
+                Max('products__created_at', filter=Q(products__is_archived=False)),
+                'created_at',
+            ))
+            .order_by('id')
+            .values_list('slug', 'lastmod')
+        )
+
+    def location(self, item):
+        return f'/{item[0]}/'
+
+    def lastmod(self, item):
+        return item[1]
+
+
+SITEMAPS = {
+    'static':   StaticSitemap,
+    'sellers':  SellerSitemap,
+}
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# RENDERING
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _shard_location(section, page):
+    return f"{settings.SITE_URL.rstrip('/')}{reverse('sitemap_section', args=[section, page])}"
+
+
+def _render_shard(sitemap, page):
+    """Returns (xml, latest lastmod) for one page of `sitemap`."""
+    urls = sitemap.get_urls(page=page, site=_site(), protocol=_protocol())
+    xml  = render_to_string('sitemap.xml', {'urlset': urls})
+    return xml, getattr(sitemap, 'latest_lastmod', None)
+
+
+def _render_index(entries):
+    return render_to_string('sitemap_index.xml', {'sitemaps': [
+        {'location': _shard_location(section, page), 'last_mod': last_mod}
+        for section, page, last_mod in entries
+    ]})
+
+
+def get_shard(section, page):
+    """Cached shard XML, rendering it on a miss. None if the shard does not exist."""
+    if section not in SITEMAPS:
+        return None
+    xml = cache.get(_shard_key(section, page))
+    if xml is not None:
+        return xml
+    try:
+        xml, _ = _render_shard(SITEMAPS[section](), page)
+    except (EmptyPage, PageNotAnInteger):
+        return None
+    cache.set(_shard_key(section, page), xml, MISS_TTL)
+    return xml
+
+
+def get_index():
+    """
+    Cached index XML. On a miss, lists every shard from the section counts
+    (one COUNT per section, no lastmod) until the next rebuild fills it in.
+    """
+    xml = cache.get(INDEX_CACHE_KEY)
+    if xml is not None:
+        return xml
+    entries = [
+        (section, page, None)
+        for section, cls in SITEMAPS.items()
+        for page in cls().paginator.page_range
+    ]
+    xml = _render_index(entries)
+    cache.set(INDEX_CACHE_KEY, xml, MISS_TTL)
+    return xml
+
 
-    def location(self, obj):
-        return f'/{obj.slug}/'
\ No newline at end of file
+def rebuild_all():
+    """Render every shard and the index into the cache. Returns the number of shards."""
+    if not is_shared():
+        logger.info("Sitemaps not pre-rendered: the cache is per process, shards render on demand")
+        return 0
+    entries = []
+    for section, cls in SITEMAPS.items():
+        sitemap = cls()
+        for page in sitemap.paginator.page_range:
+            xml, last_mod = _render_shard(sitemap, page)
+            cache.set(_shard_key(section, page), xml, CACHE_TTL)
+            if last_mod and not isinstance(last_mod, datetime):
+                last_mod = timezone.make_aware(datetime.combine(last_mod, time.min))
+            entries.append((section, page, last_mod))
+    cache.set(INDEX_CACHE_KEY, _render_index(entries), CACHE_TTL)
+    http_cache.touch('sitemaps')
+    logger.info(f"Sitemaps rebuilt: {len(entries)} shard(s)")
+    return len(entries)
@@ -0,0 +1,184 @@
+# sellers/slugs.py
+"""
+Seller slug allocation and slug → id resolution for the public store routes.
+
+Allocation: allocate() finds a free `base` / `base-N` in one query — every
+existing candidate is fetched with an anchored regex and the smallest free
+suffix is picked in Python. allocate_many() does the same for a whole batch
+of names with one query per ALLOCATE_CHUNK bases.
+
+Resolution: `<slug:slug>/` is the catch-all URL, so every bot probing a random path
+lands on seller_page. Each process keeps the set of active seller slugs in
+memory (shared through the cache under a version key, re-checked at most
+every RECHECK_SECONDS, same scheme as PlatformSettings.get()). A slug that
+is not in the set 404s without touching the database; a known slug is mapped
+to its id through a per-slug cache entry.
+
+Only stale *negatives* would be wrong, so the set is invalidated whenever a
+slug becomes routable or stops being routable: Seller.save() detects that
+itself, and bulk queryset.update()s of is_active/slug must call invalidate().
+invalidate() runs once the surrounding transaction commits. Otherwise a
+concurrent reader could reload the pre-commit rows under the new version.
+The cached set also expires after SET_TTL, as a backstop.
+A stale positive is harmless — the final fetch still filters is_active=True.
+
+All of this relies on the version bump reaching every process. On the locmem
+fallback (no shared cache) it cannot, so resolve() skips the set and the id
+cache and asks the database directly.
+"""
+import re
+import time
+import uuid
+
+from django.core.cache import cache
+from django.http import Http404
+from django.shortcuts import get_object_or_404
+from django.utils.text import slugify
+
+from sellers.cache import bump, is_shared, version as cache_version
+
+VERSION_KEY     = 'seller_slugs'
+RECHECK_SECONDS = 5
+SET_TTL         = 60 * 10
+ID_TTL          = 60 * 60
+
+ALLOCATE_RETRIES = 3      # Seller.save() re-allocates after a unique-constraint race
+ALLOCATE_CHUNK   = 200    # bases per regex query in allocate_many()
+
+_local = {'version': None, 'slugs': None, 'checked_at': 0.0}
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# ALLOCATION
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _candidates_regex(bases, sep):
+    alternatives = '|'.join(re.escape(base) for base in bases)
+    return rf'^({alternatives})({re.escape(sep)}[0-9]+)?$'
+
+
+def _taken(field, bases, sep, exclude_pk=None, case_insensitive=False):
+    """Existing values of `field` equal to any base or base<sep>N — one query."""
+    from sellers.models import Seller
+    lookup = f'{field}__iregex' if case_insensitive else f'{field}__regex'
+    rows   = Seller.objects.filter(**{lookup: _candidates_regex(bases, sep)})
+    if exclude_pk is not None:
+        rows = rows.exclude(pk=exclude_pk)
+    values = rows.values_list(field, flat=True)
+    return {value.lower() for value in values} if case_insensitive else set(values)
+
+
+def _pick(base, sep, taken, max_length, case_insensitive=False):
+    """Smallest free base / base<sep>N given the `taken` set; adds the result to it."""
+    key = str.lower if case_insensitive else str
+    candidate, n = base, 0
+    while key(candidate) in taken:
+        n += 1
+        candidate = f'{base}{sep}{n}'
+    if len(candidate) > max_length:
+        candidate = f'{base[:max_length - 9]}{sep}{uuid.uuid4().hex[:8]}'
+    taken.add(key(candidate))
+    return candidate
+
+
+def allocate(field, base, sep='-', max_length=50, exclude_pk=None, case_insensitive=False):
+    """A free value for Seller.`field` starting with `base`, found in a single query."""
+    taken = _taken(field, [base], sep, exclude_pk, case_insensitive)
+    return _pick(base, sep, taken, max_length, case_insensitive)
+
+
+def allocate_many(field, bases, sep='-', max_length=50, case_insensitive=False):
+    """
+    Free values for a batch of bases, in order. Duplicate bases within the
+    batch get distinct suffixes. One query per ALLOCATE_CHUNK distinct bases.
+    """
+    distinct = list(dict.fromkeys(bases))
+    taken    = set()
+    for i in range(0, len(distinct), ALLOCATE_CHUNK):
+        taken |= _taken(field, distinct[i:i + ALLOCATE_CHUNK], sep, None, case_insensitive)
+    return [_pick(base, sep, taken, max_length, case_insensitive) for base in bases]
+
+
+def slug_base(business_name):
+    return slugify(business_name)[:40] or f"seller-{uuid.uuid4().hex[:8]}"
+
+
+def username_base(business_name):
+    return slugify(business_name).replace('-', '_')[:25] or 'seller'
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# RESOLUTION
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _set_key(version):
+    return f'seller_slugs:set:{version}'
+
+
+def _id_key(slug):
+    return f'seller_slugs:id:{slug}'
+
+
+def known_slugs():
+    """frozenset of every active seller's slug."""
+    now = time.monotonic()
+    if _local['slugs'] is not None and now - _local['checked_at'] < RECHECK_SECONDS:
+        return _local['slugs']
+
+    version = cache_version(VERSION_KEY)
+
+    if _local['slugs'] is None or _local['version'] != version:
+        slugs = cache.get(_set_key(version))
+        if slugs is None:
+            from sellers.models import Seller
+            slugs = frozenset(Seller.objects.filter(is_active=True).values_list('slug', flat=True))
+            cache.set(_set_key(version), slugs, SET_TTL)
+        _local['slugs']   = slugs
+        _local['version'] = version
+    _local['checked_at'] = now
+    return _local['slugs']
+
+
+def _lookup(slug):
+    from sellers.models import Seller
+    return Seller.objects.filter(slug=slug, is_active=True).values_list('id', flat=True).first()
+
+
+def resolve(slug):
+    """Seller id for an active slug, or None. Unknown slugs cost no query (with a shared cache)."""
+    if not is_shared():
+        return _lookup(slug)
+    if slug not in known_slugs():
+        return None
+    seller_id = cache.get(_id_key(slug))
+    if seller_id is None:
+        seller_id = _lookup(slug)
+        if seller_id is None:
+            return None
+        cache.set(_id_key(slug), seller_id, ID_TTL)
+    return seller_id
+
+
+def get_active_seller_or_404(slug, **filters):
+    """get_object_or_404(Seller, slug=slug, is_active=True, **filters) via the resolver."""
+    from sellers.models import Seller
+    seller_id = resolve(slug)
+    if seller_id is None:
+        raise Http404("No seller matches the given slug.")
+    return get_object_or_404(Seller, pk=seller_id, is_active=True, **filters)
+
+
+def invalidate(*slugs):
+    """
+    Drop the slug set (every process reloads it) and the id entries for
+    `slugs`, once the current transaction commits (at once outside one).
+    """
+    from django.db import transaction
+    slugs = [slug for slug in slugs if slug]
+
+    def drop():
+        bump(VERSION_KEY)
+        cache.delete_many([_id_key(slug) for slug in slugs])
+        _local.update(version=None, slugs=None, checked_at=0.0)
+
+    transaction.on_commit(drop)
@@ -0,0 +1,213 @@
+# sellers/snapshots.py
+"""
+Platform KPI snapshots.
+
+take_snapshot() computes every metric shown on the admin dashboard and
+analytics pages in a handful of grouped queries and stores it as a
+PlatformSnapshot row. The admin pages read the latest row, so they cost a
+single indexed lookup instead of ~25 separate counts per page load.
+
+Day-close rows make up the trend charts. Each run closes every day of the
+last HISTORY_DAYS that has no day-close row yet — after beat or the worker
+was down, and on the first run after deploy. The day-window figures come
+from created_at / paid_at, so they can be computed for any past day; the
+point-in-time totals cannot, and only yesterday's row carries them.
+"""
+import logging
+from datetime import datetime, time, timedelta
+from decimal import Decimal
+
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from products.models import Product
+from sellers.models import Dispute, Order, PlatformSnapshot, Seller
+
+logger = logging.getLogger(__name__)
+
+OPEN_DISPUTE_STATUSES = ['open', 'vendor_replied', 'under_review']
+LIVE_RETENTION_DAYS   = 2   # intraday rows older than this are pruned; day-close rows are kept
+HISTORY_DAYS          = 90  # longest trend window on the analytics page
+
+
+def _day_bounds(day):
+    tz    = timezone.get_current_timezone()
+    start = timezone.make_aware(datetime.combine(day, time.min), tz)
+    return start, start + timedelta(days=1)
+
+
+def compute_metrics(window_start, window_end, now=None):
+    """
+    Returns a dict of PlatformSnapshot field values.
+    Totals are as of now; the day-window figures cover [window_start, window_end).
+    """
+    now       = now or timezone.now()
+    last_7d   = now - timedelta(days=7)
+    last_30d  = now - timedelta(days=30)
+    in_window = lambda field: Q(**{f'{field}__gte': window_start, f'{field}__lt': window_end})
+    not_staff = Q(is_staff=False, is_superuser=False)
+
+    from sellers.presence import flush
+    flush()
+
+    # ── 1. Sellers ─────────────────────────────────────────────────────────
+    sellers = Seller.objects.aggregate(
+        total_sellers    = Count('id', filter=not_staff & Q(is_active=True)),
+        premium_sellers  = Count('id', filter=not_staff & Q(subscription_type='premium')),
+        active_sellers_24h = Count('id', filter=not_staff & Q(last_seen__gte=now - timedelta(hours=24))),
+        total_page_views = Sum('total_page_views', filter=not_staff),
+        new_sellers_7d   = Count('id', filter=Q(created_at__gte=last_7d)),
+        new_sellers_30d  = Count('id', filter=Q(created_at__gte=last_30d)),
+        sellers_joined   = Count('id', filter=in_window('created_at')),
+    )
+
+    # ── 2–3. Seller breakdowns ─────────────────────────────────────────────
+    subscription_stats = list(
+        Seller.objects.filter(not_staff)
+        .values('subscription_type').annotate(count=Count('id')).order_by('subscription_type')
+    )
+    category_stats = list(
+        Seller.objects.values('category').annotate(count=Count('id')).order_by('-count')
+    )
+
+    # ── 4. Products ────────────────────────────────────────────────────────
+    products = Product.objects.aggregate(
+        total_products   = Count('id', filter=Q(is_archived=False)),
+        new_products_7d  = Count('id', filter=Q(created_at__gte=last_7d)),
+        new_products_30d = Count('id', filter=Q(created_at__gte=last_30d)),
+        products_listed  = Count('id', filter=in_window('created_at')),
+    )
+
+    # ── 5. Orders ──────────────────────────────────────────────────────────
+    orders = Order.objects.aggregate(
+        pending_payouts = Count('id', filter=Q(payout_triggered=False, status__in=['delivered', 'completed'])),
+        orders_paid     = Count('id', filter=in_window('paid_at')),
+        gmv             = Sum('subtotal', filter=in_window('paid_at')),
+        fees            = Sum('platform_fee', filter=in_window('paid_at')),
+    )
+
+    # ── 6. Disputes ────────────────────────────────────────────────────────
+    disputes = Dispute.objects.aggregate(
+        open_disputes   = Count('id', filter=Q(status__in=OPEN_DISPUTE_STATUSES)),
+        disputes_opened = Count('id', filter=in_window('created_at')),
+    )
+
+    metrics = {**sellers, **products, **orders, **disputes}
+    metrics['total_page_views']   = metrics['total_page_views'] or 0
+    metrics['gmv']                = metrics['gmv'] or Decimal('0')
+    metrics['fees']               = metrics['fees'] or Decimal('0')
+    metrics['subscription_stats'] = subscription_stats
+    metrics['category_stats']     = category_stats
+    return metrics
+
+
+def daily_figures(first_day, last_day):
+    """
+    {day: day-window figures} for every day in [first_day, last_day] that had
+    any activity — one GROUP BY per table instead of one aggregate per day.
+    """
+    tz         = timezone.get_current_timezone()
+    start, _   = _day_bounds(first_day)
+    _, end     = _day_bounds(last_day)
+
+    def per_day(queryset, field, **aggregates):
+        rows = (
+            queryset.filter(**{f'{field}__gte': start, f'{field}__lt': end})
+            .annotate(window_day=TruncDate(field, tzinfo=tz))
+            .values('window_day').annotate(**aggregates).order_by()
+        )
+        return {row.pop('window_day'): row for row in rows}
+
+    figures = {}
+    for table in (
+        per_day(Seller.objects, 'created_at', sellers_joined=Count('id')),
+        per_day(Product.objects, 'created_at', products_listed=Count('id')),
+        per_day(Order.objects, 'paid_at', orders_paid=Count('id'), gmv=Sum('subtotal'), fees=Sum('platform_fee')),
+        per_day(Dispute.objects, 'created_at', disputes_opened=Count('id')),
+    ):
+        for day, values in table.items():
+            figures.setdefault(day, {}).update({name: value or 0 for name, value in values.items()})
+    return figures
+
+
+def close_missing_days(now=None):
+    """
+    Writes a day-close row for every day of the last HISTORY_DAYS that has
+    none. Yesterday gets the full metrics; older days the day-window figures.
+    A day-close row is stamped at the end of its day, so it never ties with
+    a live row. Returns the days closed.
+    """
+    now       = now or timezone.now()
+    today     = timezone.localdate(now)
+    yesterday = today - timedelta(days=1)
+    first_day = today - timedelta(days=HISTORY_DAYS)
+
+    closed  = set(
+        PlatformSnapshot.objects.filter(is_day_close=True, day__gte=first_day).values_list('day', flat=True)
+    )
+    missing = [
+        first_day + timedelta(days=offset) for offset in range(HISTORY_DAYS)
+        if first_day + timedelta(days=offset) not in closed
+    ]
+    if not missing:
+        return []
+
+    older   = [day for day in missing if day != yesterday]
+    figures = daily_figures(older[0], older[-1]) if older else {}
+    rows    = [
+        PlatformSnapshot(
+            taken_at=_day_bounds(day)[1] - timedelta(microseconds=1), day=day, is_day_close=True,
+            **figures.get(day, {}),
+        )
+        for day in older
+    ]
+    if yesterday in missing:
+        start, end = _day_bounds(yesterday)
+        rows.append(PlatformSnapshot(
+            taken_at=end - timedelta(microseconds=1), day=yesterday, is_day_close=True,
+            **compute_metrics(start, end, now=now),
+        ))
+    PlatformSnapshot.objects.bulk_create(rows)
+    logger.info(f"Platform snapshot: closed {len(missing)} day(s), {missing[0]} → {missing[-1]}")
+    return missing
+
+
+def take_snapshot():
+    """
+    Writes a live snapshot for today, after closing any day of the trend
+    window that has no day-close row yet (see close_missing_days).
+    """
+    now   = timezone.now()
+    today = timezone.localdate(now)
+
+    close_missing_days(now)
+
+    start, _ = _day_bounds(today)
+    snapshot = PlatformSnapshot.objects.create(
+        taken_at=now, day=today, **compute_metrics(start, now, now=now),
+    )
+
+    PlatformSnapshot.objects.filter(
+        is_day_close=False, taken_at__lt=now - timedelta(days=LIVE_RETENTION_DAYS),
+    ).delete()
+    return snapshot
+
+
+def latest_snapshot():
+    """Latest live snapshot, taking one on the spot if the task has never run."""
+    return PlatformSnapshot.objects.filter(is_day_close=False).first() or take_snapshot()
+
+
+def daily_history(days):
+    """
+    Day-close rows for the last `days` days plus today's live row, oldest first.
+    """
+    since = timezone.localdate() - timedelta(days=days - 1)
+    rows  = list(
+        PlatformSnapshot.objects.filter(is_day_close=True, day__gte=since).order_by('day')
+    )
+    today = PlatformSnapshot.objects.filter(is_day_close=False, day=timezone.localdate()).first()
+    if today:
+        rows.append(today)
+    return rows
@@ -0,0 +1,140 @@
+# sellers/sqltrace.py
+"""
+Sampled SQL traces for finding slow pages and N+1 loops in production.
+
+A trace records every statement run on the default connection (through
+connection.execute_wrapper) with its time and the innermost project call
+site. Statements are grouped by shape — placeholders, literals and IN-lists
+collapsed — so the same query issued once per row shows up as one shape
+with a large count. When a trace crosses any threshold it is written as one
+JSON line to the `sql_trace` logger:
+
+    SQL_TRACE_SAMPLE_RATE       fraction of requests traced (0 = off)
+    SQL_TRACE_SLOW_MS           whole request / command slower than this
+    SQL_TRACE_SLOW_QUERY_MS     any single statement slower than this
+    SQL_TRACE_REPEAT_THRESHOLD  any shape run at least this many times
+
+Requests are traced by config.middleware.SqlTraceMiddleware; management
+commands (send_weekly_summary, process_payouts, …) with
+`manage.py trace_sql <command> [args]`.
+"""
+import json
+import logging
+import os
+import re
+import time
+import traceback
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db import connection
+
+logger = logging.getLogger('sql_trace')
+
+MAX_STATEMENTS = 5000    # stop recording detail past this; counts keep going
+MAX_SITES      = 3       # distinct call sites kept per shape
+STACK_DEPTH    = 4       # project frames kept per call site
+
+_IN_LIST_RE = re.compile(r'\bIN \(\s*(?:%s|\?)(?:\s*,\s*(?:%s|\?))*\s*\)', re.IGNORECASE)
+_STRING_RE  = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE  = re.compile(r'\b\d+(?:\.\d+)?\b')
+_SPACE_RE   = re.compile(r'\s+')
+
+_THIS_FILE = os.path.abspath(__file__)
+
+
+def shape(sql):
+    """Normalised statement: same query, different parameters → same shape."""
+    sql = _STRING_RE.sub('?', sql)
+    sql = _NUMBER_RE.sub('?', sql)
+    sql = _IN_LIST_RE.sub('IN (…)', sql)
+    return _SPACE_RE.sub(' ', sql).strip()
+
+
+def _call_site():
+    """Innermost project frames (outside site-packages and this module), innermost first."""
+    base  = str(settings.BASE_DIR)
+    sites = []
+    for frame in reversed(traceback.extract_stack()[:-3]):
+        filename = os.path.abspath(frame.filename)
+        if not filename.startswith(base) or 'site-packages' in filename or filename == _THIS_FILE:
+            continue
+        if filename.endswith(os.path.join('config', 'middleware.py')):
+            continue
+        sites.append(f'{os.path.relpath(filename, base)}:{frame.lineno} in {frame.name}')
+        if len(sites) == STACK_DEPTH:
+            break
+    return ' < '.join(sites) or '<framework>'
+
+
+class SqlTrace:
+    """execute_wrapper that collects per-shape stats for one request / command."""
+
+    def __init__(self, label):
+        self.label      = label
+        self.queries    = 0
+        self.sql_ms     = 0.0
+        self.shapes     = {}     # shape → {'count', 'ms', 'sites'}
+        self.slow       = []     # (ms, sql, site)
+        self.slow_query_ms = settings.SQL_TRACE_SLOW_QUERY_MS
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self._record(sql, (time.perf_counter() - started) * 1000)
+
+    def _record(self, sql, ms):
+        self.queries += 1
+        self.sql_ms  += ms
+        if self.queries > MAX_STATEMENTS:
+            return
+        site  = _call_site()
+        stats = self.shapes.setdefault(shape(sql), {'count': 0, 'ms': 0.0, 'sites': []})
+        stats['count'] += 1
+        stats['ms']    += ms
+        if site not in stats['sites'] and len(stats['sites']) < MAX_SITES:
+            stats['sites'].append(site)
+        if ms >= self.slow_query_ms:
+            self.slow.append((ms, sql, site))
+
+    def report(self, duration_ms, **extra):
+        """The JSON-ready report if any threshold was crossed, else None."""
+        threshold = settings.SQL_TRACE_REPEAT_THRESHOLD
+        repeated  = sorted(
+            ({'shape': sql, 'count': s['count'], 'ms': round(s['ms'], 2), 'sites': s['sites']}
+             for sql, s in self.shapes.items() if s['count'] >= threshold),
+            key=lambda row: row['count'], reverse=True,
+        )
+        if not (repeated or self.slow or duration_ms >= settings.SQL_TRACE_SLOW_MS):
+            return None
+        return {
+            'label':       self.label,
+            **extra,
+            'duration_ms': round(duration_ms, 2),
+            'queries':     self.queries,
+            'sql_ms':      round(self.sql_ms, 2),
+            'shapes':      len(self.shapes),
+            'repeated':    repeated,
+            'slow':        [{'ms': round(ms, 2), 'sql': sql[:2000], 'site': site}
+                            for ms, sql, site in sorted(self.slow, reverse=True)[:10]],
+        }
+
+
+def emit(report):
+    logger.warning(json.dumps(report, default=str))
+
+
+@contextmanager
+def trace(label, **extra):
+    """Trace everything inside the block; emits a JSON line if a threshold is crossed."""
+    collector = SqlTrace(label)
+    started   = time.perf_counter()
+    try:
+        with connection.execute_wrapper(collector):
+            yield collector
+    finally:
+        report = collector.report((time.perf_counter() - started) * 1000, **extra)
+        if report is not None:
+            emit(report)
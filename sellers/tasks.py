@@ -25,29 +25,67 @@ def run_auto_release():
     Auto-releases shipped orders where auto_release_at has passed.
     SKIPS any order where is_disputed=True — money stays locked.
     """
-    from sellers.views import auto_release_expired_orders
-    auto_release_expired_orders()
+    from sellers.views.payouts import auto_release_expired_orders
+    return auto_release_expired_orders()
+
+
+@shared_task(name='sellers.tasks.trigger_order_payout')
+def trigger_order_payout(order_id):
+    """
+    Queued by auto-release for direct-pay orders.
+    Runs the Flutterwave transfer outside the release loop.
+    """
+    from sellers.models import Order
+    from sellers.views.payouts import _trigger_payout
+
+    order = Order.objects.select_related('seller', 'seller__bank_account').filter(pk=order_id).first()
+    if not order or order.payout_triggered or order.status != 'delivered' or order.is_disputed:
+        logger.info(f"trigger_order_payout: skipping order {order_id}")
+        return
+    _trigger_payout(order)
+
+
+@shared_task(name='sellers.tasks.send_order_auto_released_email')
+def send_order_auto_released_email(order_id):
+    """Queued by auto-release — tells the buyer their order has been completed."""
+    from sellers.models import Order
+    from sellers.email import send_order_auto_released_buyer
+
+    order = Order.objects.select_related('seller').filter(pk=order_id).first()
+    if not order:
+        return
+    try:
+        send_order_auto_released_buyer(
+            to_email=order.buyer_email,
+            buyer_name=order.buyer_name,
+            order_ref=str(order.order_ref)[:8].upper(),
+            seller_name=order.seller.business_name,
+        )
+    except Exception as e:
+        logger.error(f"Auto-release buyer email failed for order {order.order_ref}: {e}")
 
 
 @shared_task(name='sellers.tasks.reset_monthly_volumes')
 def reset_monthly_volumes():
     """
     Runs at midnight on the 1st of every month.
-    Resets monthly_volume_processed to 0 for all sellers.
+    Monthly volume is keyed by month in SellerMonthlyVolume, so the new month
+    starts from zero on its own — this only logs last month's totals.
     """
-    from decimal import Decimal
-    from django.utils import timezone
-    from sellers.models import Seller
+    from django.db.models import Count, Sum
+    from datetime import timedelta
+    from sellers.models import SellerMonthlyVolume
 
-    today = timezone.now().date()
-    updated = Seller.objects.filter(
-        is_staff=False, is_superuser=False
-    ).update(
-        monthly_volume_processed=Decimal('0.00'),
-        tier_reset_date=today,
+    this_month = SellerMonthlyVolume.current_month()
+    last_month = (this_month - timedelta(days=1)).replace(day=1)
+    totals = SellerMonthlyVolume.objects.filter(month=last_month).aggregate(
+        sellers=Count('id'), volume=Sum('volume'),
     )
-    logger.info(f"Reset monthly_volume_processed for {updated} seller(s) on {today}")
-    return f"Reset {updated} seller(s)"
+    logger.info(
+        f"Monthly volume rollover: {last_month:%Y-%m} closed with {totals['sellers']} seller(s), "
+        f"volume {totals['volume'] or 0}"
+    )
+    return f"Rolled over {totals['sellers']} seller(s)"
 
 @shared_task(name='sellers.tasks.send_weekly_summaries')
 def send_weekly_summaries():
@@ -77,4 +115,113 @@ def send_premium_expiry_warnings():
         logger.info("Premium expiry warnings task complete.")
     except Exception as e:
         logger.exception("send_premium_expiry_warnings FAILED: %s", e)
-        raise
\ No newline at end of file
+        raise
+
+@shared_task(name='sellers.tasks.take_platform_snapshot')
+def take_platform_snapshot():
+    """
+    Runs every 15 minutes.
+    Stores the platform KPIs read by the admin dashboard and analytics pages.
+    """
+    from sellers.snapshots import take_snapshot
+    snapshot = take_snapshot()
+    logger.info(f"Platform snapshot taken for {snapshot.day}")
+    return snapshot.pk
+
+
+@shared_task(name='sellers.tasks.rebuild_sitemaps')
+def rebuild_sitemaps():
+    """
+    Runs hourly.
+    Pre-renders the sitemap index and every shard into the cache.
+    """
+    from sellers.sitemaps import rebuild_all
+    return rebuild_all()
+
+
+@shared_task(name='sellers.tasks.reconcile_seller_ledgers')
+def reconcile_seller_ledgers():
+    """
+    Runs nightly.
+    Rebuilds every seller's transaction ledger from orders, correcting any
+    drift from status changes made outside Order.save().
+    """
+    from sellers.ledger import rebuild
+    rows = rebuild()
+    logger.info(f"Seller ledgers reconciled: {rows} bucket row(s)")
+    return rows
+
+
+@shared_task(name='sellers.tasks.flush_presence')
+def flush_presence():
+    """
+    Runs every minute.
+    Writes the last_seen timestamps queued by sellers.presence.touch() in
+    the shared cache to the sellers table.
+    """
+    from sellers.presence import flush
+    return flush()
+
+
+@shared_task(name='sellers.tasks.refresh_image_derivatives')
+def refresh_image_derivatives(seller_id):
+    """
+    Queued when a seller renames their business or toggles the watermark.
+    Rebuilds the stored thumbnail / display URLs for all their product images.
+    """
+    from sellers import http_cache
+    from sellers.models import Seller
+    from products.derivatives import refresh_for_seller
+    seller = Seller.objects.filter(pk=seller_id).only('id', 'business_name', 'watermark_enabled').first()
+    if seller is None:
+        return 0
+    count = refresh_for_seller(seller)
+    http_cache.touch_sellers([seller_id], directory=False)
+    logger.info(f"Image derivatives refreshed for seller {seller_id}: {count} image(s)")
+    return count
+
+
+@shared_task(name='sellers.tasks.purge_pending_checkouts')
+def purge_pending_checkouts():
+    """
+    Runs hourly.
+    Deletes checkouts never paid within PENDING_CHECKOUT_TTL_HOURS. Paid ones
+    are removed as soon as their order is created.
+    """
+    from datetime import timedelta
+    from django.conf import settings
+    from django.utils import timezone
+    from sellers.models import PendingCheckout
+
+    cutoff     = timezone.now() - timedelta(hours=settings.PENDING_CHECKOUT_TTL_HOURS)
+    deleted, _ = PendingCheckout.objects.filter(created_at__lt=cutoff).delete()
+    logger.info(f"Purged {deleted} expired pending checkout(s)")
+    return deleted
+
+
+@shared_task(name='sellers.tasks.purge_cdn_keys')
+def purge_cdn_keys(keys):
+    """
+    Queued by sellers.http_cache.touch() when CDN_PURGE_URL is set.
+    Purges every edge-cached page tagged with any of `keys` (Surrogate-Key
+    purge, Fastly-style: POST with the keys space-separated in a header).
+    A failed purge only delays the change until the edge copy's s-maxage.
+    """
+    import requests
+    from django.conf import settings
+
+    try:
+        response = requests.post(
+            settings.CDN_PURGE_URL,
+            headers={
+                'Surrogate-Key': ' '.join(keys),
+                settings.CDN_PURGE_AUTH_HEADER: settings.CDN_PURGE_TOKEN,
+            },
+            timeout=10,
+        )
+        response.raise_for_status()
+    except Exception as e:
+        logger.error(f"CDN purge failed for {keys}: {e}")
+        return 0
+    logger.info(f"CDN purge for {len(keys)} key(s): {' '.join(keys)}")
+    return len(keys)
@@ -0,0 +1,145 @@
+# sellers/tests.py
+from datetime import timedelta
+from decimal import Decimal
+
+from django.test import TestCase
+from django.utils import timezone
+
+from sellers import ledger
+from sellers.models import Order, Seller, SellerLedger
+from sellers.order_states import InvalidTransition, OrderStateMachine
+from sellers.views.payouts import auto_release_expired_orders, record_payout, record_refund
+
+
+class OrderFixtures(TestCase):
+
+    def setUp(self):
+        self.seller = Seller.objects.create(
+            username='ledger_seller', email='ledger@example.com',
+            business_name='Ledger Store', whatsapp_number='+2348000000001',
+        )
+        self._refs = 0
+
+    def make_order(self, status='paid', payout='950.00', **fields):
+        self._refs += 1
+        return Order.objects.create(
+            seller=self.seller, status=status,
+            buyer_name='Buyer', buyer_email='buyer@example.com', buyer_phone='0800', delivery_address='1 Street',
+            subtotal=Decimal('1000.00'), platform_fee=Decimal('1000.00') - Decimal(payout),
+            vendor_payout=Decimal(payout), flutterwave_tx_ref=f'TEST-{self._refs}',
+            **fields,
+        )
+
+    def ledger_rows(self):
+        return sorted(
+            (row.status, row.payout_triggered, row.order_count, row.total_payout)
+            for row in SellerLedger.objects.filter(seller=self.seller) if row.order_count
+        )
+
+    def assertLedgerMatchesRebuild(self):
+        incremental = self.ledger_rows()
+        ledger.rebuild([self.seller.pk])
+        self.assertEqual(incremental, self.ledger_rows())
+
+
+class TransitionTests(OrderFixtures):
+
+    def test_moves_status_and_ledger(self):
+        order = self.make_order('paid')
+        self.assertTrue(OrderStateMachine.transition(order, 'shipped', source='vendor'))
+        self.assertEqual(Order.objects.get(pk=order.pk).status, 'shipped')
+        self.assertEqual(self.ledger_rows(), [('shipped', False, 1, Decimal('950.00'))])
+        self.assertLedgerMatchesRebuild()
+
+    def test_lost_race_returns_false(self):
+        order = self.make_order('paid')
+        first, second = Order.objects.get(pk=order.pk), Order.objects.get(pk=order.pk)
+
+        self.assertTrue(OrderStateMachine.transition(first, 'shipped', source='vendor'))
+        self.assertFalse(OrderStateMachine.transition(second, 'disputed', source='buyer'))
+
+        self.assertEqual(Order.objects.get(pk=order.pk).status, 'shipped')
+        self.assertEqual(second.status, 'paid')     # the loser's instance is left alone
+        self.assertLedgerMatchesRebuild()
+
+    def test_disallowed_move_raises(self):
+        order = self.make_order('pending')
+        with self.assertRaises(InvalidTransition):
+            OrderStateMachine.transition(order, 'shipped', source='vendor')
+        self.assertEqual(Order.objects.get(pk=order.pk).status, 'pending')
+
+    def test_completed_requires_a_booked_payout(self):
+        order = self.make_order('delivered')
+        self.assertFalse(OrderStateMachine.transition(order, 'completed', source='payout'))
+        self.assertEqual(Order.objects.get(pk=order.pk).status, 'delivered')
+
+
+class LedgerTests(OrderFixtures):
+
+    def test_dispute_then_payout_matches_rebuild(self):
+        order = self.make_order('paid')
+        OrderStateMachine.transition(order, 'disputed', source='buyer', is_disputed=True)
+        OrderStateMachine.transition(order, 'delivered', source='dispute', is_disputed=False)
+        self.assertTrue(record_payout(order, 'TRF-1', source='payout'))
+
+        order = Order.objects.get(pk=order.pk)
+        self.assertEqual((order.status, order.payout_triggered, order.flutterwave_transfer_id), ('completed', True, 'TRF-1'))
+        self.assertEqual(self.ledger_rows(), [('completed', True, 1, Decimal('950.00'))])
+        self.assertLedgerMatchesRebuild()
+
+    def test_dispute_then_refund_matches_rebuild(self):
+        order = self.make_order('paid')
+        self.make_order('paid', payout='475.00')
+        OrderStateMachine.transition(order, 'disputed', source='buyer', is_disputed=True)
+        self.assertTrue(record_refund(order, 'RF-1', source='dispute'))
+
+        order = Order.objects.get(pk=order.pk)
+        self.assertEqual((order.status, order.refund_reference, order.is_disputed), ('refunded', 'RF-1', False))
+        self.assertEqual(self.ledger_rows(), [
+            ('paid', False, 1, Decimal('475.00')),
+            ('refunded', False, 1, Decimal('950.00')),
+        ])
+        self.assertLedgerMatchesRebuild()
+
+    def test_payout_is_booked_once(self):
+        order = self.make_order('delivered')
+        stale = Order.objects.get(pk=order.pk)
+        self.assertTrue(record_payout(order, 'TRF-1', source='payout'))
+        self.assertFalse(record_payout(stale, 'TRF-2', source='payout'))
+        self.assertEqual(Order.objects.get(pk=order.pk).flutterwave_transfer_id, 'TRF-1')
+        self.assertLedgerMatchesRebuild()
+
+    def test_update_order_requires_pinned_ledger_fields(self):
+        order = self.make_order('paid')
+        with self.assertRaises(ValueError):
+            ledger.update_order(order.pk, {'status': 'paid'}, payout_triggered=True)
+
+    def test_stale_save_falls_back_to_rebuild(self):
+        order = self.make_order('paid')
+        stale = Order.objects.get(pk=order.pk)
+        OrderStateMachine.transition(order, 'shipped', source='vendor')
+        stale.status = 'disputed'
+        stale.save()
+        self.assertLedgerMatchesRebuild()
+
+
+class AutoReleaseTests(OrderFixtures):
+
+    def test_releases_only_expired_undisputed_orders(self):
+        past, future = timezone.now() - timedelta(hours=1), timezone.now() + timedelta(hours=1)
+        escrow   = self.make_order('shipped', auto_release_at=past)
+        direct   = self.make_order('shipped', auto_release_at=past, payment_type='direct')
+        disputed = self.make_order('shipped', auto_release_at=past, is_disputed=True)
+        waiting  = self.make_order('shipped', auto_release_at=future)
+
+        counts = auto_release_expired_orders(batch_size=1)
+
+        self.assertEqual((counts['released'], counts['escrow'], counts['direct']), (2, 1, 1))
+        statuses = dict(Order.objects.values_list('pk', 'status'))
+        self.assertEqual(statuses[escrow.pk], 'RECEIVED')
+        self.assertEqual(statuses[direct.pk], 'delivered')
+        self.assertEqual(statuses[disputed.pk], 'shipped')
+        self.assertEqual(statuses[waiting.pk], 'shipped')
+        self.assertEqual(Order.objects.get(pk=escrow.pk).delivered_at, past)
+        self.assertLedgerMatchesRebuild()
+        self.assertEqual(auto_release_expired_orders()['released'], 0)
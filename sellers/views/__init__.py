@@ -0,0 +1,11 @@
+# sellers/views/__init__.py
+#
+# The views, one module per area; sellers/urls.py routes to each module.
+# Nothing is re-exported here: import from the module itself
+# (sellers.views.payouts, ...), so the Celery tasks, the admin and the order
+# state machine load the payout code without the other areas.
+#
+# Integrations (sellers.email → Brevo SDK, sellers.flutterwave → requests,
+# sellers.flutterwave_async → aiohttp) are imported inside the views that
+# call them, so loading the URLconf at worker boot does not pay for them.
+# `python manage.py importtime` reports the cost per module.
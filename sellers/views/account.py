@@ -0,0 +1,273 @@
+# sellers/views/account.py
+"""Dashboard settings: profile, business info, password, watermark, store mode and payout account."""
+import logging
+
+from django.contrib import messages
+from django.contrib.auth import update_session_auth_hash
+from django.contrib.auth.decorators import login_required
+from django.contrib.auth.password_validation import validate_password
+from django.core.exceptions import ValidationError
+from django.http import JsonResponse
+from django.shortcuts import redirect, render
+from django.utils import timezone
+from django.views.decorators.http import require_http_methods
+
+from sellers.models import PlatformSettings, Seller, VendorBankAccount
+
+logger = logging.getLogger(__name__)
+
+
+# ─────────────────────────────────────────────
+# SETTINGS
+# ─────────────────────────────────────────────
+@login_required
+def dashboard_settings(request):
+    seller = request.user
+    platform = PlatformSettings.get()
+
+    tiers = []
+    for key, cfg in Seller.TIER_CONFIG.items():
+        tiers.append({
+            'key':         key,
+            'label':       cfg['label'],
+            'price':       cfg['price'],
+            'fee_percent': cfg['fee_percent'],
+            'cap':         cfg['cap'],
+            'is_current':  seller.subscription_tier == key,
+        })
+
+    current_fee_percent = seller.get_commission_rate()
+    example_order  = 10000
+    example_fee    = (example_order * current_fee_percent) / 100
+    example_payout = example_order - example_fee
+
+    return render(request, 'dashboard/settings.html', {
+        'platform_fee_percent': platform.transaction_fee_percent,
+        'transaction_fee':      current_fee_percent,
+        'tiers':                tiers,
+        'current_tier':         seller.subscription_tier,
+        'monthly_volume':       seller.monthly_volume_processed,
+        'current_cap':          seller.get_tier_config()['cap'],
+        'current_fee_percent':  current_fee_percent,
+        'example_order':        example_order,
+        'example_fee':          example_fee,
+        'example_payout':       example_payout,
+        'current_subscription': request.user.subscription_type,
+        'subscription_expires': request.user.subscription_expires,
+    })
+
+def _queue_image_refresh(seller_id):
+    """Re-render stored image derivatives after the name / watermark change commits."""
+    from django.db import transaction
+    from sellers.tasks import refresh_image_derivatives
+
+    def queue():
+        try:
+            refresh_image_derivatives.delay(seller_id)
+        except Exception as e:
+            logger.error(f"Could not queue image derivative refresh for seller {seller_id}: {e}")
+    transaction.on_commit(queue)
+
+
+@login_required
+@require_http_methods(["POST"])
+def update_watermark(request):
+    enabled = 'watermark_enabled' in request.POST
+    if enabled != request.user.watermark_enabled:
+        request.user.watermark_enabled = enabled
+        request.user.save(update_fields=['watermark_enabled'])
+        _queue_image_refresh(request.user.id)
+    messages.success(request, 'Watermark setting updated.')
+    return redirect('settings')
+
+@login_required
+def update_profile_picture(request):
+    if request.method != 'POST':
+        return redirect('settings')
+
+    seller = request.user
+
+    if request.POST.get('remove_picture'):
+        if seller.profile_picture:
+            try:
+                import cloudinary.uploader
+                public_id = seller.profile_picture.public_id
+                if public_id:
+                    cloudinary.uploader.destroy(public_id)
+            except Exception as e:
+                logger.error(f"Cloudinary delete error: {str(e)}")
+            seller.profile_picture = None
+            seller.save(update_fields=['profile_picture'])
+        return redirect('settings')
+
+    if request.POST.get('profile_picture_url'):
+        try:
+            url   = request.POST.get('profile_picture_url')
+            parts = url.split('/upload/')
+            if len(parts) > 1:
+                path       = parts[1]
+                path_parts = path.split('/')
+                if path_parts[0].startswith('v') and path_parts[0][1:].isdigit():
+                    path_parts = path_parts[1:]
+                public_id = '/'.join(path_parts).rsplit('.', 1)[0]
+            else:
+                public_id = url
+            seller.profile_picture = public_id
+            seller.save(update_fields=['profile_picture'])
+            return JsonResponse({'success': True})
+        except Exception as e:
+            logger.error(f"Profile picture URL save error: {str(e)}")
+            return JsonResponse({'success': False, 'error': str(e)}, status=500)
+
+    return redirect('settings')
+
+
+@login_required
+def update_business_info(request):
+    if request.method == 'POST':
+        seller          = request.user
+        business_name   = request.POST.get('business_name', '').strip()
+        bio             = request.POST.get('bio', '').strip()
+        category        = request.POST.get('category')
+        whatsapp_number = request.POST.get('whatsapp_number', '').strip()
+
+        if not business_name:
+            messages.error(request, 'Business name is required')
+            return redirect('settings')
+        if not whatsapp_number:
+            messages.error(request, 'WhatsApp number is required')
+            return redirect('settings')
+        if Seller.objects.filter(whatsapp_number=whatsapp_number).exclude(id=seller.id).exists():
+            messages.error(request, 'This WhatsApp number is already registered')
+            return redirect('settings')
+
+        renamed = business_name != seller.business_name
+        seller.business_name   = business_name
+        seller.bio             = bio
+        seller.category        = category
+        seller.whatsapp_number = whatsapp_number
+        seller.save()
+        if renamed and seller.watermark_enabled:
+            _queue_image_refresh(seller.id)
+
+    return redirect('settings')
+
+
+@login_required
+def update_account(request):
+    if request.method == 'POST':
+        seller = request.user
+        email  = request.POST.get('email', '').strip().lower()
+
+        if not email:
+            messages.error(request, 'Email is required')
+            return redirect('settings')
+        if '@' not in email or '.' not in email.split('@')[1]:
+            messages.error(request, 'Invalid email format')
+            return redirect('settings')
+        if Seller.objects.filter(email__iexact=email).exclude(id=seller.id).exists():
+            messages.error(request, 'This email is already registered')
+            return redirect('settings')
+
+        seller.email = email
+        seller.save()
+
+    return redirect('settings')
+
+
+@login_required
+def change_password(request):
+    if request.method == 'POST':
+        seller           = request.user
+        current_password = request.POST.get('current_password')
+        new_password     = request.POST.get('new_password')
+        confirm_password = request.POST.get('confirm_password')
+
+        if not seller.check_password(current_password):
+            messages.error(request, 'Current password is incorrect')
+            return redirect('settings')
+        if new_password != confirm_password:
+            messages.error(request, 'New passwords do not match')
+            return redirect('settings')
+        if len(new_password) < 6:
+            messages.error(request, 'Password must be at least 6 characters')
+            return redirect('settings')
+
+        try:
+            validate_password(new_password, seller)
+        except ValidationError as e:
+            messages.error(request, ' '.join(e.messages))
+            return redirect('settings')
+
+        seller.set_password(new_password)
+        seller.save()
+        update_session_auth_hash(request, seller)
+
+    return redirect('settings')
+
+# ─────────────────────────────────────────────
+# STORE MODE — TOGGLE + PAYOUT ACCOUNT
+# ─────────────────────────────────────────────
+@login_required
+@require_http_methods(["POST"])
+def toggle_store_mode(request):
+    seller   = request.user
+    enabling = 'store_mode' in request.POST
+    next_url = request.POST.get('next', 'settings')
+
+    if enabling and not hasattr(seller, 'bank_account'):
+        messages.error(request, 'Please add a payout account before enabling Store Mode.')
+        return redirect('settings')
+
+    seller.store_mode = enabling
+    if seller.store_mode and not seller.store_mode_enabled_at:
+        seller.store_mode_enabled_at = timezone.now()
+    seller.save(update_fields=['store_mode', 'store_mode_enabled_at'])
+
+    if enabling:
+        messages.success(request, '🎉 Store Mode enabled! Buyers can now pay directly on your page.')
+    else:
+        messages.info(request, 'Store Mode has been disabled.')
+
+    allowed = {'dashboard', 'settings'}
+    return redirect(next_url if next_url in allowed else 'dashboard')
+
+
+@login_required
+@require_http_methods(["POST"])
+def update_payout_account(request):
+    seller         = request.user
+    account_number = request.POST.get('account_number', '').strip()
+    bank_name      = request.POST.get('bank_name', '').strip()
+    bank_code      = request.POST.get('bank_code', '').strip()
+    account_name   = request.POST.get('account_name', '').strip()
+
+    if not all([account_number, bank_name, account_name, bank_code]):
+        messages.error(request, 'All payout fields are required.')
+        return redirect('settings')
+
+    VendorBankAccount.objects.update_or_create(
+        seller=seller,
+        defaults={
+            'account_number': account_number,
+            'bank_name':      bank_name,
+            'bank_code':      bank_code,
+            'account_name':   account_name,
+            'is_verified':    False,
+        }
+    )
+    messages.success(request, 'Payout account saved.')
+    return redirect('settings')
+
+
+@login_required
+@require_http_methods(["POST"])
+def update_currency(request):
+    currency_code   = request.POST.get('currency_code', '').strip()
+    currency_symbol = request.POST.get('currency_symbol', '').strip()
+    if currency_code and currency_symbol:
+        request.user.currency_code   = currency_code
+        request.user.currency_symbol = currency_symbol
+        request.user.save(update_fields=['currency_code', 'currency_symbol'])
+        messages.success(request, 'Currency updated.')
+    return redirect('settings')
@@ -0,0 +1,374 @@
+# sellers/views/auth.py
+"""Registration, login / logout, email verification and password reset."""
+import logging
+import random
+import string
+import uuid
+from datetime import datetime, timedelta
+
+from django.contrib import messages
+from django.contrib.auth import authenticate, login, logout
+from django.db import IntegrityError
+from django.shortcuts import redirect, render
+from django.utils import timezone
+
+from sellers.models import Seller
+from sellers.views.helpers import _store_url
+
+logger = logging.getLogger(__name__)
+
+
+# ─────────────────────────────────────────────
+# AUTH
+# ─────────────────────────────────────────────
+def logout_view(request):
+    logout(request)
+    return redirect('home')
+
+
+# ─────────────────────────────────────────────
+# PASSWORD RESET
+# ─────────────────────────────────────────────
+def forgot_password(request):
+    from sellers.email import send_password_reset_email
+
+    if request.method == 'POST':
+        email = request.POST.get('email', '').strip().lower()
+        try:
+            seller     = Seller.objects.get(email__iexact=email)
+            reset_code = ''.join(random.choices(string.digits, k=5))
+            request.session['reset_code']         = reset_code
+            request.session['reset_email']        = email
+            request.session['reset_code_expires'] = (
+                timezone.now() + timedelta(minutes=10)
+            ).isoformat()
+            email_sent = send_password_reset_email(
+                to_email=email,
+                business_name=seller.business_name,
+                reset_code=reset_code,
+            )
+            if not email_sent:
+                messages.error(request, 'Failed to send reset email. Please try again.')
+                return render(request, 'auth/forgot_password.html')
+        except Seller.DoesNotExist:
+            pass
+        except Exception as e:
+            logger.error(f"Password reset failed: {str(e)}")
+            messages.error(request, 'Something went wrong. Please try again.')
+            return render(request, 'auth/forgot_password.html')
+        return redirect('verify_reset_code')
+    return render(request, 'auth/forgot_password.html')
+
+
+def verify_reset_code(request):
+    if request.method == 'POST':
+        code        = request.POST.get('code', '').strip()
+        stored_code = request.session.get('reset_code')
+        expires     = request.session.get('reset_code_expires')
+        if not stored_code or not expires:
+            messages.error(request, 'No reset code found. Please request a new one.')
+            return redirect('forgot_password')
+        expires_dt = datetime.fromisoformat(expires)
+        if timezone.now() > expires_dt:
+            del request.session['reset_code']
+            del request.session['reset_code_expires']
+            messages.error(request, 'Code expired. Please request a new one.')
+            return redirect('forgot_password')
+        if code == stored_code:
+            reset_token = uuid.uuid4().hex
+            request.session['reset_token']         = reset_token
+            request.session['reset_token_expires'] = (
+                timezone.now() + timedelta(minutes=30)
+            ).isoformat()
+            return redirect('reset_password', token=reset_token)
+        messages.error(request, 'Invalid code. Please try again.')
+    return render(request, 'auth/verify_code.html')
+
+
+def reset_password(request, token):
+    stored_token = request.session.get('reset_token')
+    expires      = request.session.get('reset_token_expires')
+    email        = request.session.get('reset_email')
+
+    if not stored_token or token != stored_token or not expires or not email:
+        messages.error(request, 'Invalid or expired reset link.')
+        return redirect('forgot_password')
+
+    expires_dt = datetime.fromisoformat(expires)
+    if timezone.now() > expires_dt:
+        messages.error(request, 'Reset link expired. Please request a new one.')
+        return redirect('forgot_password')
+
+    if request.method == 'POST':
+        new_password     = request.POST.get('new_password')
+        confirm_password = request.POST.get('confirm_password')
+        if new_password != confirm_password:
+            messages.error(request, 'Passwords do not match')
+            return render(request, 'auth/reset_password.html')
+        if len(new_password) < 6:
+            messages.error(request, 'Password must be at least 6 characters')
+            return render(request, 'auth/reset_password.html')
+        try:
+            seller = Seller.objects.get(email__iexact=email)
+            seller.set_password(new_password)
+            seller.save()
+            for key in ['reset_code', 'reset_email', 'reset_code_expires', 'reset_token', 'reset_token_expires']:
+                request.session.pop(key, None)
+            messages.success(request, '✓ Password reset successful! Please login.')
+            return redirect('login')
+        except Seller.DoesNotExist:
+            messages.error(request, 'User not found.')
+            return redirect('forgot_password')
+
+    return render(request, 'auth/reset_password.html')
+
+# def register_view(request):
+#     if request.method == 'POST':
+#         username = (
+#             request.session.get('guest_username') or
+#             request.POST.get('username', '')
+#         ).strip().lower()
+
+#         business_name = (
+#             request.session.get('guest_business_name') or
+#             request.POST.get('business_name', '')
+#         ).strip()
+
+#         if not username and business_name:
+#             import re
+#             username = re.sub(
+#                 r'[^a-z0-9]',
+#                 '_',
+#                 business_name.lower()
+#             ).strip('_')[:28]
+
+#         if username and Seller.objects.filter(username__iexact=username).exists():
+#             if not request.session.get('guest_username'):
+#                 username = f"{username[:25]}_{random.randint(10,99)}"
+
+#         email = request.POST.get('email', '').strip().lower()
+#         password = request.POST.get('password', '')
+#         whatsapp_number = request.POST.get('whatsapp_number', '').strip()
+#         country_code = request.POST.get('country_code', '+234').strip()
+#         currency_code = request.POST.get('currency_code', 'NGN').strip()
+#         currency_symbol = request.POST.get('currency_symbol', '₦').strip()
+#         category = request.POST.get('category', 'other')
+
+#         full_whatsapp = (
+#             country_code + whatsapp_number
+#             if country_code and not whatsapp_number.startswith('+')
+#             else whatsapp_number
+#         )
+
+#         errors = []
+
+#         if not all([username, email, password, business_name, whatsapp_number]):
+#             errors.append('All fields are required')
+
+#         if username and Seller.objects.filter(username__iexact=username).exists():
+#             errors.append(f'Username "{username}" is already taken.')
+
+#         if email and Seller.objects.filter(email__iexact=email).exists():
+#             errors.append(f'Email "{email}" is already registered.')
+
+#         if full_whatsapp and Seller.objects.filter(
+#             whatsapp_number=full_whatsapp
+#         ).exists():
+#             errors.append('WhatsApp number is already registered.')
+
+#         if email and ('@' not in email or '.' not in email.split('@')[1]):
+#             errors.append('Please enter a valid email address.')
+
+#         if password and len(password) < 6:
+#             errors.append('Password must be at least 6 characters long.')
+
+#         if errors:
+#             return render(request, 'register.html', {
+#                 'errors': errors,
+#                 'active_tab': 'register',
+#                 'email': email,
+#                 'business_name': business_name,
+#                 'username': username,
+#                 'whatsapp_number': whatsapp_number,
+#                 'category': category,
+#             })
+
+#         try:
+#             seller = Seller.objects.create_user(
+#                 username=username,
+#                 email=email,
+#                 password=password,
+#                 business_name=business_name,
+#                 whatsapp_number=full_whatsapp,
+#                 category=category,
+#                 country_code=country_code,
+#                 currency_code=currency_code,
+#                 currency_symbol=currency_symbol,
+#                 subscription_type='free',
+
+#                 # LOCAL DEV ONLY
+#                 is_active=True,
+#                 email_verified=True,
+#             )
+
+#             login(request, seller)
+
+#             return redirect('onboarding')
+
+#         except IntegrityError as e:
+#             err = str(e)
+
+#             if 'username' in err:
+#                 errors.append('Username is already taken')
+#             elif 'email' in err:
+#                 errors.append('Email is already registered')
+#             elif 'whatsapp' in err:
+#                 errors.append('WhatsApp number is already registered')
+#             else:
+#                 errors.append(f'Registration failed: {err}')
+
+#             return render(request, 'register.html', {
+#                 'errors': errors,
+#                 'active_tab': 'register',
+#                 'email': email,
+#                 'business_name': business_name,
+#                 'username': username,
+#                 'whatsapp_number': whatsapp_number,
+#                 'category': category,
+#             })
+
+#     return render(request, 'register.html', {
+#         'active_tab': 'register'
+#     })
+# def verify_email_pending(request):
+#     return redirect('register')
+
+
+# def verify_email(request, token):
+#     return redirect('register')
+
+def register_view(request):
+    from sellers.email import send_verification_email
+
+    if request.method == 'POST':
+        business_name   = request.POST.get('business_name', '').strip()
+        email           = request.POST.get('email', '').strip().lower()
+        password        = request.POST.get('password', '')
+        whatsapp_number = request.POST.get('whatsapp_number', '').strip()
+        country_code    = request.POST.get('country_code', '+234').strip()
+        currency_code   = request.POST.get('currency_code', 'NGN').strip()
+        currency_symbol = request.POST.get('currency_symbol', '₦').strip()
+        category        = request.POST.get('category', 'other')
+        full_whatsapp   = (
+            (country_code + whatsapp_number)
+            if (country_code and not whatsapp_number.startswith('+'))
+            else whatsapp_number
+        )
+
+        errors = []
+        if not all([email, password, business_name, whatsapp_number]):
+            errors.append('All fields are required')
+        if email and Seller.objects.filter(email__iexact=email).exists():
+            errors.append(f'Email "{email}" is already registered.')
+        if full_whatsapp and Seller.objects.filter(whatsapp_number=full_whatsapp).exists():
+            errors.append('WhatsApp number is already registered.')
+        if email and ('@' not in email or '.' not in email.split('@')[1]):
+            errors.append('Please enter a valid email address')
+        if password and len(password) < 6:
+            errors.append('Password must be at least 6 characters long')
+
+        if errors:
+            return render(request, 'register.html', {
+                'errors': errors, 'active_tab': 'register',
+                'email': email, 'business_name': business_name,
+                'whatsapp_number': whatsapp_number, 'category': category,
+            })
+
+        try:
+            seller = Seller.objects.create_user(
+                email=email, password=password,
+                business_name=business_name, whatsapp_number=full_whatsapp,
+                category=category, country_code=country_code,
+                currency_code=currency_code, currency_symbol=currency_symbol,
+                subscription_type='free',
+                is_active=False,
+            )
+
+            token = uuid.uuid4().hex
+            seller.email_verify_token = token
+            seller.save(update_fields=['email_verify_token'])
+
+            try:
+                send_verification_email(
+                    to_email=seller.email,
+                    business_name=seller.business_name,
+                    verify_url=f"https://www.vendopage.com/verify-email/{token}/",
+                )
+            except Exception as e:
+                logger.error(f"Verification email failed: {e}")
+
+            return redirect('verify_email_pending')
+
+        except IntegrityError as e:
+            err = str(e)
+            if 'email' in err:
+                errors.append('Email is already registered')
+            elif 'whatsapp' in err:
+                errors.append('WhatsApp number is already registered')
+            else:
+                errors.append('Registration failed. Please try again.')
+
+            return render(request, 'register.html', {
+                'errors': errors, 'active_tab': 'register',
+                'email': email, 'business_name': business_name,
+                'whatsapp_number': whatsapp_number, 'category': category,
+            })
+
+    return render(request, 'register.html', {'active_tab': 'register'})
+
+
+def login_view(request):
+    if request.method == 'POST':
+        email    = request.POST.get('email', '').strip().lower()
+        password = request.POST.get('password', '')
+        user = authenticate(request, username=email, password=password)
+        if user and user.is_active:
+            login(request, user)
+            return redirect(request.GET.get('next', '') or 'dashboard')
+        return render(request, 'register.html', {
+            'error':      'Wrong email or password. Try again.',
+            'active_tab': 'login',
+            'login_email': email,
+        })
+    return render(request, 'register.html', {'active_tab': 'login'})
+
+def verify_email_pending(request):
+    return render(request, 'auth/verify_email_pending.html')
+
+
+def verify_email(request, token):
+    from sellers.email import send_welcome_email
+
+    try:
+        seller = Seller.objects.get(email_verify_token=token, is_active=False)
+    except Seller.DoesNotExist:
+        messages.error(request, 'Invalid or already used verification link.')
+        return redirect('login')
+
+    seller.is_active           = True
+    seller.email_verified      = True
+    seller.email_verify_token  = None
+    seller.save(update_fields=['is_active', 'email_verified', 'email_verify_token'])
+
+    login(request, seller)
+
+    try:
+        send_welcome_email(
+            to_email=seller.email,
+            business_name=seller.business_name,
+            store_url=_store_url(seller),
+        )
+    except Exception as e:
+        logger.error(f"Welcome email failed: {e}")
+
+    return redirect('onboarding')
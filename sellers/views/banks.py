@@ -0,0 +1,80 @@
+# sellers/views/banks.py
+"""Flutterwave bank list / account-name lookups behind the payout account form."""
+import json
+import logging
+
+from django.http import JsonResponse
+from django.views.decorators.http import require_http_methods
+
+logger = logging.getLogger(__name__)
+
+
+# ─────────────────────────────────────────────
+# BANK PROXY APIs
+# ─────────────────────────────────────────────
+@require_http_methods(["GET"])
+async def get_banks(request):
+    from sellers.flutterwave_async import AsyncFlutterwavePayment
+
+    country = request.GET.get('country', 'NG').strip().upper()
+    try:
+        flw   = AsyncFlutterwavePayment()
+        banks = await flw.get_banks(country)
+        if banks:
+            return JsonResponse({
+                'success': True,
+                'country': country,
+                'banks': [{'code': b['code'], 'name': b['name']} for b in banks]
+            })
+        raise Exception("Empty response")
+    except Exception as e:
+        logger.error(f"get_banks error ({country}): {e}")
+        if country == 'NG':
+            fallback = [
+                {'code': '044', 'name': 'Access Bank'},
+                {'code': '011', 'name': 'First Bank of Nigeria'},
+                {'code': '058', 'name': 'Guaranty Trust Bank (GTB)'},
+                {'code': '057', 'name': 'Zenith Bank'},
+                {'code': '033', 'name': 'United Bank for Africa (UBA)'},
+                {'code': '214', 'name': 'First City Monument Bank (FCMB)'},
+                {'code': '070', 'name': 'Fidelity Bank'},
+                {'code': '221', 'name': 'Stanbic IBTC Bank'},
+                {'code': '232', 'name': 'Sterling Bank'},
+                {'code': '076', 'name': 'Polaris Bank'},
+                {'code': '082', 'name': 'Keystone Bank'},
+                {'code': '101', 'name': 'Providus Bank'},
+                {'code': '090267', 'name': 'Kuda Bank'},
+                {'code': '090405', 'name': 'OPay'},
+                {'code': '090175', 'name': 'PalmPay'},
+                {'code': '090304', 'name': 'Moniepoint'},
+            ]
+            return JsonResponse({'success': True, 'country': country, 'banks': fallback, 'fallback': True})
+        return JsonResponse({
+            'success': False, 'country': country,
+            'error': f'Could not load banks for {country} right now.'
+        }, status=502)
+
+@require_http_methods(["POST"])
+async def verify_bank_account(request):
+    from sellers.flutterwave_async import AsyncFlutterwavePayment
+
+    try:
+        body           = json.loads(request.body)
+        account_number = body.get('account_number', '').strip()
+        bank_code      = body.get('bank_code', '').strip()
+
+        if not account_number or not bank_code:
+            return JsonResponse({'success': False, 'error': 'Missing fields'}, status=400)
+        if len(account_number) != 10 or not account_number.isdigit():
+            return JsonResponse({'success': False, 'error': 'Invalid account number'}, status=400)
+
+        flw    = AsyncFlutterwavePayment()
+        result = await flw.verify_bank_account(account_number, bank_code)
+
+        if result.get('status') == 'success' and result.get('data', {}).get('account_name'):
+            return JsonResponse({'success': True, 'account_name': result['data']['account_name']})
+        return JsonResponse({'success': False, 'error': result.get('message', 'Account not found')})
+
+    except Exception as e:
+        logger.error(f"verify_bank_account error: {e}")
+        return JsonResponse({'success': False, 'error': 'Verification failed.'}, status=500)
@@ -0,0 +1,397 @@
+# sellers/views/checkout.py
+"""Buyer cart and checkout, the Flutterwave payment round-trip and the order webhook."""
+import json
+import logging
+import uuid
+from decimal import Decimal
+
+from asgiref.sync import sync_to_async
+from django.contrib import messages
+from django.db import IntegrityError, transaction
+from django.http import JsonResponse
+from django.shortcuts import redirect, render
+from django.utils import timezone
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_http_methods
+
+from products.models import Product
+from sellers.models import Order, OrderItem, PendingCheckout
+from sellers.order_states import OrderStateMachine
+from sellers.slugs import get_active_seller_or_404
+from sellers.views.payouts import _trigger_payout
+
+logger = logging.getLogger(__name__)
+
+
+# ─────────────────────────────────────────────
+# ORDER WEBHOOK
+# ─────────────────────────────────────────────
+@csrf_exempt
+@require_http_methods(["POST"])
+def flutterwave_order_webhook(request):
+    """Order payments webhook — safety net if redirect fails."""
+    from sellers.flutterwave import FlutterwavePayment
+    from sellers.email import send_new_order_vendor
+
+    try:
+        signature = request.headers.get('verif-hash', '')
+        payload   = request.body.decode('utf-8')
+        flw       = FlutterwavePayment()
+
+        if not signature or not flw.verify_webhook_signature(signature, payload):
+            logger.warning("FLW webhook signature verification failed")
+            return JsonResponse({'status': 'error'}, status=400)
+
+        data   = json.loads(payload)
+        event  = data.get('event', '')
+        charge = data.get('data', {})
+
+        logger.info(f"FLW WEBHOOK received: event={event}")
+
+        if event != 'charge.completed' or charge.get('status') != 'successful':
+            return JsonResponse({'status': 'received'})
+
+        tx_ref         = charge.get('tx_ref', '')
+        transaction_id = str(charge.get('id', ''))
+
+        if not tx_ref.startswith('VDP-ORD-'):
+            return JsonResponse({'status': 'skipped - not an order payment'})
+
+        # Paid checkout whose buyer never made it back to order_confirmation
+        order, created = _create_paid_order(tx_ref, transaction_id, charge.get('amount'), charge.get('currency'))
+        if created:
+            logger.info(f"FLW WEBHOOK: Created order {order.order_ref} from pending checkout {tx_ref}")
+            return JsonResponse({'status': 'order_created'})
+
+        # Already processed?
+        try:
+            Order.objects.get(flutterwave_tx_ref=tx_ref, payment_verified=True)
+            return JsonResponse({'status': 'already_processed'})
+        except Order.DoesNotExist:
+            pass
+
+        # Fix unverified order
+        try:
+            order = Order.objects.get(flutterwave_tx_ref=tx_ref, payment_verified=False)
+            if not OrderStateMachine.transition(
+                order, 'paid', source='webhook',
+                payment_verified=True, flutterwave_tx_id=transaction_id, paid_at=timezone.now(),
+            ):
+                return JsonResponse({'status': 'already_processed'})
+            logger.info(f"FLW WEBHOOK: Fixed unverified order {tx_ref}")
+            try:
+                send_new_order_vendor(
+                    to_email=order.seller.email, business_name=order.seller.business_name,
+                    buyer_name=order.buyer_name, order_ref=str(order.order_ref)[:8].upper(),
+                    items=list(order.items.all()), subtotal=order.subtotal, currency=order.currency,
+                    dashboard_url=f"https://www.vendopage.com/dashboard/orders/{order.order_ref}/",
+                )
+            except Exception as e:
+                logger.error(f"Webhook vendor email failed: {e}")
+            return JsonResponse({'status': 'fixed_unverified_order'})
+        except Order.DoesNotExist:
+            pass
+
+        logger.error(
+            f"FLW WEBHOOK ALERT: Payment received but no order found.\n"
+            f"tx_ref={tx_ref} | transaction_id={transaction_id} | "
+            f"amount={charge.get('amount')} {charge.get('currency')} | "
+            f"customer={charge.get('customer', {}).get('email')}"
+        )
+        return JsonResponse({'status': 'logged_for_review'})
+
+    except Exception as e:
+        logger.error(f"FLW order webhook error: {e}")
+        return JsonResponse({'status': 'error'}, status=500)
+
+# ─────────────────────────────────────────────
+# CART + CHECKOUT
+# ─────────────────────────────────────────────
+def cart_view(request, slug):
+    seller      = get_active_seller_or_404(slug, store_mode=True)
+    products    = Product.objects.filter(seller=seller, is_archived=False).prefetch_related('images')
+    product_map = {str(p.id): p for p in products}
+
+    return render(request, 'store/cart.html', {
+        'seller':        seller,
+        'product_map':   product_map,
+        'currency':      seller.currency_symbol or '₦',
+        'currency_code': seller.currency_code or 'NGN',
+    })
+
+def checkout_view(request, slug):
+    seller          = get_active_seller_or_404(slug, store_mode=True)
+    currency_symbol = seller.currency_symbol or '₦'
+    currency_code   = seller.currency_code   or 'NGN'
+    products    = Product.objects.filter(seller=seller, is_archived=False).prefetch_related('images')
+    product_map = {str(p.id): p for p in products}
+    return render(request, 'store/checkout.html', {
+        'seller':        seller,
+        'currency':      currency_symbol,
+        'currency_code': currency_code,
+        'product_map':   product_map,
+    })
+
+def _checkout_lines(seller, cart):
+    """(line_items, item_names, subtotal) for a posted cart, priced from the database."""
+    product_ids = []
+    for k in cart.keys():
+        try:
+            product_ids.append(int(k))
+        except (ValueError, TypeError):
+            pass
+
+    db_products = {
+        str(p.id): p
+        for p in Product.objects.filter(id__in=product_ids, seller=seller, is_archived=False)
+    }
+
+    subtotal   = Decimal('0')
+    line_items = []
+    item_names = []
+
+    for pid, item in cart.items():
+        product = db_products.get(str(pid))
+        if not product or not product.price:
+            continue
+        qty       = max(1, int(item.get('qty', 1))) if isinstance(item, dict) else max(1, int(item))
+        img       = product.images.first()
+        short_name = (product.description or 'Product')[:40]
+        item_names.append(f"{short_name} x{qty}")
+        line_items.append({
+            'product_id':    product.id,
+            'product_name':  product.description or 'Product',
+            'product_image': img.image_url if img else '',
+            'price':         str(product.price),
+            'qty':           qty,
+        })
+        subtotal += product.price * qty
+    return line_items, item_names, subtotal
+
+
+# Async: the Flutterwave round-trip is awaited (sellers.flutterwave_async) so
+# an ASGI worker keeps serving other requests meanwhile. ORM work runs
+# through sync_to_async or the async ORM methods. The checkout is stored as a
+# PendingCheckout row keyed by tx_ref, not in the session, so the redirect
+# back and the webhook can each complete it on their own.
+@require_http_methods(["POST"])
+async def initiate_payment(request, slug):
+    from sellers.flutterwave_async import AsyncFlutterwavePayment
+
+    seller = await sync_to_async(get_active_seller_or_404)(slug, store_mode=True)
+
+    buyer_name        = request.POST.get('buyer_name', '').strip()
+    buyer_email       = request.POST.get('buyer_email', '').strip().lower()
+    buyer_phone       = request.POST.get('buyer_phone', '').strip()
+    delivery_address  = request.POST.get('delivery_address', '').strip()
+    delivery_city     = request.POST.get('delivery_city', '').strip()
+    cart_json         = request.POST.get('cart_json', '{}')
+    payment_type      = request.POST.get('payment_type', 'escrow')
+    delivery_required = request.POST.get('delivery_required', '1') == '1'
+
+    if not all([buyer_name, buyer_email, buyer_phone, delivery_address]):
+        messages.error(request, 'Please fill in all required fields.')
+        return redirect('checkout', slug=slug)
+
+    try:
+        cart = json.loads(cart_json)
+    except Exception:
+        messages.error(request, 'Invalid cart data. Please go back and try again.')
+        return redirect('cart', slug=slug)
+
+    if not cart:
+        messages.error(request, 'Your cart is empty.')
+        return redirect('cart', slug=slug)
+
+    line_items, item_names, subtotal = await sync_to_async(_checkout_lines)(seller, cart)
+
+    if not line_items or subtotal <= 0:
+        messages.error(request, 'No valid items in cart.')
+        return redirect('cart', slug=slug)
+
+    item_count    = len(line_items)
+    payment_label = 'Protected Pay' if payment_type == 'escrow' else 'Direct Pay'
+    if item_count == 1:
+        pay_title       = f"Order: {item_names[0]}"
+        pay_description = f"{payment_label} — {seller.business_name}"
+    elif item_count <= 3:
+        pay_title       = f"Order from {seller.business_name}"
+        pay_description = f"{payment_label} — {', '.join(item_names)}"
+    else:
+        pay_title       = f"Order from {seller.business_name}"
+        pay_description = f"{payment_label} — {item_count} items"
+
+    tx_ref   = f"VDP-ORD-{uuid.uuid4().hex[:12].upper()}"
+    currency = await request.session.aget('buyer_currency_code', seller.currency_code or 'NGN')
+
+    await PendingCheckout.objects.acreate(
+        tx_ref            = tx_ref,
+        seller            = seller,
+        buyer_name        = buyer_name,
+        buyer_email       = buyer_email,
+        buyer_phone       = buyer_phone,
+        delivery_address  = delivery_address,
+        delivery_city     = delivery_city,
+        line_items        = line_items,
+        subtotal          = subtotal,
+        currency          = currency,
+        payment_type      = payment_type,
+        delivery_required = delivery_required,
+    )
+
+    flw    = AsyncFlutterwavePayment()
+    result = await flw.initialize_payment(
+        email=buyer_email, amount=subtotal, tx_ref=tx_ref,
+        redirect_url='https://www.vendopage.com/order/confirm/',
+        customer_name=buyer_name,
+        currency=currency,
+        title=pay_title, description=pay_description,
+    )
+
+    if result.get('status') == 'success':
+        return redirect(result['data']['link'])
+
+    await PendingCheckout.objects.filter(tx_ref=tx_ref).adelete()
+    messages.error(request, 'Payment could not be started. Please try again.')
+    return redirect('checkout', slug=slug)
+
+async def _order_failed(request, reason):
+    return await sync_to_async(render)(request, 'store/order_failed.html', {'reason': reason})
+
+
+def _create_paid_order(tx_ref, transaction_id, amount, currency):
+    """
+    (order, created) for a successful Flutterwave charge. The first caller —
+    order_confirmation or the webhook — turns the PendingCheckout into the
+    paid Order and deletes it; later callers get the existing order. order is
+    None when there is neither, or when the charge does not cover the checkout.
+    """
+    from sellers.email import send_new_order_vendor, send_order_confirmed_buyer
+
+    pending = PendingCheckout.objects.select_related('seller').filter(tx_ref=tx_ref).first()
+    if pending is None:
+        return Order.objects.filter(flutterwave_tx_ref=tx_ref).first(), False
+
+    if not pending.matches_charge(amount, currency):
+        logger.error(
+            f"FLW CHARGE MISMATCH: tx_ref={tx_ref} charged={amount} {currency} "
+            f"expected={pending.subtotal} {pending.currency}"
+        )
+        return None, False
+
+    seller = pending.seller
+    try:
+        with transaction.atomic():
+            # Claim the checkout: only one caller deletes the row, a racing one
+            # waits on it and then finds nothing left to claim
+            if not PendingCheckout.objects.filter(pk=pending.pk).delete()[0]:
+                return Order.objects.filter(flutterwave_tx_ref=tx_ref).first(), False
+
+            order = Order(
+                seller             = seller,
+                flutterwave_tx_ref = tx_ref,
+                flutterwave_tx_id  = str(transaction_id),
+                buyer_name         = pending.buyer_name,
+                buyer_email        = pending.buyer_email,
+                buyer_phone        = pending.buyer_phone,
+                delivery_address   = pending.delivery_address,
+                delivery_city      = pending.delivery_city,
+                subtotal           = pending.subtotal,
+                currency           = pending.currency,
+                status             = 'paid',
+                payment_verified   = True,
+                paid_at            = timezone.now(),
+                payment_type       = pending.payment_type,
+                delivery_required  = pending.delivery_required,
+            )
+            order.calculate_fees()
+            order.save()
+
+            OrderItem.objects.bulk_create([
+                OrderItem(
+                    order             = order,
+                    product_id        = li['product_id'],
+                    product_name      = li['product_name'],
+                    product_image_url = li['product_image'],
+                    price             = Decimal(li['price']),
+                    quantity          = li['qty'],
+                )
+                for li in pending.line_items
+            ])
+    except IntegrityError:
+        # An order for this tx_ref already exists
+        return Order.objects.filter(flutterwave_tx_ref=tx_ref).first(), False
+
+    payment_type = order.payment_type
+    if payment_type == 'direct':
+        try:
+            _trigger_payout(order)
+        except Exception as e:
+            logger.error(f"Direct pay payout failed for order {order.order_ref}: {e}")
+
+    items = list(order.items.all())
+    try:
+        send_order_confirmed_buyer(
+            to_email=order.buyer_email, buyer_name=order.buyer_name,
+            order_ref=str(order.order_ref)[:8].upper(), seller_name=seller.business_name,
+            order_url=f"https://www.vendopage.com/order/{order.order_ref}/",
+            items=items, subtotal=order.subtotal, currency=order.currency,
+            payment_type=payment_type,
+        )
+    except Exception as e:
+        logger.error(f"Buyer confirmation email failed: {e}")
+
+    try:
+        send_new_order_vendor(
+            to_email=seller.email, business_name=seller.business_name,
+            buyer_name=order.buyer_name, order_ref=str(order.order_ref)[:8].upper(),
+            items=items, subtotal=order.subtotal, currency=order.currency,
+            dashboard_url=f"https://www.vendopage.com/dashboard/orders/{order.order_ref}/",
+        )
+    except Exception as e:
+        logger.error(f"Vendor new order email failed: {e}")
+
+    return order, True
+
+
+async def order_confirmation(request):
+    from sellers.flutterwave_async import AsyncFlutterwavePayment
+
+    tx_ref         = request.GET.get('tx_ref', '')
+    transaction_id = request.GET.get('transaction_id', '')
+    status         = request.GET.get('status', '')
+
+    logger.error(f"ORDER CONFIRM HIT — status={status} tx_ref={tx_ref} transaction_id={transaction_id}")
+
+    # Flutterwave live mode sends 'completed', test sends 'successful'
+    if status not in ('successful', 'completed') or not tx_ref or not transaction_id:
+        logger.error("FAILED AT: status check")
+        return await _order_failed(request, 'Payment was not completed.')
+
+    # The webhook may have created the order already
+    existing = await Order.objects.filter(flutterwave_tx_ref=tx_ref).only('order_ref').afirst()
+    if existing is not None:
+        return redirect('order_detail', order_ref=str(existing.order_ref))
+
+    if not await PendingCheckout.objects.filter(tx_ref=tx_ref).aexists():
+        logger.error(f"FAILED AT: pending checkout lookup — tx_ref={tx_ref}")
+        return await _order_failed(request, 'Checkout not found. If you were charged, contact support.')
+
+    flw    = AsyncFlutterwavePayment()
+    result = await flw.verify_payment(transaction_id)
+    data   = result.get('data', {})
+    logger.error(f"FLW VERIFY RESULT: {result}")
+
+    if not (result.get('status') == 'success'
+            and data.get('status') == 'successful'
+            and data.get('tx_ref') == tx_ref):
+        logger.error(f"FAILED AT: payment verification — result={result}")
+        return await _order_failed(request, 'Payment verification failed. If you were charged, contact support.')
+
+    order, _ = await sync_to_async(_create_paid_order)(
+        tx_ref, transaction_id, data.get('amount'), data.get('currency'),
+    )
+    if order is None:
+        return await _order_failed(request, 'Payment verification failed. If you were charged, contact support.')
+
+    return redirect('order_detail', order_ref=str(order.order_ref))
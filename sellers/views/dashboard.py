@@ -0,0 +1,263 @@
+# sellers/views/dashboard.py
+"""Onboarding, the vendor dashboard and the transactions ledger."""
+import logging
+import urllib.parse
+from decimal import Decimal
+
+from django.contrib.auth.decorators import login_required
+from django.db.models import Sum
+from django.shortcuts import redirect, render
+from django.utils import timezone
+
+from products.models import Product
+from sellers.models import Order, PlatformSettings
+from sellers.views.helpers import reset_weekly_analytics_if_needed
+
+logger = logging.getLogger(__name__)
+
+
+# ─────────────────────────────────────────────
+# ONBOARDING
+# ─────────────────────────────────────────────
+@login_required
+def onboarding(request):
+    """
+    Post-registration onboarding flow.
+    Step 1 → category picker
+    Step 2 → logo / profile picture (optional)
+    Done   → celebration screen → dashboard
+    """
+    from django.conf import settings as django_settings
+ 
+    cloudinary_cloud_name   = getattr(django_settings, 'CLOUDINARY_CLOUD_NAME', '')
+    cloudinary_upload_preset = getattr(django_settings, 'CLOUDINARY_UPLOAD_PRESET', 'ml_default')
+ 
+    seller = request.user
+ 
+    # ── POST: handle each step ──────────────────────────────────────────────
+    if request.method == 'POST':
+        step = request.POST.get('step', '')
+ 
+        if step == 'category':
+            category = request.POST.get('category', '').strip()
+            if category:
+                seller.category = category
+                seller.save(update_fields=['category'])
+            # Always advance to step 2
+            return redirect(f"{request.path}?step=2")
+ 
+        elif step == 'profile_picture':
+            url = request.POST.get('profile_picture_url', '').strip()
+            if url and url.startswith('https://res.cloudinary.com/'):
+                # Extract public_id from URL (same logic as update_profile_picture view)
+                try:
+                    parts = url.split('/upload/')
+                    if len(parts) > 1:
+                        path = parts[1]
+                        path_parts = path.split('/')
+                        if path_parts[0].startswith('v') and path_parts[0][1:].isdigit():
+                            path_parts = path_parts[1:]
+                        public_id = '/'.join(path_parts).rsplit('.', 1)[0]
+                    else:
+                        public_id = url
+                    seller.profile_picture = public_id
+                    seller.save(update_fields=['profile_picture'])
+                except Exception as e:
+                    logger.error(f"Onboarding pic save error: {e}")
+            return redirect(f"{request.path}?step=done")
+ 
+        elif step == 'skip_picture':
+            return redirect(f"{request.path}?step=done")
+ 
+    # ── GET: render correct step ─────────────────────────────────────────────
+    step_param = request.GET.get('step', '1')
+    try:
+        step = int(step_param)
+    except (ValueError, TypeError):
+        step = step_param  # 'done'
+ 
+    return render(request, 'onboarding.html', {
+        'step':                    step,
+        'cloudinary_cloud_name':   cloudinary_cloud_name,
+        'cloudinary_upload_preset': cloudinary_upload_preset,
+    })
+
+# ─────────────────────────────────────────────
+# DASHBOARD
+# ─────────────────────────────────────────────
+@login_required
+def dashboard(request):
+    seller = request.user
+    reset_weekly_analytics_if_needed(seller)
+
+    active_products   = Product.objects.filter(seller=seller, is_archived=False, is_sold_out=False).prefetch_related('images')
+    sold_out_products = Product.objects.filter(seller=seller, is_archived=False, is_sold_out=True).prefetch_related('images')
+    archived_products = Product.objects.filter(seller=seller, is_archived=True).prefetch_related('images')
+    most_viewed       = Product.objects.filter(seller=seller, is_archived=False).order_by('-views').first()
+    all_products      = Product.objects.filter(seller=seller).prefetch_related('images').order_by('-created_at')[:50]
+
+    catalog_url        = request.build_absolute_uri(f'/{seller.slug}')
+    share_message      = f"🛍️ Check out my product catalog!\n\n{seller.business_name}\n\n{catalog_url}\n\n✨ Browse all my products anytime!"
+    whatsapp_share_url = f"https://wa.me/?text={urllib.parse.quote(share_message)}"
+
+    # ── Time-based greeting (done in Python — Django templates can't do elif inside with) ──
+    hour = timezone.localtime(timezone.now()).hour
+    if hour < 12:
+        time_greeting = "Good morning"
+        time_icon     = "☀️"
+    elif hour < 17:
+        time_greeting = "Good afternoon"
+        time_icon     = "🌤️"
+    elif hour < 21:
+        time_greeting = "Good evening"
+        time_icon     = "🌆"
+    else:
+        time_greeting = "Night owl"
+        time_icon     = "🌙"
+
+    # ── Order stats ──────────────────────────────────────────────────────────
+    recent_orders    = []
+    total_orders     = 0
+    pending_orders   = 0
+    total_earnings   = Decimal('0')
+    pending_earnings = Decimal('0')
+    buffer_earnings  = Decimal('0')
+    payout_queue     = []
+
+    if getattr(seller, 'store_mode', False):
+        active_statuses  = ['paid', 'shipped', 'delivered', 'disputed', 'completed', 'RECEIVED']
+        recent_orders    = Order.objects.filter(seller=seller, status__in=active_statuses).order_by('-created_at')[:5]
+        total_orders     = Order.objects.filter(seller=seller, status__in=active_statuses).count()
+        pending_orders   = Order.objects.filter(seller=seller, status__in=['paid', 'disputed']).count()
+
+        total_earnings   = Order.objects.filter(
+            seller=seller, status__in=['delivered', 'completed'], payout_triggered=True,
+        ).aggregate(total=Sum('vendor_payout'))['total'] or Decimal('0')
+
+        pending_earnings = Order.objects.filter(
+            seller=seller, status__in=['paid', 'shipped', 'disputed'], payment_type='escrow',
+        ).aggregate(total=Sum('vendor_payout'))['total'] or Decimal('0')
+
+        # RECEIVED orders in the 24h buffer — pays out tonight
+        buffer_earnings = Order.objects.filter(
+            seller=seller, status='RECEIVED', payout_triggered=False,
+        ).aggregate(total=Sum('vendor_payout'))['total'] or Decimal('0')
+
+        # Payout queue: confirmed before midnight today, oldest first, max 5
+        today_midnight = timezone.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        raw_queue = list(
+            Order.objects.filter(
+                seller=seller,
+                status='RECEIVED',
+                delivered_at__lt=today_midnight,
+                payout_triggered=False,
+            ).order_by('delivered_at')[:5]
+        )
+
+        # Annotate each order with a progress bar % for the template (payout_eta is on Order)
+        now = timezone.now()
+        for order in raw_queue:
+            if order.payout_eta:
+                total_wait            = (order.payout_eta - order.delivered_at).total_seconds()
+                elapsed               = (now - order.delivered_at).total_seconds()
+                order.payout_progress = min(95, int((elapsed / total_wait) * 100)) if total_wait > 0 else 50
+            else:
+                order.payout_progress = 50
+        payout_queue = raw_queue
+
+    platform_settings = PlatformSettings.get()
+ 
+    tier_config = seller.get_tier_config()
+    current_fee_percent = seller.get_commission_rate()
+    volume_near_cap = seller.monthly_volume_processed >= (tier_config['cap'] * Decimal('0.8'))
+    return render(request, 'dashboard/dashboard.html', {
+        'products':             all_products,
+        'active_count':         active_products.count(),
+        'sold_out_count':       sold_out_products.count(),
+        'archived_count':       archived_products.count(),
+        'total_views':          seller.weekly_page_views,
+        'whatsapp_clicks':      seller.weekly_whatsapp_clicks,
+        'most_viewed':          most_viewed,
+        'product_limit':        None,
+        'whatsapp_share_url':   whatsapp_share_url,
+        'catalog_url':          catalog_url,
+        'recent_orders':        recent_orders,
+        'total_orders':         total_orders,
+        'pending_orders':       pending_orders,
+        'total_earnings':       total_earnings,
+        'pending_earnings':     pending_earnings,
+        'buffer_earnings':      buffer_earnings,
+        'payout_queue':         payout_queue,
+        'time_greeting':        time_greeting,
+        'time_icon':            time_icon,
+        'platform_fee_percent': platform_settings.transaction_fee_percent,
+        'premium_price':        platform_settings.premium_monthly_price,
+        'tier_label':           tier_config['label'],
+        'subscription_tier':    seller.subscription_tier,
+        'monthly_volume':       seller.monthly_volume_processed,
+        'tier_cap':             tier_config['cap'],
+        'current_fee_percent':  current_fee_percent,
+        'volume_near_cap':      volume_near_cap,
+    })
+
+
+@login_required
+def seller_transactions(request):
+    """
+    Full transaction/payout ledger for the logged-in seller.
+
+    Shows every order with:
+      - Full buyer info
+      - Line items (products, qty, price)
+      - Fee breakdown (subtotal, 5% platform fee, their payout amount)
+      - Payout status with live countdown for RECEIVED orders
+      - Flutterwave transfer ID once paid
+      - Dispute / refund flags
+
+    Filterable by status tab so sellers can trust what's pending vs cleared.
+    """
+    seller        = request.user
+    status_filter = request.GET.get('status', 'all')
+
+    # All orders for this seller, newest first
+    orders_qs = (
+        Order.objects
+        .filter(seller=seller)
+        .prefetch_related('items')
+        .order_by('-created_at')
+    )
+
+    # Tab filter — same buckets the ledger summarises
+    from sellers.ledger import TABS, summary_for
+    if status_filter in TABS:
+        statuses, payout_triggered = TABS[status_filter]
+        orders_qs = orders_qs.filter(status__in=statuses)
+        if payout_triggered is not None:
+            orders_qs = orders_qs.filter(payout_triggered=payout_triggered)
+    # 'all' → no filter
+
+    # payout_eta / hours_remaining are computed lazily on the Order itself
+    orders = list(orders_qs[:100])
+    now    = timezone.now()
+
+    # Summary cards + tab counts from the pre-aggregated seller ledger
+    tab_counts, summary = summary_for(seller)
+
+    TAB_MAP = [
+        ('all',      'All Orders'),
+        ('pending',  'In Escrow'),
+        ('received', 'Buyer Confirmed'),
+        ('paid_out', 'Paid Out'),
+        ('failed',   'Payout Retrying'),
+        ('disputed', 'Disputed'),
+        ('refunded', 'Refunded'),
+    ]
+
+    return render(request, 'dashboard/transactions.html', {
+        'orders':        orders,
+        'status_filter': status_filter,
+        'tab_counts':    tab_counts,
+        'summary':       summary,
+        'now':           now,
+        'tab_map':       TAB_MAP,
+    })
@@ -0,0 +1,19 @@
+# sellers/views/helpers.py
+"""Small helpers shared by the view modules."""
+from django.utils import timezone
+
+
+# ─────────────────────────────────────────────
+# HELPERS
+# ─────────────────────────────────────────────
+def reset_weekly_analytics_if_needed(seller):
+    now = timezone.now()
+    if (now - seller.last_analytics_reset).days >= 7:
+        seller.weekly_page_views = 0
+        seller.weekly_whatsapp_clicks = 0
+        seller.last_analytics_reset = now
+        seller.save()
+
+
+def _store_url(seller):
+    return f'https://www.vendopage.com/{seller.slug}'
@@ -0,0 +1,212 @@
+# sellers/views/orders.py
+"""Buyer order pages (receipt, review, dispute) and the vendor order views."""
+import logging
+
+from django.contrib import messages
+from django.contrib.auth.decorators import login_required
+from django.shortcuts import get_object_or_404, redirect, render
+from django.utils import timezone
+from django.views.decorators.http import require_http_methods
+
+from sellers.models import Dispute, Order, Review
+from sellers.order_states import OrderStateMachine
+
+logger = logging.getLogger(__name__)
+
+
+# ─────────────────────────────────────────────
+# BUYER VIEWS
+# ─────────────────────────────────────────────
+def order_detail(request, order_ref):
+    order   = get_object_or_404(Order, order_ref=order_ref)
+    dispute = getattr(order, 'dispute', None)
+    review  = getattr(order, 'review', None)
+    return render(request, 'store/order_detail.html', {'order': order, 'dispute': dispute, 'review': review})
+
+
+@require_http_methods(["POST"])
+def confirm_receipt(request, order_ref):
+    order = get_object_or_404(Order, order_ref=order_ref)
+ 
+    if order.status not in ('shipped',):
+        messages.error(request, 'This order cannot be confirmed yet.')
+        return redirect('order_detail', order_ref=order_ref)
+ 
+    # Stamp the confirmation time — this is when the 24h T+1 buffer starts.
+    # Direct pay: no escrow, 'delivered' releases the payout immediately (hook).
+    # Escrow pay: RECEIVED — the daily cron at 2 AM will check if 24h have
+    # passed AND our Flutterwave balance is funded, then pays out.
+    # The seller gets paid the night AFTER the buyer confirms receipt.
+    target = 'delivered' if order.payment_type == 'direct' else 'RECEIVED'
+    if not OrderStateMachine.transition(order, target, source='confirm_receipt', delivered_at=timezone.now()):
+        messages.error(request, 'This order cannot be confirmed yet.')
+        return redirect('order_detail', order_ref=order_ref)
+ 
+    messages.success(
+        request,
+        '✅ Thank you for confirming! The seller will be paid within 24 hours.'
+    )
+    return redirect('order_detail', order_ref=order_ref)
+ 
+
+@require_http_methods(["GET", "POST"])
+def leave_review(request, order_ref):
+    from sellers.email import send_review_received_vendor
+
+    order = get_object_or_404(Order, order_ref=order_ref)
+    if order.status not in ('delivered', 'completed'):
+        messages.error(request, 'You can only review a completed order.')
+        return redirect('order_detail', order_ref=order_ref)
+    if hasattr(order, 'review'):
+        messages.info(request, 'You have already reviewed this order.')
+        return redirect('order_detail', order_ref=order_ref)
+    if request.method == 'POST':
+        try:
+            rating = int(request.POST.get('rating', 0))
+        except ValueError:
+            rating = 0
+        if rating < 1 or rating > 5:
+            messages.error(request, 'Please select a rating between 1 and 5.')
+            return render(request, 'store/leave_review.html', {'order': order})
+        comment = request.POST.get('comment', '').strip()
+        Review.objects.create(order=order, seller=order.seller, rating=rating, comment=comment)
+        try:
+            send_review_received_vendor(
+                to_email=order.seller.email,
+                business_name=order.seller.business_name,
+                order_ref=str(order.order_ref)[:8].upper(),
+                rating=rating, comment=comment,
+            )
+        except Exception as e:
+            logger.error(f"Review notification email failed: {e}")
+        messages.success(request, 'Thank you for your review!')
+        return redirect('order_detail', order_ref=order_ref)
+    return render(request, 'store/leave_review.html', {'order': order})
+
+
+# ─────────────────────────────────────────────
+# VENDOR ORDERS
+# ─────────────────────────────────────────────
+@login_required
+def vendor_orders(request):
+    seller        = request.user
+    status_filter = request.GET.get('status', '')
+    orders        = Order.objects.filter(seller=seller).order_by('-created_at')
+
+    if status_filter == 'completed':
+        orders = orders.filter(status__in=['delivered', 'completed'])
+    elif status_filter:
+        orders = orders.filter(status=status_filter)
+
+    counts = {
+        'all':       Order.objects.filter(seller=seller).count(),
+        'paid':      Order.objects.filter(seller=seller, status='paid').count(),
+        'shipped':   Order.objects.filter(seller=seller, status='shipped').count(),
+        'disputed':  Order.objects.filter(seller=seller, status='disputed').count(),
+        'completed': Order.objects.filter(seller=seller, status__in=['delivered', 'completed']).count(),
+    }
+    return render(request, 'dashboard/orders.html', {
+        'orders': orders[:50], 'counts': counts, 'status_filter': status_filter,
+    })
+
+
+@login_required
+def vendor_order_detail(request, order_ref):
+    order   = get_object_or_404(Order, order_ref=order_ref, seller=request.user)
+    dispute = getattr(order, 'dispute', None)
+    if request.method == 'POST' and dispute and request.POST.get('action') == 'reply_dispute':
+        reply    = request.POST.get('vendor_reply', '').strip()
+        evidence = request.POST.get('vendor_evidence', '').strip()
+        if reply:
+            dispute.vendor_reply    = reply
+            dispute.vendor_evidence = evidence
+            dispute.status          = 'vendor_replied'
+            dispute.save()
+            messages.success(request, 'Your response has been submitted.')
+        return redirect('vendor_order_detail', order_ref=order_ref)
+    return render(request, 'dashboard/order_detail.html', {'order': order, 'dispute': dispute})
+
+
+@login_required
+@require_http_methods(["GET", "POST"])
+def mark_shipped(request, order_ref):
+    order = get_object_or_404(Order, order_ref=order_ref, seller=request.user)
+    if order.status not in ('paid', 'disputed'):
+        messages.error(request, 'Only paid or disputed orders can be marked as shipped.')
+        return redirect('vendor_order_detail', order_ref=order_ref)
+    if request.method == 'POST':
+        tracking_info = request.POST.get('tracking_info', '').strip()
+        courier_name  = request.POST.get('courier_name', '').strip()
+        order.set_auto_release()
+        # The buyer's "shipped" email goes out from the transition hook
+        if not OrderStateMachine.transition(
+            order, 'shipped', source='vendor',
+            shipped_at=timezone.now(), tracking_info=tracking_info, courier_name=courier_name,
+            auto_release_at=order.auto_release_at,
+        ):
+            messages.error(request, 'This order changed in the meantime — please try again.')
+            return redirect('vendor_order_detail', order_ref=order_ref)
+        messages.success(request, '✓ Order marked as shipped. Buyer has been notified.')
+        return redirect('vendor_order_detail', order_ref=order_ref)
+    return render(request, 'dashboard/mark_shipped.html', {'order': order})
+
+
+# ── raise_dispute ─────────────────────────────────────────────────────────────
+# Sets is_disputed=True so the cron and auto-release both skip this order.
+
+@require_http_methods(["GET", "POST"])
+def raise_dispute(request, order_ref):
+    from sellers.email import send_dispute_opened
+
+    order = get_object_or_404(Order, order_ref=order_ref)
+
+    if hasattr(order, 'dispute'):
+        messages.info(request, 'A dispute already exists for this order.')
+        return redirect('order_detail', order_ref=order_ref)
+
+    if order.status not in ('shipped', 'paid'):
+        messages.error(request, 'You can only dispute an active order.')
+        return redirect('order_detail', order_ref=order_ref)
+
+    if order.payout_triggered:
+        messages.error(request, 'Payout has already been sent. Please contact support.')
+        return redirect('order_detail', order_ref=order_ref)
+
+    if request.method == 'POST':
+        reason        = request.POST.get('reason', 'other')
+        buyer_message = request.POST.get('message', '').strip()
+        evidence_url  = request.POST.get('evidence_url', '').strip()
+
+        if not buyer_message:
+            messages.error(request, 'Please describe the issue.')
+            return render(request, 'store/dispute.html', {'order': order})
+
+        # ── BRAKE: lock money until admin resolves ─────────────────────────
+        if not OrderStateMachine.transition(
+            order, 'disputed', source='buyer',
+            is_disputed=True, dispute_reason=f"{reason}: {buyer_message[:200]}",
+        ):
+            messages.error(request, 'You can only dispute an active order.')
+            return redirect('order_detail', order_ref=order_ref)
+
+        Dispute.objects.create(
+            order=order, raised_by='buyer', reason=reason,
+            buyer_message=buyer_message, buyer_evidence=evidence_url,
+        )
+
+        try:
+            send_dispute_opened(
+                vendor_email=order.seller.email,
+                buyer_email=order.buyer_email,
+                order_ref=str(order.order_ref)[:8].upper(),
+                reason=reason,
+                buyer_name=order.buyer_name,
+                order_url=f"https://www.vendopage.com/order/{order.order_ref}/",
+            )
+        except Exception as e:
+            logger.error(f"Dispute email failed: {e}")
+
+        messages.success(request, '✅ Dispute raised. Our team will review within 48 hours.')
+        return redirect('order_detail', order_ref=order_ref)
+
+    return render(request, 'store/dispute.html', {'order': order})
@@ -0,0 +1,184 @@
+# sellers/views/payouts.py
+"""Vendor payouts and escrow auto-release, shared by the views, admin and Celery tasks."""
+import logging
+
+from django.utils import timezone
+
+from sellers import ledger
+from sellers.models import Order, VendorBankAccount
+from sellers.order_states import OrderStateMachine
+
+logger = logging.getLogger(__name__)
+
+
+# ─────────────────────────────────────────────
+# BOOKKEEPING AFTER MONEY MOVED
+# ─────────────────────────────────────────────
+# Once Flutterwave has accepted a transfer or refund, its reference is written
+# first — guarded only on payout_triggered=False — and the status move is a
+# separate step. Neither may undo the money: a failure is logged as critical
+# for manual reconciliation, never raised and never turned into FAILED_PAYOUT.
+
+def _book(order, what, to_status, source, **fields):
+    ref_short = str(order.order_ref)[:8].upper()
+    try:
+        booked = ledger.update_order(order.pk, {'payout_triggered': False}, **fields)
+    except Exception as e:
+        logger.critical(f"[{what}] NOT RECORDED — order={ref_short} {fields}: {e}", exc_info=True)
+        return False
+    if booked is None:
+        logger.critical(f"[{what}] NOT RECORDED — order={ref_short} was already paid out; {fields}")
+        return False
+
+    for name, value in fields.items():
+        setattr(order, name, value)
+    order._ledger_state = order._current_ledger_state()
+
+    try:
+        moved = OrderStateMachine.transition(order, to_status, source=source)
+    except Exception as e:
+        logger.critical(f"[{what}] RECORDED, status not moved — order={ref_short} → {to_status}: {e}", exc_info=True)
+        return False
+    if not moved:
+        logger.critical(f"[{what}] RECORDED, status not moved — order={ref_short} → {to_status} lost a race")
+    return moved
+
+
+def record_payout(order, transfer_id, source):
+    """
+    Book a vendor transfer that went through and complete the order.
+    Returns True only if both the payout and the status change were written.
+    """
+    return _book(
+        order, 'PAYOUT', 'completed', source,
+        payout_triggered=True, payout_at=timezone.now(), flutterwave_transfer_id=transfer_id,
+    )
+
+
+def record_refund(order, refund_id, source):
+    """Book a buyer refund that went through and mark the order refunded."""
+    return _book(
+        order, 'REFUND', 'refunded', source,
+        is_disputed=False, refund_initiated_at=timezone.now(), refund_reference=refund_id,
+    )
+
+
+# ─────────────────────────────────────────────
+# PAYOUT
+# ─────────────────────────────────────────────
+def _trigger_payout(order):
+    from sellers.flutterwave import FlutterwavePayment
+    from sellers.email import send_payment_sent_vendor
+
+    logger.info(
+        f"[PAYOUT] START — order={str(order.order_ref)[:8].upper()} "
+        f"seller={order.seller.business_name} amount=₦{order.vendor_payout}"
+    )
+
+    if order.payout_triggered:
+        logger.info(f"[PAYOUT] SKIP — already triggered for {str(order.order_ref)[:8].upper()}")
+        return
+
+    try:
+        bank = order.seller.bank_account
+        logger.info(
+            f"[PAYOUT] BANK — name={bank.bank_name} code={bank.bank_code} "
+            f"acct=****{bank.account_number[-4:]} verified={bank.is_verified}"
+        )
+    except VendorBankAccount.DoesNotExist:
+        logger.error(
+            f"[PAYOUT] FAIL — no bank account for seller {order.seller.business_name} "
+            f"order={str(order.order_ref)[:8].upper()}"
+        )
+        return
+
+    if not bank.bank_code or not bank.bank_code.strip():
+        logger.error(
+            f"[PAYOUT] FAIL — bank_code empty for {order.seller.business_name}. "
+            f"Seller must re-save payout account."
+        )
+        return
+
+    flw    = FlutterwavePayment()
+    result = flw.transfer_to_vendor(order)
+    logger.info(f"[PAYOUT] FLW TRANSFER RESULT — {result}")
+
+    if result.get('status') == 'success':
+        if record_payout(order, str(result.get('data', {}).get('id', '')), source='payout'):
+            logger.info(
+                f"[PAYOUT] SUCCESS ✅ — order={str(order.order_ref)[:8].upper()} "
+                f"transfer_id={order.flutterwave_transfer_id} "
+                f"seller={order.seller.business_name}"
+            )
+        try:
+            send_payment_sent_vendor(
+                to_email=order.seller.email, business_name=order.seller.business_name,
+                amount=order.vendor_payout, currency=order.currency,
+                order_ref=str(order.order_ref)[:8].upper(),
+                bank_name=bank.bank_name, account_number=bank.account_number[-4:],
+            )
+        except Exception as e:
+            logger.error(f"[PAYOUT] Email failed (non-critical): {e}")
+    else:
+        logger.error(
+            f"[PAYOUT] FAIL ❌ — order={str(order.order_ref)[:8].upper()} "
+            f"seller={order.seller.business_name} "
+            f"response={result}"
+        )
+
+
+# ── auto_release_expired_orders ──────────────────────────────────────────────
+# Never auto-releases a disputed order — is_disputed=False filter added.
+# Set-based: each batch is two bulk transitions (escrow → RECEIVED, direct →
+# delivered); their hooks queue payouts and buyer emails once the batch commits.
+# No HTTP calls happen here, so the run time is bounded by the DB work alone.
+
+AUTO_RELEASE_BATCH_SIZE = 500
+
+
+def auto_release_expired_orders(batch_size=AUTO_RELEASE_BATCH_SIZE):
+    from django.db.models import F
+
+    now     = timezone.now()
+    expired = Order.objects.filter(
+        status='shipped',
+        auto_release_at__lte=now,
+        payout_triggered=False,
+        is_disputed=False,          # ← BRAKE: disputed orders are never auto-released
+    )
+    counts  = {'released': 0, 'escrow': 0, 'direct': 0, 'payouts_queued': 0, 'emails_queued': 0}
+
+    while True:
+        batch = list(expired.order_by('id').values_list('id', 'payment_type')[:batch_size])
+        if not batch:
+            break
+        direct_ids = [pk for pk, payment_type in batch if payment_type == 'direct']
+        escrow_ids = [pk for pk, payment_type in batch if payment_type != 'direct']
+
+        # Re-applying `expired` means an order disputed since the SELECT is left alone.
+        direct = OrderStateMachine.bulk_transition(
+            expired.filter(id__in=direct_ids), 'delivered', source='auto_release',
+            delivered_at=F('auto_release_at'),
+        )
+        escrow = OrderStateMachine.bulk_transition(
+            expired.filter(id__in=escrow_ids), 'RECEIVED', source='auto_release',
+            delivered_at=F('auto_release_at'),
+        )
+        released   = direct.order_ids + escrow.order_ids
+        payout_ids = direct.order_ids
+        email_ids  = released
+        if not released:
+            break
+
+        counts['released']       += len(released)
+        counts['direct']         += len(payout_ids)
+        counts['escrow']         += len(released) - len(payout_ids)
+        counts['payouts_queued'] += len(payout_ids)
+        counts['emails_queued']  += len(email_ids)
+
+    logger.info(
+        f"Auto-release: {counts['released']} released "
+        f"({counts['escrow']} escrow → RECEIVED, {counts['direct']} direct → delivered), "
+        f"{counts['payouts_queued']} payouts and {counts['emails_queued']} emails queued"
+    )
+    return counts
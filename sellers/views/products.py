@@ -0,0 +1,328 @@
+# sellers/views/products.py
+"""Vendor product upload, edits and status actions, plus WhatsApp click tracking."""
+import json
+import logging
+import traceback
+from decimal import Decimal, InvalidOperation
+
+from django.contrib.auth.decorators import login_required
+from django.db.models import Sum
+from django.http import JsonResponse
+from django.shortcuts import get_object_or_404, render
+from django.views.decorators.http import require_http_methods
+
+from products.models import Product, ProductImage
+from sellers.views.helpers import _store_url
+
+logger = logging.getLogger(__name__)
+
+
+# ─────────────────────────────────────────────
+# UPLOAD PRODUCT
+# ─────────────────────────────────────────────
+@require_http_methods(["GET", "POST"])
+def upload_product(request):
+    if request.method == 'GET':
+        return render(request, 'dashboard/upload.html')
+    try:
+        seller      = request.user
+        name        = request.POST.get('name', '').strip()
+        description = request.POST.get('description', '').strip()
+        price       = request.POST.get('price', '').strip()
+        image_urls  = request.POST.getlist('image_urls[]')
+
+        if not image_urls:
+            return JsonResponse({'success': False, 'error': 'No images provided'}, status=400)
+        if len(image_urls) > 10:
+            return JsonResponse({'success': False, 'error': 'Maximum 10 images per product'}, status=400)
+        for url in image_urls:
+            if not url.startswith('https://res.cloudinary.com/'):
+                return JsonResponse({'success': False, 'error': 'Invalid image URL'}, status=400)
+
+        price_value = None
+        if price:
+            try:
+                price_value = Decimal(price)
+                if price_value < 0:
+                    return JsonResponse({'success': False, 'error': 'Price cannot be negative'}, status=400)
+            except Exception:
+                return JsonResponse({'success': False, 'error': 'Invalid price format'}, status=400)
+
+        product = Product.objects.create(seller=seller, name=name, description=description, price=price_value)
+        for index, url in enumerate(image_urls):
+            ProductImage.objects.create(product=product, image_url=url, order=index)
+
+        return JsonResponse({'success': True, 'product_id': product.id, 'redirect_url': '/dashboard/'})
+
+    except Exception as e:
+        logger.error(f"Upload error: {str(e)}\n{traceback.format_exc()}")
+        return JsonResponse({'success': False, 'error': 'Failed to create product.'}, status=500)
+
+
+# ─────────────────────────────────────────────
+# PRODUCT ACTIONS
+# ─────────────────────────────────────────────
+@login_required
+@require_http_methods(["POST"])
+def archive_product(request, product_id):
+    product = get_object_or_404(Product, id=product_id, seller=request.user)
+    product.is_archived = True
+    product.save()
+    return JsonResponse({'success': True})
+
+
+@login_required
+@require_http_methods(["POST"])
+def reactivate_product(request, product_id):
+    product = get_object_or_404(Product, id=product_id, seller=request.user)
+    product.is_archived = False
+    product.is_sold_out = False
+    product.save()
+    return JsonResponse({'success': True})
+
+
+@login_required
+@require_http_methods(["POST"])
+def mark_sold_out(request, product_id):
+    product = get_object_or_404(Product, id=product_id, seller=request.user)
+    product.is_sold_out = True
+    product.save()
+    return JsonResponse({'success': True})
+
+
+@login_required
+@require_http_methods(["POST"])
+def mark_available(request, product_id):
+    product = get_object_or_404(Product, id=product_id, seller=request.user)
+    product.is_sold_out = False
+    product.save()
+    return JsonResponse({'success': True})
+
+
+@login_required
+@require_http_methods(["DELETE"])
+def delete_product(request, product_id):
+    product = get_object_or_404(Product, id=product_id, seller=request.user)
+    product.delete()
+    return JsonResponse({'success': True})
+
+
+@require_http_methods(["POST"])
+def track_whatsapp_click(request, product_id):
+    from sellers.email import send_first_whatsapp_click_email
+
+    try:
+        product = get_object_or_404(Product, id=product_id)
+        product.whatsapp_clicks += 1
+        product.views += 1
+        product.save(update_fields=['whatsapp_clicks', 'views'])
+
+        seller = product.seller
+        seller.weekly_whatsapp_clicks += 1
+        seller.save(update_fields=['weekly_whatsapp_clicks'])
+
+        total_clicks = Product.objects.filter(seller=seller).aggregate(
+            total=Sum('whatsapp_clicks')
+        )['total'] or 0
+        if total_clicks == 1:
+            try:
+                send_first_whatsapp_click_email(
+                    to_email=seller.email,
+                    business_name=seller.business_name,
+                    store_url=_store_url(seller),
+                )
+            except Exception as e:
+                logger.error(f"First WA click email failed: {e}")
+
+        return JsonResponse({'success': True})
+    except Exception:
+        return JsonResponse({'success': False}, status=400)
+
+
+# ─────────────────────────────────────────────
+# UPLOAD BATCH
+# ─────────────────────────────────────────────
+@require_http_methods(["POST"])
+def upload_products_batch(request):
+    from sellers.email import send_first_product_email
+
+    if not request.user.is_authenticated:
+        return JsonResponse({'success': False, 'error': 'Login required'}, status=401)
+
+    try:
+        products_data = json.loads(request.POST.get('products', '[]'))
+        if not products_data:
+            return JsonResponse({'success': False, 'error': 'No products provided'}, status=400)
+        if len(products_data) > 50:
+            return JsonResponse({'success': False, 'error': 'Maximum 50 products per batch'}, status=400)
+
+        is_first_upload = Product.objects.filter(seller=request.user).count() == 0
+        created         = []
+
+        for item in products_data:
+            valid_urls = [
+                url for url in item.get('image_urls', [])
+                if isinstance(url, str) and url.startswith('https://res.cloudinary.com/')
+            ]
+            if not valid_urls:
+                continue
+            price_value = None
+            raw_price   = str(item.get('price', '')).strip()
+            if raw_price:
+                try:
+                    price_value = Decimal(raw_price)
+                    if price_value < 0:
+                        price_value = None
+                except Exception:
+                    price_value = None
+
+            product = Product.objects.create(
+                seller=request.user,
+                name=str(item.get('name', '')).strip()[:80],
+                description=str(item.get('description', '')).strip(),
+                price=price_value,
+            )
+            for index, url in enumerate(valid_urls[:10]):
+                ProductImage.objects.create(product=product, image_url=url, order=index)
+            created.append(product.id)
+
+        if not created:
+            return JsonResponse({'success': False, 'error': 'No valid products to save'}, status=400)
+
+        if is_first_upload:
+            try:
+                send_first_product_email(
+                    to_email=request.user.email,
+                    business_name=request.user.business_name,
+                    store_url=_store_url(request.user),
+                )
+            except Exception as e:
+                logger.error(f"First product email failed: {e}")
+
+        return JsonResponse({'success': True, 'created': len(created), 'redirect_url': '/dashboard/'})
+
+    except json.JSONDecodeError:
+        return JsonResponse({'success': False, 'error': 'Invalid data format'}, status=400)
+    except Exception as e:
+        logger.error(f"Batch upload error: {str(e)}\n{traceback.format_exc()}")
+        return JsonResponse({'success': False, 'error': 'Failed to save. Please try again.'}, status=500)
+
+@require_http_methods(["GET"])
+def product_detail_api(request, product_id):
+    """
+    Returns product data as JSON so the edit drawer can pre-fill itself.
+    Seller-only — must own the product.
+    """
+    if not request.user.is_authenticated:
+        return JsonResponse({'success': False, 'error': 'Login required'}, status=401)
+
+    product = get_object_or_404(Product, id=product_id, seller=request.user)
+
+    images = list(
+        ProductImage.objects
+        .filter(product=product)
+        .order_by('order', 'created_at')
+        .values_list('image_url', flat=True)
+    )
+
+    return JsonResponse({
+        'success':     True,
+        'id':          product.id,
+        'name':        product.name or '',
+        'description': product.description or '',
+        'price':       str(product.price) if product.price else '',
+        'images':      images,
+    })
+
+
+@login_required
+@require_http_methods(["POST"])
+def product_edit_api(request, product_id):
+    """
+    Updates name, description, price, and images for a product.
+    Replaces all images with the new ordered list supplied.
+    Seller-only.
+    """
+    product = get_object_or_404(Product, id=product_id, seller=request.user)
+
+    try:
+        name        = request.POST.get('name', '').strip()[:80]
+        description = request.POST.get('description', '').strip()
+        price_raw   = request.POST.get('price', '').strip()
+        image_urls_json = request.POST.get('image_urls', '[]')
+
+        # ── Validate name ──────────────────────────────────────────────────
+        if not name:
+            return JsonResponse({'success': False, 'error': 'Product name is required'}, status=400)
+
+        # ── Validate price ─────────────────────────────────────────────────
+        price_value = None
+        if price_raw:
+            try:
+                price_value = Decimal(price_raw)
+                if price_value < 0:
+                    return JsonResponse({'success': False, 'error': 'Price cannot be negative'}, status=400)
+            except (InvalidOperation, ValueError):
+                return JsonResponse({'success': False, 'error': 'Invalid price format'}, status=400)
+
+        # ── Validate image URLs ────────────────────────────────────────────
+        try:
+            image_urls = json.loads(image_urls_json)
+        except json.JSONDecodeError:
+            return JsonResponse({'success': False, 'error': 'Invalid image data'}, status=400)
+
+        # Only accept Cloudinary URLs (same rule as upload)
+        valid_urls = [
+            url for url in image_urls
+            if isinstance(url, str) and url.startswith('https://res.cloudinary.com/')
+        ]
+
+        if len(valid_urls) > 10:
+            return JsonResponse({'success': False, 'error': 'Maximum 10 images per product'}, status=400)
+
+        # ── Save product fields ────────────────────────────────────────────
+        product.name        = name
+        product.description = description
+        product.price       = price_value
+        product.save(update_fields=['name', 'description', 'price'])
+
+        # ── Replace images only if a new list was provided ─────────────────
+        # If the seller didn't touch images, image_urls will still contain
+        # the original Cloudinary URLs and this just re-saves them in order.
+        if valid_urls:
+            ProductImage.objects.filter(product=product).delete()
+            for index, url in enumerate(valid_urls[:10]):
+                ProductImage.objects.create(product=product, image_url=url, order=index)
+
+        return JsonResponse({
+            'success': True,
+            'id':      product.id,
+        })
+
+    except Exception as e:
+        logger.error(f"Product edit error for id={product_id}: {str(e)}\n{traceback.format_exc()}")
+        return JsonResponse({'success': False, 'error': 'Failed to save changes.'}, status=500)
+
+
+@login_required
+def vendor_products(request):
+    seller = request.user
+    from django.db.models import Sum
+ 
+    active_products   = Product.objects.filter(seller=seller, is_archived=False, is_sold_out=False).prefetch_related('images')
+    sold_out_products = Product.objects.filter(seller=seller, is_archived=False, is_sold_out=True).prefetch_related('images')
+    archived_products = Product.objects.filter(seller=seller, is_archived=True).prefetch_related('images')
+    all_products      = Product.objects.filter(seller=seller).prefetch_related('images').order_by('-created_at')
+ 
+    total_product_views = Product.objects.filter(seller=seller).aggregate(
+        total=Sum('views')
+    )['total'] or 0
+ 
+    return render(request, 'dashboard/products.html', {
+        'products':           all_products,
+        'active_count':       active_products.count(),
+        'sold_out_count':     sold_out_products.count(),
+        'archived_count':     archived_products.count(),
+        'total_count':        all_products.count(),
+        'total_product_views': total_product_views,
+    })
@@ -0,0 +1,256 @@
+# sellers/views/public.py
+"""Marketing pages, sitemaps, the stores directory and the public seller page."""
+from django.db.models import Count, F, Q
+from django.http import HttpResponse
+from django.shortcuts import render
+from django.utils import timezone
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_http_methods
+
+from sellers import slugs
+from sellers.http_cache import public_page, seller_page_scopes
+from sellers.models import Review, Seller
+from sellers.slugs import get_active_seller_or_404
+
+
+# ─────────────────────────────────────────────
+# PUBLIC PAGES
+# ─────────────────────────────────────────────
+@public_page(['pages'])
+def about(request):
+    return render(request, 'about.html')
+
+def privacy(request):
+    return render(request, 'privacy.html')
+
+def terms(request):
+    return render(request, 'terms.html')
+
+def contact(request):
+    return render(request, 'contact.html')
+
+@public_page(['pages'])
+def faq(request):
+    return render(request, 'faq.html')
+
+@public_page(['sitemaps'])
+def sitemap_index(request):
+    from sellers.sitemaps import get_index
+    return HttpResponse(get_index(), content_type='application/xml')
+
+@public_page(['sitemaps'])
+def sitemap_section(request, section, page):
+    from django.http import Http404
+    from sellers.sitemaps import get_shard
+    xml = get_shard(section, page)
+    if xml is None:
+        raise Http404("No such sitemap")
+    return HttpResponse(xml, content_type='application/xml')
+
+@public_page(['pages'])
+def home(request):
+    """
+    Homepage — seller cards removed.
+    Only non-seller content (hero, how-it-works, etc.) is shown here.
+    """
+    return render(request, 'home.html', {})
+
+
+@public_page(['directory'])
+def sellers_directory(request):
+    """
+    /stores/ — dedicated sellers directory page.
+
+    Priority order:
+      1. Featured + Premium  (top of page, own section)
+      2. Premium only         (second section)
+      3. Everyone else        (alphabetical / product count)
+
+    Supports:
+      ?category=fashion       — filter by category slug
+      ?q=chioma               — search by business name
+    """
+    active_category = request.GET.get('category', '').strip().lower()
+    search_q        = request.GET.get('q', '').strip()
+
+    # Base queryset: active, non-staff sellers with at least 1 product
+    base_qs = Seller.objects.filter(
+        is_active=True, is_staff=False, is_superuser=False
+    ).annotate(
+        product_count=Count(
+            'products',
+            filter=Q(products__is_archived=False, products__is_sold_out=False)
+        )
+    ).filter(product_count__gte=1)
+
+    # Apply search
+    if search_q:
+        base_qs = base_qs.filter(
+            Q(business_name__icontains=search_q) |
+            Q(bio__icontains=search_q)
+        )
+
+    # Apply category filter
+    if active_category:
+        base_qs = base_qs.filter(category=active_category)
+
+    # ── Build category filter list with counts ──────────────────────────────
+    CATEGORY_MAP = {
+        'fashion':     'Fashion & Apparel',
+        'beauty':      'Beauty & Cosmetics',
+        'electronics': 'Electronics & Gadgets',
+        'food':        'Food & Beverages',
+        'home':        'Home & Garden',
+        'sports':      'Sports & Fitness',
+        'health':      'Health & Wellness',
+        'other':       'Other',
+    }
+
+    all_sellers_base = Seller.objects.filter(
+        is_active=True, is_staff=False, is_superuser=False
+    ).annotate(
+        product_count=Count(
+            'products',
+            filter=Q(products__is_archived=False, products__is_sold_out=False)
+        )
+    ).filter(product_count__gte=1)
+
+    categories = []
+    for slug, label in CATEGORY_MAP.items():
+        cnt = all_sellers_base.filter(category=slug).count()
+        if cnt > 0:
+            categories.append({'slug': slug, 'label': label, 'count': cnt})
+
+    # ── Priority sections (only on unfiltered all-sellers view) ─────────────
+    featured_sellers = []
+    premium_sellers  = []
+    regular_sellers  = []
+    sellers_to_show  = []   # used when category/search is active
+
+    total_count   = all_sellers_base.count()
+    premium_count = all_sellers_base.filter(
+        subscription_type='premium'
+    ).count()
+
+    now = timezone.now()
+
+    if not active_category and not search_q:
+        # Section 1 — Featured
+        featured_sellers = list(
+            base_qs.filter(is_featured=True).order_by('-product_count')[:8]
+        )
+        featured_ids = [s.id for s in featured_sellers]
+
+        # Section 2 — Premium (non-featured, active subscription)
+        premium_sellers = list(
+            base_qs.filter(
+                subscription_type='premium'
+            ).filter(
+                Q(subscription_expires__isnull=True) |
+                Q(subscription_expires__gt=now)
+            ).exclude(
+                id__in=featured_ids
+            ).order_by('-product_count')[:20]
+        )
+        premium_ids = [s.id for s in premium_sellers]
+
+        # Section 3 — Everyone else
+        regular_sellers = list(
+            base_qs.exclude(
+                id__in=featured_ids + premium_ids
+            ).order_by('-product_count')[:60]
+        )
+
+        # `sellers` = combined for template length check
+        sellers = featured_sellers + premium_sellers + regular_sellers
+
+    else:
+        # Filtered view — premium + featured float to top, then by product count
+        from django.db.models import Case, When, IntegerField
+        sellers_to_show = list(
+            base_qs.annotate(
+                priority=Case(
+                    When(is_featured=True, subscription_type='premium', then=0),
+                    When(is_featured=True,                              then=1),
+                    When(subscription_type='premium',                   then=2),
+                    default=3,
+                    output_field=IntegerField(),
+                )
+            ).order_by('priority', '-product_count')[:80]
+        )
+        sellers = sellers_to_show
+
+    # Active category label (for breadcrumb text)
+    active_category_label = CATEGORY_MAP.get(active_category, '') if active_category else ''
+
+    return render(request, 'sellers_directory.html', {
+        'sellers':               sellers,
+        'featured_sellers':      featured_sellers,
+        'premium_sellers':       premium_sellers,
+        'regular_sellers':       regular_sellers,
+        'sellers_to_show':       sellers_to_show,
+        'categories':            categories,
+        'active_category':       active_category,
+        'active_category_label': active_category_label,
+        'search_q':              search_q,
+        'total_count':           total_count,
+        'premium_count':         premium_count,
+        'category_count':        len(categories),
+    })
+
+
+@public_page(seller_page_scopes)
+def seller_page(request, slug):
+    """
+    The public store. Edge-cacheable for anonymous visitors, so the page
+    view is counted by the track_page_view beacon the page sends, not here.
+    """
+    from django.db.models import Avg
+
+    seller = get_active_seller_or_404(slug)
+
+    # Through the reverse relation so every product already has .seller set
+    products = seller.products.filter(
+        is_archived=False,
+    ).prefetch_related('images').order_by('-created_at')
+
+    # ── Reviews ──────────────────────────────────────────────
+    reviews  = Review.objects.filter(seller=seller).select_related('order')
+    total    = reviews.count()
+    avg_raw  = reviews.aggregate(avg=Avg('rating'))['avg'] or 0
+
+    breakdown = []
+    for star in [5, 4, 3, 2, 1]:
+        cnt = reviews.filter(rating=star).count()
+        pct = round(cnt / total * 100) if total else 0
+        breakdown.append({'star': star, 'count': cnt, 'pct': pct})
+    # ─────────────────────────────────────────────────────────
+
+    from sellers.presence import last_seen_for
+    seller.last_seen = last_seen_for(seller)
+
+    return render(request, 'seller_page.html', {
+        'seller':           seller,
+        'products':         products,
+        'is_owner':         request.user.is_authenticated and request.user.id == seller.id,
+        'reviews':          reviews,
+        'avg_rating':       round(avg_raw, 1),
+        'avg_rating_int':   round(avg_raw),
+        'total_reviews':    total,
+        'rating_breakdown': breakdown,
+    })
+
+
+@csrf_exempt
+@require_http_methods(["POST"])
+def track_page_view(request, slug):
+    """Beacon sent by the store page on load — the owner's own visits are not counted."""
+    seller_id = slugs.resolve(slug)
+    if seller_id is None:
+        return HttpResponse(status=404)
+    if not (request.user.is_authenticated and request.user.id == seller_id):
+        Seller.objects.filter(pk=seller_id).update(
+            total_page_views=F('total_page_views') + 1,
+            weekly_page_views=F('weekly_page_views') + 1,
+        )
+    return HttpResponse(status=204)
@@ -0,0 +1,627 @@
+# sellers/views/staff.py
+"""The staff admin dashboard: sellers, products, orders, disputes, payouts and settings."""
+import logging
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from django.contrib import messages
+from django.contrib.admin.views.decorators import staff_member_required
+from django.db.models import Count, Q, Sum
+from django.shortcuts import get_object_or_404, redirect, render
+from django.utils import timezone
+from django.views.decorators.http import require_http_methods
+
+from products.models import Product
+from sellers.models import Dispute, Order, PlatformSettings, Review, Seller, VendorBankAccount
+from sellers.order_states import OrderStateMachine
+from sellers.pagination import paginate
+from sellers.views.payouts import _trigger_payout, auto_release_expired_orders, record_refund
+
+logger = logging.getLogger(__name__)
+
+
+# ─────────────────────────────────────────────
+# ADMIN VIEWS
+# ─────────────────────────────────────────────
+@staff_member_required
+def admin_dashboard(request):
+    from sellers.snapshots import latest_snapshot
+    snapshot             = latest_snapshot()
+    platform             = PlatformSettings.get()
+    recent_sellers       = Seller.objects.filter(is_active=True, is_staff=False, is_superuser=False).annotate(
+        product_count=Count('products')
+    ).order_by('-created_at')[:8]
+    top_sellers_by_views = Seller.objects.filter(is_active=True, is_staff=False, is_superuser=False).order_by('-weekly_page_views')[:10]
+    return render(request, 'admin_dashboard/dashboard.html', {
+        'snapshot': snapshot,
+        'total_sellers': snapshot.total_sellers, 'total_products': snapshot.total_products,
+        'total_page_views': snapshot.total_page_views, 'premium_count': snapshot.premium_sellers,
+        'new_sellers_7d': snapshot.new_sellers_7d, 'new_sellers_30d': snapshot.new_sellers_30d,
+        'new_products_7d': snapshot.new_products_7d, 'recent_sellers': recent_sellers,
+        'top_sellers_by_views': top_sellers_by_views, 'subscription_stats': snapshot.subscription_stats,
+        'monthly_revenue': snapshot.premium_sellers * platform.premium_monthly_price,
+        'open_disputes': snapshot.open_disputes, 'pending_payouts': snapshot.pending_payouts,
+    })
+
+
+@staff_member_required
+def admin_sellers(request):
+    from sellers.exports import filter_sellers
+    sellers             = Seller.objects.filter(is_staff=False, is_superuser=False).annotate(
+        product_count=Count('products', filter=Q(products__is_archived=False))
+    ).order_by('-created_at')
+    sellers             = filter_sellers(sellers, request.GET)
+    open_disputes_count   = Dispute.objects.filter(status__in=['open', 'vendor_replied', 'under_review']).count()
+    pending_payouts_count = Order.objects.filter(payout_triggered=False, status__in=['delivered', 'completed']).count()
+    page                  = paginate(request, sellers)
+    return render(request, 'admin_dashboard/sellers.html', {
+        'sellers': page, 'page': page, 'open_disputes_count': open_disputes_count,
+        'pending_payouts_count': pending_payouts_count,
+    })
+
+
+@staff_member_required
+def admin_seller_detail(request, seller_id):
+    from sellers.email import send_premium_upgrade_email
+
+    seller        = get_object_or_404(Seller, id=seller_id)
+    products      = Product.objects.filter(seller=seller).prefetch_related('images').order_by('-created_at')
+    total_revenue = Order.objects.filter(
+        seller=seller, status__in=['delivered', 'completed'], payout_triggered=True,
+    ).aggregate(t=Sum('vendor_payout'))['t'] or Decimal('0')
+    orders_count  = Order.objects.filter(
+        seller=seller, status__in=['paid', 'shipped', 'delivered', 'completed', 'disputed']
+    ).count()
+    orders = Order.objects.filter(seller=seller).order_by('-created_at')[:8]
+    if not seller.slug:
+        seller.save()
+
+    if request.method == 'POST':
+        action = request.POST.get('action')
+
+        if action == 'change_subscription':
+            new_type = request.POST.get('subscription_type')
+            expires  = request.POST.get('subscription_expires', '').strip()
+            seller.subscription_type = new_type
+            if expires:
+                try:
+                    seller.subscription_expires = datetime.strptime(expires, '%Y-%m-%d').replace(
+                        tzinfo=timezone.get_current_timezone()
+                    )
+                except ValueError:
+                    pass
+            elif new_type == 'premium' and not seller.subscription_expires:
+                seller.subscription_expires = timezone.now() + timedelta(days=30)
+            seller.save()
+            if new_type == 'premium':
+                try:
+                    send_premium_upgrade_email(
+                        to_email=seller.email, business_name=seller.business_name,
+                        expires_date=seller.subscription_expires.strftime('%B %d, %Y'),
+                    )
+                except Exception as e:
+                    logger.error(f"Admin premium upgrade email failed: {e}")
+            messages.success(request, f'Subscription updated to {new_type}.')
+
+        elif action == 'toggle_featured':
+            seller.is_featured = not seller.is_featured
+            seller.save(update_fields=['is_featured'])
+            messages.success(request, f'{"Featured ⭐" if seller.is_featured else "Removed from featured"}.')
+
+        elif action == 'toggle_store_mode':
+            seller.store_mode = not seller.store_mode
+            if seller.store_mode and not seller.store_mode_enabled_at:
+                seller.store_mode_enabled_at = timezone.now()
+            seller.save(update_fields=['store_mode', 'store_mode_enabled_at'])
+            messages.success(request, f'Store Mode {"enabled" if seller.store_mode else "disabled"}.')
+
+        elif action == 'deactivate':
+            seller.is_active = False
+            seller.save(update_fields=['is_active'])
+            messages.warning(request, f'{seller.business_name} has been banned.')
+
+        elif action == 'activate':
+            seller.is_active = True
+            seller.save(update_fields=['is_active'])
+            messages.success(request, f'{seller.business_name} account restored.')
+
+        elif action == 'reset_analytics':
+            seller.weekly_page_views      = 0
+            seller.weekly_whatsapp_clicks = 0
+            seller.last_analytics_reset   = timezone.now()
+            seller.save(update_fields=['weekly_page_views', 'weekly_whatsapp_clicks', 'last_analytics_reset'])
+            messages.success(request, 'Weekly analytics reset.')
+
+        elif action == 'verify_bank':
+            try:
+                seller.bank_account.is_verified = True
+                seller.bank_account.save(update_fields=['is_verified'])
+                messages.success(request, '✅ Bank account verified.')
+            except VendorBankAccount.DoesNotExist:
+                messages.error(request, 'No bank account found.')
+
+        elif action == 'unverify_bank':
+            try:
+                seller.bank_account.is_verified = False
+                seller.bank_account.save(update_fields=['is_verified'])
+                messages.warning(request, '⚠️ Bank account marked unverified.')
+            except VendorBankAccount.DoesNotExist:
+                messages.error(request, 'No bank account found.')
+
+        return redirect('admin_seller_detail', seller_id=seller_id)
+
+    open_disputes_count   = Dispute.objects.filter(status__in=['open', 'vendor_replied', 'under_review']).count()
+    pending_payouts_count = Order.objects.filter(payout_triggered=False, status__in=['delivered', 'completed']).count()
+    return render(request, 'admin_dashboard/seller_detail.html', {
+        'seller': seller, 'products': products, 'total_revenue': total_revenue,
+        'orders_count': orders_count, 'orders': orders,
+        'open_disputes_count': open_disputes_count, 'pending_payouts_count': pending_payouts_count,
+    })
+
+
+@staff_member_required
+def admin_products(request):
+    products = Product.objects.select_related('seller').prefetch_related('images').order_by('-created_at')
+    status   = request.GET.get('status')
+    search   = request.GET.get('search', '').strip()
+    if status == 'sold_out':
+        products = products.filter(is_sold_out=True)
+    elif status == 'archived':
+        products = products.filter(is_archived=True)
+    elif status == 'active':
+        products = products.filter(is_archived=False, is_sold_out=False)
+    if search:
+        products = products.filter(
+            Q(description__icontains=search) | Q(seller__business_name__icontains=search)
+        )
+    open_disputes_count   = Dispute.objects.filter(status__in=['open', 'vendor_replied', 'under_review']).count()
+    pending_payouts_count = Order.objects.filter(payout_triggered=False, status__in=['delivered', 'completed']).count()
+    page                  = paginate(request, products)
+    return render(request, 'admin_dashboard/products.html', {
+        'products': page, 'page': page, 'open_disputes_count': open_disputes_count,
+        'pending_payouts_count': pending_payouts_count,
+    })
+
+
+@staff_member_required
+def admin_analytics(request):
+    from sellers.snapshots import daily_history, latest_snapshot
+    period   = request.GET.get('period', '7')
+    days     = {'7': 7, '30': 30, '90': 90}.get(period, 7)
+    snapshot = latest_snapshot()
+    platform = PlatformSettings.get()
+    history  = daily_history(days)
+    peak     = {
+        'sellers':  max((row.sellers_joined for row in history), default=0),
+        'gmv':      max((row.gmv for row in history), default=0),
+        'fees':     max((row.fees for row in history), default=0),
+        'disputes': max((row.disputes_opened for row in history), default=0),
+    }
+    return render(request, 'admin_dashboard/analytics.html', {
+        'snapshot': snapshot, 'period': str(days), 'history': history, 'peak': peak,
+        'period_gmv':  sum((row.gmv for row in history), Decimal('0')),
+        'period_fees': sum((row.fees for row in history), Decimal('0')),
+        'new_sellers_7d':   snapshot.new_sellers_7d,
+        'new_sellers_30d':  snapshot.new_sellers_30d,
+        'new_products_7d':  snapshot.new_products_7d,
+        'new_products_30d': snapshot.new_products_30d,
+        'category_stats':   snapshot.category_stats,
+        'premium_count': snapshot.premium_sellers, 'total_sellers': snapshot.total_sellers,
+        'monthly_revenue': snapshot.premium_sellers * platform.premium_monthly_price,
+    })
+
+
+@staff_member_required
+def admin_disputes(request):
+    disputes              = Dispute.objects.select_related('order', 'order__seller').order_by('-created_at')
+    status_filter         = request.GET.get('status', '')
+    if status_filter:
+        disputes = disputes.filter(status=status_filter)
+    open_count            = Dispute.objects.filter(status='open').count()
+    open_disputes_count   = Dispute.objects.filter(status__in=['open', 'vendor_replied', 'under_review']).count()
+    pending_payouts_count = Order.objects.filter(payout_triggered=False, status__in=['delivered', 'completed']).count()
+    page                  = paginate(request, disputes)
+    return render(request, 'admin_dashboard/disputes.html', {
+        'disputes': page, 'page': page, 'status_filter': status_filter, 'open_count': open_count,
+        'open_disputes_count': open_disputes_count, 'pending_payouts_count': pending_payouts_count,
+    })
+
+
+@staff_member_required
+@require_http_methods(["POST"])
+def resolve_dispute(request, dispute_id):
+    from sellers.flutterwave import FlutterwavePayment
+    from sellers.email import send_dispute_resolved_buyer, send_dispute_resolved_vendor
+
+    dispute = get_object_or_404(Dispute, id=dispute_id)
+    order   = dispute.order
+    action  = request.POST.get('action')
+    note    = request.POST.get('admin_note', '').strip()
+
+    dispute.admin_note  = note
+    dispute.resolved_at = timezone.now()
+
+    # ── PATH 1: Refund Buyer ──────────────────────────────────────────────────
+    if action == 'refund_buyer':
+        if order.payout_triggered:
+            messages.error(request, 'Cannot refund — payout already sent to seller.')
+            return redirect('admin_disputes')
+        if order.status == 'refunded':
+            messages.warning(request, 'Order is already refunded.')
+            return redirect('admin_disputes')
+        if not OrderStateMachine.can_transition(order.status, 'refunded'):
+            messages.warning(request, f'Cannot refund — order is {order.get_status_display()}.')
+            return redirect('admin_disputes')
+
+        # Call Flutterwave Refund API
+        flw_refund_success = False
+        flw_refund_id      = ''
+        try:
+            flw           = FlutterwavePayment()
+            refund_result = flw.refund_payment(
+                transaction_id=order.flutterwave_tx_id,
+                amount=order.subtotal,      # full refund — buyer gets everything back
+            )
+            logger.info(
+                f"FLW REFUND RESULT for order {str(order.order_ref)[:8].upper()}: "
+                f"{refund_result}"
+            )
+            if refund_result.get('status') == 'success':
+                flw_refund_success = True
+                flw_refund_id      = str(refund_result.get('data', {}).get('id', ''))
+            else:
+                logger.error(
+                    f"FLW refund API non-success for order "
+                    f"{str(order.order_ref)[:8].upper()}: {refund_result}"
+                )
+        except Exception as e:
+            logger.error(
+                f"FLW refund API exception for order "
+                f"{str(order.order_ref)[:8].upper()}: {e}"
+            )
+
+        # Update order — admin has decided, we mark it regardless of API success
+        # If API failed, admin will see a warning and can do it manually on FLW dashboard
+        if flw_refund_success:
+            record_refund(order, flw_refund_id, source='dispute')   # also lifts the brake
+        elif not OrderStateMachine.transition(
+            order, 'refunded', source='dispute',
+            is_disputed=False, refund_initiated_at=timezone.now(),   # lift the brake
+        ):
+            messages.warning(
+                request,
+                f'⚠️ Order #{str(order.order_ref)[:8].upper()} changed while resolving — '
+                f'nothing was refunded. Reload and try again.'
+            )
+            return redirect('admin_disputes')
+
+        dispute.status = 'resolved_buyer'
+        dispute.save()
+
+        try:
+            send_dispute_resolved_buyer(
+                to_email=order.buyer_email, buyer_name=order.buyer_name,
+                order_ref=str(order.order_ref)[:8].upper(), admin_note=note,
+            )
+        except Exception as e:
+            logger.error(f"Dispute resolved buyer email failed: {e}")
+
+        if flw_refund_success:
+            messages.success(
+                request,
+                f'✅ Refund initiated via Flutterwave for order '
+                f'#{str(order.order_ref)[:8].upper()}. '
+                f'Refund ID: {flw_refund_id}. '
+                f'Buyer will receive funds in 3–5 business days.'
+            )
+        else:
+            messages.warning(
+                request,
+                f'⚠️ Dispute resolved in buyer\'s favour but Flutterwave API refund FAILED. '
+                f'Order #{str(order.order_ref)[:8].upper()} is marked as refunded — '
+                f'you must issue this refund MANUALLY via Flutterwave dashboard → Transactions. '
+                f'Check server logs for details.'
+            )
+
+    # ── PATH 2: Pay Vendor ────────────────────────────────────────────────────
+    elif action == 'pay_vendor':
+        # Already released but the transfer failed — re-clicking retries the payout
+        retry = order.status in ('delivered', 'RECEIVED', 'FAILED_PAYOUT') and not order.payout_triggered
+        if not retry and not OrderStateMachine.can_transition(order.status, 'delivered'):
+            messages.warning(
+                request,
+                f'Cannot pay vendor — order is {order.get_status_display()}'
+                f'{" and already paid out" if order.payout_triggered else ""}.'
+            )
+            return redirect('admin_disputes')
+
+        if retry:
+            _trigger_payout(order)
+        # Lift the brake in the same UPDATE; the 'delivered' hook runs the payout
+        elif not OrderStateMachine.transition(order, 'delivered', source='dispute', is_disputed=False):
+            messages.warning(
+                request,
+                f'⚠️ Order #{str(order.order_ref)[:8].upper()} changed while resolving — '
+                f'no payout was triggered. Reload and try again.'
+            )
+            return redirect('admin_disputes')
+
+        dispute.status = 'resolved_vendor'
+        dispute.save()
+
+        try:
+            send_dispute_resolved_vendor(
+                to_email=order.seller.email,
+                business_name=order.seller.business_name,
+                order_ref=str(order.order_ref)[:8].upper(),
+                admin_note=note,
+            )
+        except Exception as e:
+            logger.error(f"Dispute resolved vendor email failed: {e}")
+
+        # Re-fetch to check if _trigger_payout actually succeeded
+        order.refresh_from_db()
+        if order.payout_triggered:
+            messages.success(
+                request,
+                f'✅ Dispute resolved in seller\'s favour — '
+                f'payment released to {order.seller.business_name}.'
+            )
+        else:
+            messages.warning(
+                request,
+                f'⚠️ Dispute resolved for seller but payout transfer FAILED. '
+                f'Check server logs — you may need to trigger manually.'
+            )
+
+    # ── PATH 3: Mark Under Review (brake stays ON) ────────────────────────────
+    elif action == 'under_review':
+        # is_disputed stays True — money remains locked
+        dispute.status = 'under_review'
+        dispute.save()
+        messages.info(request, 'Dispute marked as under review. Funds remain locked.')
+
+    else:
+        messages.error(request, 'Invalid action.')
+
+    return redirect('admin_disputes')
+
+
+@staff_member_required
+def admin_orders(request):
+    from sellers.exports import filter_orders
+    orders        = Order.objects.select_related('seller').prefetch_related('items').order_by('-created_at')
+    status_filter = request.GET.get('status', '')
+    orders        = filter_orders(orders, request.GET)
+    open_disputes_count   = Dispute.objects.filter(status__in=['open', 'vendor_replied', 'under_review']).count()
+    pending_payouts_count = Order.objects.filter(payout_triggered=False, status__in=['delivered', 'completed']).count()
+    page                  = paginate(request, orders)
+    return render(request, 'admin_dashboard/orders.html', {
+        'orders': page, 'page': page, 'status_filter': status_filter,
+        'open_disputes_count': open_disputes_count, 'pending_payouts_count': pending_payouts_count,
+    })
+
+
+@staff_member_required
+def admin_payouts(request):
+    pending_orders        = Order.objects.filter(
+        payout_triggered=False, status__in=['delivered', 'completed']
+    ).select_related('seller', 'seller__bank_account').order_by('delivered_at')
+    recent_payouts        = Order.objects.filter(payout_triggered=True).select_related('seller').order_by('-payout_at')[:20]
+    total_pending_amount  = pending_orders.aggregate(t=Sum('vendor_payout'))['t'] or Decimal('0')
+    pending_payouts_count = pending_orders.count()
+    open_disputes_count   = Dispute.objects.filter(status__in=['open', 'vendor_replied', 'under_review']).count()
+    return render(request, 'admin_dashboard/payouts.html', {
+        'pending_orders': pending_orders, 'recent_payouts': recent_payouts,
+        'total_pending_amount': total_pending_amount,
+        'pending_payouts_count': pending_payouts_count, 'open_disputes_count': open_disputes_count,
+    })
+
+
+@staff_member_required
+def admin_export(request, dataset):
+    """
+    Streams a full CSV/JSONL export of orders, payouts or sellers.
+    Accepts the same filters as the matching list view, plus ?format=csv|jsonl.
+    Under ASGI the rows come from an async generator, so they are not buffered.
+    """
+    from django.core.handlers.asgi import ASGIRequest
+    from django.http import Http404, StreamingHttpResponse
+    from sellers.exports import CONTENT_TYPES, DATASETS, FORMATS, astream_export, stream_export
+    if dataset not in DATASETS:
+        raise Http404
+    fmt      = request.GET.get('format', 'csv')
+    fmt      = fmt if fmt in FORMATS else 'csv'
+    filename = f"vendopage-{dataset}-{timezone.localdate():%Y%m%d}.{fmt}"
+    stream   = astream_export if isinstance(request, ASGIRequest) else stream_export
+    response = StreamingHttpResponse(stream(dataset, request.GET, fmt), content_type=CONTENT_TYPES[fmt])
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    logger.info(f"Admin export: {dataset} ({fmt}) by {request.user.username} — {request.GET.urlencode()}")
+    return response
+
+
+@staff_member_required
+@require_http_methods(["POST"])
+def admin_mark_delivered(request, order_id):
+    order = get_object_or_404(Order, id=order_id)
+    if order.status not in ('shipped', 'paid'):
+        messages.error(request, 'Only shipped or paid orders can be marked delivered.')
+        return redirect(request.META.get('HTTP_REFERER', 'admin_orders'))
+    # The 'delivered' hook triggers the payout
+    OrderStateMachine.transition(order, 'delivered', source='admin', delivered_at=timezone.now())
+    messages.success(request, f'Order #{str(order.order_ref)[:8].upper()} marked as delivered. Payout triggered.')
+    return redirect(request.META.get('HTTP_REFERER', 'admin_orders'))
+
+
+@staff_member_required
+@require_http_methods(["POST"])
+def admin_mark_refunded(request, order_id):
+    order = get_object_or_404(Order, id=order_id)
+    if order.status == 'refunded':
+        messages.info(request, 'Order is already refunded.')
+        return redirect(request.META.get('HTTP_REFERER', 'admin_orders'))
+    OrderStateMachine.transition(order, 'refunded', source='admin')
+    messages.success(request, f'Order #{str(order.order_ref)[:8].upper()} marked as refunded.')
+    return redirect(request.META.get('HTTP_REFERER', 'admin_orders'))
+
+
+@staff_member_required
+@require_http_methods(["POST"])
+def admin_product_action(request, product_id):
+    product = get_object_or_404(Product, id=product_id)
+    action  = request.POST.get('action', '')
+    if action == 'archive':
+        product.is_archived = True
+        product.save(update_fields=['is_archived'])
+        messages.success(request, 'Product archived.')
+    elif action == 'restore':
+        product.is_archived = False
+        product.is_sold_out = False
+        product.save(update_fields=['is_archived', 'is_sold_out'])
+        messages.success(request, 'Product restored.')
+    elif action == 'sold_out':
+        product.is_sold_out = True
+        product.save(update_fields=['is_sold_out'])
+        messages.success(request, 'Product marked as sold out.')
+    elif action == 'available':
+        product.is_sold_out = False
+        product.save(update_fields=['is_sold_out'])
+        messages.success(request, 'Product marked as available.')
+    else:
+        messages.error(request, 'Unknown action.')
+    return redirect(request.META.get('HTTP_REFERER', 'admin_products'))
+
+
+@staff_member_required
+def admin_reviews(request):
+    reviews         = Review.objects.select_related('order', 'seller').order_by('-created_at')
+    rating_filter   = request.GET.get('rating', '')
+    verified_filter = request.GET.get('verified', '')
+    if rating_filter:
+        reviews = reviews.filter(rating=int(rating_filter))
+    if verified_filter == '1':
+        reviews = reviews.filter(is_verified=True)
+    elif verified_filter == '0':
+        reviews = reviews.filter(is_verified=False)
+    open_disputes_count   = Dispute.objects.filter(status__in=['open', 'vendor_replied', 'under_review']).count()
+    pending_payouts_count = Order.objects.filter(payout_triggered=False, status__in=['delivered', 'completed']).count()
+    page                  = paginate(request, reviews)
+    return render(request, 'admin_dashboard/reviews.html', {
+        'reviews': page, 'page': page, 'rating_filter': rating_filter,
+        'verified_filter': verified_filter,
+        'open_disputes_count': open_disputes_count, 'pending_payouts_count': pending_payouts_count,
+    })
+
+
+@staff_member_required
+@require_http_methods(["POST"])
+def admin_delete_review(request, review_id):
+    review      = get_object_or_404(Review, id=review_id)
+    seller_name = review.seller.business_name
+    review.delete()
+    messages.success(request, f'Review deleted from {seller_name}.')
+    return redirect('admin_reviews')
+
+
+@staff_member_required
+def admin_bank_accounts(request):
+    accounts        = VendorBankAccount.objects.select_related('seller').order_by('-created_at')
+    search          = request.GET.get('search', '').strip()
+    verified_filter = request.GET.get('verified', '')
+    if search:
+        accounts = accounts.filter(
+            Q(seller__business_name__icontains=search) | Q(account_name__icontains=search)
+            | Q(bank_name__icontains=search) | Q(account_number__icontains=search)
+        )
+    if verified_filter == '1':
+        accounts = accounts.filter(is_verified=True)
+    elif verified_filter == '0':
+        accounts = accounts.filter(is_verified=False)
+    unverified_count      = VendorBankAccount.objects.filter(is_verified=False).count()
+    open_disputes_count   = Dispute.objects.filter(status__in=['open', 'vendor_replied', 'under_review']).count()
+    pending_payouts_count = Order.objects.filter(payout_triggered=False, status__in=['delivered', 'completed']).count()
+    page                  = paginate(request, accounts)
+    return render(request, 'admin_dashboard/bank_accounts.html', {
+        'accounts': page, 'page': page, 'unverified_count': unverified_count,
+        'open_disputes_count': open_disputes_count, 'pending_payouts_count': pending_payouts_count,
+    })
+
+
+@staff_member_required
+@require_http_methods(["POST"])
+def admin_verify_bank_account(request, account_id):
+    account = get_object_or_404(VendorBankAccount, id=account_id)
+    action  = request.POST.get('action', 'verify')
+    if action == 'verify':
+        account.is_verified = True
+        account.save(update_fields=['is_verified'])
+        messages.success(request, f'✅ Account verified for {account.seller.business_name}.')
+    elif action == 'unverify':
+        account.is_verified = False
+        account.save(update_fields=['is_verified'])
+        messages.warning(request, f'⚠️ Account unverified for {account.seller.business_name}.')
+    return redirect(request.META.get('HTTP_REFERER', 'admin_bank_accounts'))
+
+
+@staff_member_required
+def admin_settings(request):
+    settings_obj = PlatformSettings.get()
+
+    if request.method == 'POST':
+        action = request.POST.get('action', '')
+
+        if action == 'update_fee':
+            raw = request.POST.get('transaction_fee_percent', '').strip()
+            try:
+                new_fee = Decimal(raw)
+                if new_fee < 0 or new_fee > 30:
+                    messages.error(request, 'Fee must be between 0% and 30%.')
+                else:
+                    settings_obj.transaction_fee_percent = new_fee
+                    settings_obj.save()
+                    messages.success(request, f'✅ Transaction fee updated to {new_fee}%.')
+            except Exception:
+                messages.error(request, 'Invalid fee value.')
+
+        elif action == 'update_premium_price':
+            raw = request.POST.get('premium_monthly_price', '').strip()
+            try:
+                new_price = Decimal(raw)
+                if new_price < 0:
+                    messages.error(request, 'Price cannot be negative.')
+                else:
+                    settings_obj.premium_monthly_price = new_price
+                    settings_obj.save()
+                    messages.success(request, f'✅ Premium price updated to ₦{new_price:,.0f}/month.')
+            except Exception:
+                messages.error(request, 'Invalid price value.')
+
+        elif action == 'reset_all_analytics':
+            updated = Seller.objects.filter(is_staff=False, is_superuser=False).update(
+                weekly_page_views=0, weekly_whatsapp_clicks=0,
+                last_analytics_reset=timezone.now()
+            )
+            messages.success(request, f'📊 Weekly analytics reset for {updated} seller(s).')
+
+        elif action == 'run_auto_release':
+            counts = auto_release_expired_orders()
+            messages.success(
+                request,
+                f"💸 Auto-release complete — {counts['released']} order(s) released, "
+                f"{counts['payouts_queued']} payout(s) queued."
+            )
+
+        else:
+            messages.error(request, 'Unknown action.')
+
+        return redirect('admin_settings')
+
+    premium_count         = Seller.objects.filter(subscription_type='premium', is_staff=False, is_superuser=False).count()
+    total_sellers         = Seller.objects.filter(is_active=True, is_staff=False, is_superuser=False).count()
+    open_disputes_count   = Dispute.objects.filter(status__in=['open', 'vendor_replied', 'under_review']).count()
+    pending_payouts_count = Order.objects.filter(payout_triggered=False, status__in=['delivered', 'completed']).count()
+    return render(request, 'admin_dashboard/settings.html', {
+        'settings': settings_obj, 'premium_count': premium_count, 'total_sellers': total_sellers,
+        'monthly_revenue': premium_count * settings_obj.premium_monthly_price,
+        'open_disputes_count': open_disputes_count, 'pending_payouts_count': pending_payouts_count,
+    })
@@ -0,0 +1,185 @@
+# sellers/views/subscription.py
+"""Subscription tiers, the Flutterwave upgrade flow and its webhook."""
+import json
+import logging
+import uuid
+from datetime import timedelta
+
+from asgiref.sync import sync_to_async
+from django.contrib import messages
+from django.contrib.auth.decorators import login_required
+from django.http import JsonResponse
+from django.shortcuts import redirect, render
+from django.utils import timezone
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_http_methods
+
+from sellers.models import Seller
+
+logger = logging.getLogger(__name__)
+
+
+# ─────────────────────────────────────────────
+# SUBSCRIPTION
+# ─────────────────────────────────────────────
+@login_required
+def subscription(request):
+    seller = request.user
+    tiers  = []
+    for key, cfg in Seller.TIER_CONFIG.items():
+        tiers.append({
+            'key':         key,
+            'label':       cfg['label'],
+            'price':       cfg['price'],
+            'fee_percent': cfg['fee_percent'],
+            'cap':         cfg['cap'],
+            'is_current':  seller.subscription_tier == key,
+        })
+
+    return render(request, 'dashboard/subscription.html', {
+        'tiers':                   tiers,
+        'current_tier':            seller.subscription_tier,
+        'monthly_volume':          seller.monthly_volume_processed,
+        'current_cap':             seller.get_tier_config()['cap'],
+        'current_fee_percent':     seller.get_commission_rate(),
+        'watermark_enabled':       seller.watermark_enabled,
+    })
+
+
+@login_required
+@require_http_methods(["POST"])
+def upgrade_subscription_tier(request):
+    """
+    Starts a Flutterwave payment to upgrade to 'growth' or 'pro'.
+    Downgrading to 'starter' is immediate (no payment needed).
+    """
+    from sellers.flutterwave import FlutterwavePayment
+
+    seller    = request.user
+    tier      = request.POST.get('tier', '').strip().lower()
+
+    if tier not in Seller.TIER_CONFIG:
+        messages.error(request, 'Invalid plan selected.')
+        return redirect('subscription')
+
+    # Downgrade to starter — instant, no payment
+    if tier == 'starter':
+        seller.subscription_tier = 'starter'
+        seller.save(update_fields=['subscription_tier'])
+        messages.success(request, 'You are now on the Starter plan.')
+        return redirect('subscription')
+
+    # Growth / Pro — charge via Flutterwave
+    config = Seller.TIER_CONFIG[tier]
+    amount = config['price']
+    tx_ref = f"VDP-TIER-{seller.id}-{uuid.uuid4().hex[:8]}"
+
+    flw          = FlutterwavePayment()
+    redirect_url = 'https://www.vendopage.com/payment/verify/'
+    result       = flw.initialize_payment(
+        email=seller.email, amount=amount, tx_ref=tx_ref,
+        redirect_url=redirect_url, customer_name=seller.business_name,
+        title=f"VendoPage {config['label']} Plan",
+    )
+
+    if result.get('status') == 'success':
+        request.session['tx_ref']            = tx_ref
+        request.session['upgrading_to_tier'] = tier
+        return redirect(result['data']['link'])
+
+    messages.error(request, 'Payment initialization failed. Please try again.')
+    return redirect('subscription')
+
+
+# Keep old endpoint working in case anything still links to it —
+# routes to the same flow, defaulting to 'growth'.
+@login_required
+def upgrade_to_premium(request):
+    if request.method == 'POST':
+        request.POST = request.POST.copy()
+        request.POST['tier'] = request.POST.get('tier', 'growth')
+        return upgrade_subscription_tier(request)
+    return redirect('subscription')
+
+
+def _apply_tier_upgrade(seller, upgrading_tier):
+    from sellers.email import send_tier_upgrade_email
+
+    seller.subscription_tier = upgrading_tier
+    # Keep legacy fields in sync for templates that still check them
+    seller.subscription_type    = 'premium' if upgrading_tier != 'starter' else 'free'
+    seller.subscription_expires = timezone.now() + timedelta(days=30)
+    seller.save()
+
+    try:
+        tier_config = Seller.TIER_CONFIG[upgrading_tier]
+        send_tier_upgrade_email(
+            to_email=seller.email,
+            business_name=seller.business_name,
+            tier_label=tier_config['label'],
+            fee_percent=tier_config['fee_percent'],
+            cap=tier_config['cap'],
+            expires_date=seller.subscription_expires.strftime('%B %d, %Y'),
+        )
+    except Exception as e:
+        logger.error(f"Tier upgrade email failed: {e}")
+
+
+@login_required
+async def verify_payment(request):
+    from sellers.flutterwave_async import AsyncFlutterwavePayment
+
+    tx_ref         = request.GET.get('tx_ref')
+    transaction_id = request.GET.get('transaction_id')
+    status         = request.GET.get('status', '')
+
+    upgrading_tier = await request.session.aget('upgrading_to_tier')
+    if not upgrading_tier:
+        messages.error(request, 'Invalid payment session')
+        return redirect('subscription')
+
+    if status not in ('successful', 'completed'):
+        messages.error(request, 'Payment was not completed.')
+        return redirect('subscription')
+
+    flw    = AsyncFlutterwavePayment()
+    result = await flw.verify_payment(transaction_id)
+
+    if result.get('status') == 'success':
+        data = result.get('data', {})
+        if data.get('status') == 'successful' and data.get('tx_ref') == tx_ref:
+            seller = await request.auser()
+            await sync_to_async(_apply_tier_upgrade)(seller, upgrading_tier)
+
+            await request.session.apop('upgrading_to_tier', None)
+            await request.session.apop('tx_ref', None)
+
+            tier_label = Seller.TIER_CONFIG[upgrading_tier]['label']
+            messages.success(request, f'🎉 Welcome to the {tier_label} plan!')
+            return redirect('dashboard')
+
+    messages.error(request, 'Payment verification failed. Please contact support.')
+    return redirect('subscription')
+
+
+# ─────────────────────────────────────────────
+# FLUTTERWAVE WEBHOOKS
+# ─────────────────────────────────────────────
+@csrf_exempt
+@require_http_methods(["POST"])
+def flutterwave_webhook(request):
+    """Subscription payments webhook."""
+    from sellers.flutterwave import FlutterwavePayment
+
+    try:
+        signature = request.headers.get('verif-hash', '')
+        flw       = FlutterwavePayment()
+        payload   = request.body.decode('utf-8')
+        if not signature or not flw.verify_webhook_signature(signature, payload):
+            return JsonResponse({'status': 'error', 'message': 'Invalid signature'}, status=400)
+        data = json.loads(payload)
+        if data.get('event') == 'charge.completed' and data.get('data', {}).get('status') == 'successful':
+            return JsonResponse({'status': 'success'})
+        return JsonResponse({'status': 'received'})
+    except Exception as e:
+        return JsonResponse({'status': 'error', 'message': str(e)}, status=500)